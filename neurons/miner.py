@@ -20,13 +20,23 @@ import sys
 import os
 import asyncio
 import logging
+import time
+from pathlib import Path
+from typing import Tuple
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import bittensor as bt
-from rugintel.protocol import RugIntelSynapse
+from rugintel.protocol import (
+    RugIntelSynapse, RugIntelBatchSynapse, RugIntelStreamingSynapse,
+)
 from rugintel.intelligence import TwelveLayerFusion
+from rugintel.archive import SnapshotArchive
+from rugintel.verification import GroundTruthVerifier
+from rugintel.admission import AdmissionController, ResultCache
+from rugintel.metagraph import MetagraphSyncer
+from rugintel.discovery import RaydiumPoolDiscovery
 
 logger = logging.getLogger(__name__)
 
@@ -49,9 +59,14 @@ class RugIntelMiner:
         # Setup Bittensor components
         self.wallet = bt.wallet(config=self.config)
         self.subtensor = bt.subtensor(config=self.config)
-        self.metagraph = self.subtensor.metagraph(
-            netuid=self.config.netuid
+
+        # Metagraph + derived indexes, refreshed in the background
+        self.syncer = MetagraphSyncer(
+            subtensor=self.subtensor,
+            netuid=self.config.netuid,
+            interval=getattr(self.config, 'metagraph_sync_interval', 60),
         )
+        self.syncer.sync_once()
 
         # Initialize Axon (endpoint that validators query)
         self.axon = bt.axon(
@@ -59,15 +74,61 @@ class RugIntelMiner:
             config=self.config,
         )
 
-        # Attach synapse handler
+        # Attach synapse handlers (single-token, batch and streaming)
         self.axon.attach(
             forward_fn=self.forward,
             blacklist_fn=self.blacklist,
+            priority_fn=self.priority,
+        )
+        self.axon.attach(
+            forward_fn=self.forward_batch,
+            blacklist_fn=self.blacklist_batch,
+            priority_fn=self.priority_batch,
+        )
+        self.axon.attach(
+            forward_fn=self.forward_stream,
+            blacklist_fn=self.blacklist_stream,
+            priority_fn=self.priority_stream,
         )
 
         # Initialize the 12-layer analysis engine
         self.fusion_engine = TwelveLayerFusion()
 
+        # Bound concurrent analyses; overflow is answered in degraded mode
+        self.admission = AdmissionController(
+            max_concurrent=getattr(self.config, 'max_concurrent', 8),
+            max_queued=getattr(self.config, 'max_queued', 32),
+            queue_timeout=getattr(self.config, 'queue_timeout', 10.0),
+        )
+        self.result_cache = ResultCache(
+            ttl_seconds=getattr(self.config, 'cache_ttl', 300),
+        )
+
+        # Optional prefetch: analyze launches seen on-chain before any
+        # validator asks, so the first query is answered from cache
+        self.prefetch = getattr(self.config, 'prefetch', False)
+        self.prefetch_max_age = getattr(self.config, 'prefetch_max_age', 60)
+        if self.prefetch:
+            self.prefetch_source = RaydiumPoolDiscovery(
+                checkpoint_path=Path("data/miner/raydium_checkpoint.json"),
+            )
+            # Own engine: prefetching runs on the main loop, not the axon's
+            self.prefetch_engine = TwelveLayerFusion()
+
+        # Optional archive of every full analysis's feature record,
+        # labelled with ground truth later, for offline backtests
+        self.archive = None
+        archive_dir = getattr(self.config, 'archive_dir', None)
+        if archive_dir:
+            self.archive = SnapshotArchive(
+                Path(archive_dir),
+                chunk_rows=getattr(self.config, 'archive_chunk_rows', 65536),
+                rotate_seconds=getattr(self.config, 'archive_rotate_hours', 24) * 3600,
+                max_chunks=getattr(self.config, 'archive_max_chunks', None),
+                retention_days=getattr(self.config, 'archive_retention_days', 30),
+            )
+            self.verifier = GroundTruthVerifier()
+
         logger.info("✅ RugIntel Miner initialized")
         logger.info(f"   Wallet: {self.wallet.name}")
         logger.info(f"   Hotkey: {self.wallet.hotkey.ss58_address}")
@@ -79,6 +140,37 @@ class RugIntelMiner:
         parser = bt.config.parser()
         parser.add_argument("--netuid", type=int, required=True,
                           help="RugIntel subnet UID")
+        parser.add_argument("--max_concurrent", type=int, default=8,
+                          help="Maximum analyses running at once")
+        parser.add_argument("--max_queued", type=int, default=32,
+                          help="Maximum requests waiting for a free slot")
+        parser.add_argument("--queue_timeout", type=float, default=10.0,
+                          help="Seconds a request may wait before being shed")
+        parser.add_argument("--cache_ttl", type=int, default=300,
+                          help="Seconds a full analysis is reused for shed requests")
+        parser.add_argument("--metagraph_sync_interval", type=float, default=60,
+                          help="Seconds between background metagraph syncs")
+        parser.add_argument("--batch_concurrency", type=int, default=4,
+                          help="Analyses run at once for a batch request")
+        parser.add_argument("--prefetch", action="store_true",
+                          help="Analyze new Raydium pools before validators ask")
+        parser.add_argument("--prefetch_concurrency", type=int, default=2,
+                          help="Prefetch analyses running at once")
+        parser.add_argument("--prefetch_max_age", type=float, default=60,
+                          help="Seconds a prefetched analysis answers validator queries")
+        parser.add_argument("--archive_dir", type=str, default=None,
+                          help="Archive feature snapshots of analyzed tokens here "
+                               "(disabled if unset)")
+        parser.add_argument("--archive_chunk_rows", type=int, default=65536,
+                          help="Rows per archive chunk before it is sealed")
+        parser.add_argument("--archive_rotate_hours", type=float, default=24,
+                          help="Hours before a partly filled archive chunk is sealed")
+        parser.add_argument("--archive_max_chunks", type=int, default=None,
+                          help="Sealed archive chunks kept (oldest dropped first)")
+        parser.add_argument("--archive_retention_days", type=float, default=30,
+                          help="Days sealed archive chunks are kept")
+        parser.add_argument("--archive_label_interval", type=float, default=3600,
+                          help="Seconds between ground-truth labelling passes")
         return bt.config(parser)
 
     async def forward(self, synapse: RugIntelSynapse) -> RugIntelSynapse:
@@ -102,16 +194,16 @@ class RugIntelMiner:
         )
 
         try:
-            # Run the 12-layer fusion engine (all off-chain)
-            result = await self.fusion_engine.analyze(
-                token_address=synapse.token_address,
-                launch_timestamp=synapse.launch_timestamp,
-            )
+            result = self._prefetched_result(synapse.token_address)
+            if result is None:
+                result = await self._admitted_result(synapse)
 
             # Populate output fields
             synapse.risk_score = result["risk_score"]
             synapse.confidence = result["confidence"]
-            synapse.evidence = result["evidence"]
+            synapse.evidence = self.fusion_engine.evidence_at_level(
+                result, synapse.evidence_level
+            )
             synapse.time_to_rugpull = result["time_to_rugpull"]
 
             logger.info(
@@ -129,7 +221,270 @@ class RugIntelMiner:
 
         return synapse
 
-    def blacklist(self, synapse: RugIntelSynapse) -> tuple:
+    async def _admitted_result(self, synapse: RugIntelSynapse,
+                               on_layer=None) -> dict:
+        """
+        Full analysis if a slot is free in time, degraded otherwise.
+
+        on_layer is passed to the fusion engine to stream layer results.
+        """
+        async with self.admission.admit(
+            caller=synapse.dendrite.hotkey,
+            weight=self.priority(synapse),
+        ) as admitted:
+            if not admitted:
+                return await self._degraded_result(
+                    synapse.token_address, synapse.launch_timestamp
+                )
+
+            # Run the 12-layer fusion engine (all off-chain)
+            result = await self.fusion_engine.analyze(
+                token_address=synapse.token_address,
+                launch_timestamp=synapse.launch_timestamp,
+                on_layer=on_layer,
+            )
+            self._store_result(synapse.token_address, synapse.launch_timestamp, result)
+            return result
+
+    async def forward_stream(
+        self, synapse: RugIntelStreamingSynapse
+    ) -> RugIntelStreamingSynapse.BTStreamingResponse:
+        """
+        Handle a streaming request: send each layer's result as it finishes.
+
+        The fused result is sent last. Prefetched and degraded answers
+        have no per-layer timing, so only their fused result is sent.
+        """
+        logger.info(f"📥 Received stream request: {synapse.token_address[:16]}...")
+
+        async def send_message(send, message: dict):
+            await send({
+                "type": "http.response.body",
+                "body": synapse.encode_message(message),
+                "more_body": True,
+            })
+
+        async def stream(send):
+            async def on_layer(name, layer_result):
+                await send_message(send, {
+                    "layer": name,
+                    "score": layer_result.score,
+                    "confidence": layer_result.confidence,
+                    "weight": self.fusion_engine.LAYER_WEIGHTS.get(name, 0.0),
+                })
+
+            try:
+                result = self._prefetched_result(synapse.token_address)
+                if result is None:
+                    result = await self._admitted_result(synapse, on_layer=on_layer)
+            except Exception as e:
+                logger.error(f"❌ Stream analysis failed: {e}")
+                return
+
+            await send_message(send, {
+                "final": True,
+                "risk_score": result["risk_score"],
+                "confidence": result["confidence"],
+                "time_to_rugpull": result["time_to_rugpull"],
+            })
+            logger.info(f"📤 Streamed response: risk={result['risk_score']:.4f}")
+
+        return synapse.create_streaming_response(stream)
+
+    async def forward_batch(
+        self, synapse: RugIntelBatchSynapse
+    ) -> RugIntelBatchSynapse:
+        """
+        Handle a batch request: many tokens in one round trip.
+
+        Each token is answered from the result cache if it holds a full
+        analysis; the rest take their own admission slot, at most
+        --batch_concurrency at a time, so a batch counts against the
+        concurrency cap like the same number of single requests. A token
+        that is shed is answered in degraded mode.
+
+        Returns:
+            Same synapse with risk_scores, confidences and
+            times_to_rugpull parallel to token_addresses.
+        """
+        addresses = list(synapse.token_addresses)
+        timestamps = list(synapse.launch_timestamps)
+        tokens = list(zip(addresses, timestamps))[:RugIntelBatchSynapse.MAX_TOKENS]
+
+        logger.info(f"📥 Received batch request: {len(tokens)} tokens")
+
+        slots = asyncio.Semaphore(max(1, getattr(self.config, 'batch_concurrency', 4)))
+        weight = self.priority_batch(synapse)
+
+        async def answer(token_address: str, launch_timestamp: int):
+            cached = self.result_cache.get(token_address)
+            if cached is not None:
+                return cached
+            async with slots:
+                try:
+                    async with self.admission.admit(
+                        caller=synapse.dendrite.hotkey, weight=weight,
+                    ) as admitted:
+                        if not admitted:
+                            return await self._degraded_result(
+                                token_address, launch_timestamp
+                            )
+                        result = await self.fusion_engine.analyze(
+                            token_address=token_address,
+                            launch_timestamp=launch_timestamp,
+                        )
+                        self._store_result(token_address, launch_timestamp, result)
+                        return result
+                except Exception as e:
+                    logger.error(f"❌ Batch analysis failed for {token_address}: {e}")
+                    return None
+
+        # Duplicate addresses are answered once
+        unique = dict(tokens)
+        answers = await asyncio.gather(*(answer(a, ts) for a, ts in unique.items()))
+        by_address = dict(zip(unique, answers))
+        results = [by_address[address] for address, _ in tokens]
+
+        # Parallel output arrays; None for tokens not analyzed
+        padding = [None] * (len(addresses) - len(results))
+        synapse.risk_scores = [r["risk_score"] if r else None for r in results] + padding
+        synapse.confidences = [r["confidence"] if r else None for r in results] + padding
+        synapse.times_to_rugpull = [
+            r["time_to_rugpull"] if r else None for r in results
+        ] + padding
+
+        logger.info(
+            f"📤 Batch response: {sum(r is not None for r in results)}/"
+            f"{len(addresses)} tokens analyzed"
+        )
+        return synapse
+
+    def _store_result(self, token_address: str, launch_timestamp: int,
+                      result: dict):
+        """Cache a full analysis and, if enabled, archive its features."""
+        self.result_cache.put(token_address, result)
+        if self.archive is not None:
+            try:
+                self.archive.record(self.fusion_engine.feature_record(
+                    token_address, launch_timestamp, result
+                ))
+            except Exception as e:
+                logger.error(f"Failed to archive {token_address}: {e}")
+
+    def _prefetched_result(self, token_address: str):
+        """A fresh prefetched analysis of the token, if there is one."""
+        if not self.prefetch:
+            return None
+
+        cached = self.result_cache.get(token_address)
+        if cached is None or cached["cache_age_seconds"] > self.prefetch_max_age:
+            return None
+        return cached
+
+    async def _prefetch_loop(self):
+        """Analyze each launch the on-chain source reports, ahead of queries."""
+        slots = asyncio.Semaphore(getattr(self.config, 'prefetch_concurrency', 2))
+
+        async def prefetch_one(token: dict):
+            try:
+                result = await self.prefetch_engine.analyze(
+                    token_address=token["address"],
+                    launch_timestamp=token["timestamp"],
+                )
+                self._store_result(token["address"], token["timestamp"], result)
+                logger.info(f"🔮 Prefetched {token['address'][:16]}...")
+            except Exception as e:
+                logger.error(f"Prefetch failed for {token['address']}: {e}")
+            finally:
+                slots.release()
+
+        running = set()
+        async for token in self.prefetch_source.stream():
+            # Backpressure: take the next launch only when a slot is free
+            await slots.acquire()
+            task = asyncio.create_task(prefetch_one(token))
+            running.add(task)
+            task.add_done_callback(running.discard)
+
+    async def _label_loop(self):
+        """
+        Label archived tokens with ground truth once their window passes.
+
+        Uses the validator's verifier (bulk, rate limited), so archived
+        snapshots join with the same outcomes miners are scored on. Each
+        pass scans only the snapshots past the archive's label cursor.
+        """
+        interval = getattr(self.config, 'archive_label_interval', 3600)
+        while True:
+            try:
+                cutoff = time.time() - self.verifier.ground_truth_wait * 3600
+                due = self.archive.unlabelled(older_than=cutoff)
+                for start in range(0, len(due), 500):
+                    batch = due[start:start + 500]
+                    outcomes = await self.verifier.verify_many(batch)
+                    self.archive.record_outcomes(
+                        {a: o for a, o in outcomes.items() if o is not None},
+                        dict(batch),
+                    )
+                if due:
+                    logger.info(f"🏷️ Labelled {len(due)} archived tokens")
+                self.archive.flush()
+                self.archive.mark_labelled()
+            except Exception as e:
+                logger.error(f"❌ Archive labelling failed: {e}")
+            await asyncio.sleep(interval)
+
+    async def _run_background(self):
+        """
+        Off-request-path work: metagraph sync, optional prefetch and
+        archive labelling.
+        """
+        tasks = [asyncio.create_task(self.syncer.run())]
+        if self.prefetch:
+            tasks.append(asyncio.create_task(self._prefetch_loop()))
+        if self.archive is not None:
+            tasks.append(asyncio.create_task(self._label_loop()))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self.prefetch:
+                await self.prefetch_source.close()
+                await self.prefetch_engine.close()
+            if self.archive is not None:
+                await self.verifier.close()
+                self.archive.close()
+
+    async def _degraded_result(self, token_address: str,
+                               launch_timestamp: int) -> dict:
+        """
+        Answer a shed request without a full analysis.
+
+        Prefers the most recent cached full analysis of the token;
+        otherwise falls back to the cheap offline layers. The result is
+        flagged (shed, degraded_mode) so its evidence tells validators
+        the response was shed.
+        """
+        cached = self.result_cache.get(token_address)
+        if cached is not None:
+            mode = "cache"
+            result = cached
+        else:
+            mode = "fast"
+            result = await self.fusion_engine.analyze_fast(
+                token_address=token_address,
+                launch_timestamp=launch_timestamp,
+            )
+
+        logger.warning(
+            f"⚠️ Overloaded — shed {token_address[:16]}... "
+            f"(mode={mode}, {self.admission.stats()})"
+        )
+
+        return {**result, "shed": True, "degraded_mode": mode}
+
+    def blacklist(self, synapse: RugIntelSynapse) -> Tuple[bool, str]:
         """
         Blacklist check for incoming requests.
 
@@ -137,11 +492,40 @@ class RugIntelMiner:
         """
         caller_hotkey = synapse.dendrite.hotkey
 
-        if caller_hotkey not in self.metagraph.hotkeys:
+        if caller_hotkey not in self.syncer.snapshot.hotkey_to_uid:
             return True, "Caller not registered in subnet"
 
         return False, ""
 
+    def blacklist_batch(self, synapse: RugIntelBatchSynapse) -> Tuple[bool, str]:
+        """Blacklist check for batch requests (same rules as blacklist)."""
+        return self.blacklist(synapse)
+
+    def priority_batch(self, synapse: RugIntelBatchSynapse) -> float:
+        """Priority for batch requests (same rules as priority)."""
+        return self.priority(synapse)
+
+    def blacklist_stream(self, synapse: RugIntelStreamingSynapse) -> Tuple[bool, str]:
+        """Blacklist check for streaming requests (same rules as blacklist)."""
+        return self.blacklist(synapse)
+
+    def priority_stream(self, synapse: RugIntelStreamingSynapse) -> float:
+        """Priority for streaming requests (same rules as priority)."""
+        return self.priority(synapse)
+
+    def priority(self, synapse: RugIntelSynapse) -> float:
+        """
+        Request priority for the axon and the admission queue.
+
+        Validators are served in proportion to their stake, so limited
+        upstream capacity goes to the validators that drive emissions.
+        Unknown or zero-stake callers get the minimum weight of 1.0.
+        """
+        stake = self.syncer.snapshot.stake_of(synapse.dendrite.hotkey)
+        if stake is None:
+            return 1.0
+        return max(stake, 1.0)
+
     def run(self):
         """Start the miner and begin serving requests."""
         logger.info("🚀 Starting RugIntel Miner...")
@@ -155,13 +539,10 @@ class RugIntelMiner:
         self.axon.start()
         logger.info(f"🟢 Miner serving on port {self.config.axon.port}")
 
-        # Keep running
+        # Keep running — metagraph sync (and prefetch) happen off the
+        # request path
         try:
-            while True:
-                # Sync metagraph periodically
-                self.metagraph.sync(subtensor=self.subtensor)
-                import time
-                time.sleep(60)  # Sync every 60 seconds
+            asyncio.run(self._run_background())
         except KeyboardInterrupt:
             logger.info("🛑 Miner shutting down...")
             self.axon.stop()
@@ -6,6 +6,7 @@ The validator is a commodity quality verifier:
 2. Queries 3+ miners for risk predictions via Dendrite
 3. Stores predictions for 24-hour ground truth verification
 4. Verifies against ground truth (Solana RPC + RugCheck + DexScreener)
+   at checkpoints (e.g. 1h/6h/24h); confirmed rugpulls are scored early
 5. Calculates miner accuracy and calls set_weights() on-chain
 6. Yuma Consensus automatically distributes TAO based on weights
 
@@ -26,15 +27,32 @@ import asyncio
 import time
 import logging
 import json
+import math
 from collections import defaultdict
 from pathlib import Path
+from typing import List
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import bittensor as bt
-from rugintel.protocol import RugIntelSynapse
+import numpy as np
+from rugintel.protocol import (
+    RugIntelSynapse, RugIntelBatchSynapse, RugIntelStreamingSynapse,
+)
 from rugintel.verification import GroundTruthVerifier
+from rugintel.discovery import (
+    DexScreenerDiscovery, RaydiumPoolDiscovery, SeenSet, merge_streams,
+)
+from rugintel.metagraph import MetagraphSyncer
+from rugintel.sampling import StratifiedSampler
+from rugintel.scheduler import DueQueue
+from rugintel.scoring import ScoreHistory
+from rugintel.store import PendingStore
+from rugintel.latency import (
+    MinerLatencyTracker, classify_status,
+    STATUS_OK, STATUS_TIMEOUT, STATUS_ERROR,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,11 +63,18 @@ class RugIntelValidator:
 
     CRITICAL FLOW:
     1. Query miners → Get predictions
-    2. Wait 24 hours → Check ground truth
+    2. Check ground truth at checkpoints → rugs early, safe after 24h
     3. Score miner accuracy → set_weights() on-chain
     4. Yuma Consensus → Auto-distribute TAO to miners
     """
 
+    # Delay before re-checking a due token whose ground truth was unavailable
+    VERIFY_RETRY_SECONDS = 60
+
+    # Analyses a miner runs at once for a batch (its --batch_concurrency
+    # default); a batch of n tokens takes about n / this rounds
+    MINER_BATCH_CONCURRENCY = 4
+
     def __init__(self, config=None):
         """Initialize validator with Bittensor config and verifier."""
         self.config = config or bt.config()
@@ -58,27 +83,90 @@ class RugIntelValidator:
         # Setup Bittensor
         self.wallet = bt.wallet(config=self.config)
         self.subtensor = bt.subtensor(config=self.config)
-        self.metagraph = self.subtensor.metagraph(
-            netuid=self.config.netuid
-        )
         self.dendrite = bt.dendrite(wallet=self.wallet)
 
+        # Metagraph + derived indexes, refreshed in the background on a
+        # dedicated connection so set_weights() never shares a socket with it
+        self.syncer = MetagraphSyncer(
+            subtensor=bt.subtensor(config=self.config),
+            netuid=self.config.netuid,
+            interval=getattr(self.config, 'metagraph_sync_interval', 60),
+        )
+        self.syncer.sync_once()
+
         # Initialize verifier
         self.verifier = GroundTruthVerifier()
 
-        # Pending verifications: token_address → {miner_uid: prediction_data}
-        self.pending_verifications = defaultdict(dict)
+        # Streaming new-launch discovery; sources share one seen-set so a
+        # launch found on-chain is not re-emitted once DexScreener lists it
+        seen = SeenSet(getattr(self.config, 'discovery_seen_capacity', 100_000))
+        self.discovery_sources = [
+            DexScreenerDiscovery(
+                poll_interval=getattr(self.config, 'discovery_interval', 15),
+                seen=seen,
+            ),
+        ]
+
+        # Pipeline queues: discovery → query, verification → weights
+        self.token_queue = asyncio.Queue(
+            maxsize=getattr(self.config, 'token_queue_size', 100)
+        )
+        self.score_queue = asyncio.Queue()
+
+        # Per-uid round-trip latency and timeout/error statistics
+        self.latency = MinerLatencyTracker(
+            min_timeout=getattr(self.config, 'query_timeout_min', 5.0),
+            max_timeout=getattr(self.config, 'query_timeout_max', 30.0),
+        )
 
-        # Miner accuracy scores (rolling window)
-        self.miner_scores = defaultdict(list)
+        # Optional sampling: query each token on a subset of miners
+        miners_per_token = getattr(self.config, 'miners_per_token', 0)
+        self.sampler = (
+            StratifiedSampler(miners_per_token) if miners_per_token > 0 else None
+        )
+
+        # Tokens queued or being queried (not yet in the pending store)
+        self.queued_tokens = set()
+
+        # Global cap on dendrite requests in flight across all tokens
+        self.dendrite_slots = asyncio.Semaphore(
+            getattr(self.config, 'max_outstanding_requests', 256)
+        )
 
         # Persistence path
         self.data_dir = Path("data/validator")
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load pending verifications from disk
+        # Optional on-chain discovery from Raydium pool initializations
+        if getattr(self.config, 'raydium_discovery', False):
+            self.discovery_sources.append(RaydiumPoolDiscovery(
+                rpc_url=self.verifier.rpc_url,
+                poll_interval=getattr(self.config, 'raydium_poll_interval', 5),
+                checkpoint_path=self.data_dir / "raydium_checkpoint.json",
+                seen=seen,
+            ))
+
+        # Miner accuracy history: bounded ring buffer + EMA per uid,
+        # memory-mapped so it survives restarts
+        self.scores = ScoreHistory(
+            self.data_dir / "miner_scores.npy",
+            n_uids=self.syncer.snapshot.n,
+            window=getattr(self.config, 'score_window', 100),
+            ema_alpha=getattr(self.config, 'score_ema_alpha', 0.1),
+            half_life=getattr(self.config, 'score_half_life_hours', 24.0) * 3600,
+        )
+
+        # Pending verifications: token → {miner_uid: prediction_data},
+        # stored incrementally in an indexed on-disk database
+        self.pending = PendingStore(self.data_dir / "pending.sqlite3")
         self._load_pending()
 
+        # Min-heap of pending tokens by due time: verification only ever
+        # touches tokens whose ground-truth window has passed
+        self.due_queue = DueQueue()
+        for address, launch_ts, due_at in self.pending.schedule():
+            self.due_queue.push(address, due_at, launch_ts)
+
         logger.info("✅ RugIntel Validator initialized")
         logger.info(f"   Wallet: {self.wallet.name}")
         logger.info(f"   Subnet: {self.config.netuid}")
@@ -89,212 +177,647 @@ class RugIntelValidator:
         parser = bt.config.parser()
         parser.add_argument("--netuid", type=int, required=True,
                           help="RugIntel subnet UID")
+        parser.add_argument("--discovery_interval", type=float, default=15,
+                          help="Seconds between new-token discovery polls")
+        parser.add_argument("--discovery_seen_capacity", type=int, default=100_000,
+                          help="Token addresses remembered to suppress re-discovery")
+        parser.add_argument("--raydium_discovery", action="store_true",
+                          help="Also discover launches from Raydium pool initializations")
+        parser.add_argument("--raydium_poll_interval", type=float, default=5,
+                          help="Seconds between Raydium signature polls")
         parser.add_argument("--verification_interval", type=int, default=300,
-                          help="Seconds between verification checks")
+                          help="Maximum seconds between verification wake-ups")
+        parser.add_argument("--weights_interval", type=int, default=300,
+                          help="Seconds between on-chain weight updates")
+        parser.add_argument("--token_queue_size", type=int, default=100,
+                          help="Discovered tokens buffered ahead of querying")
+        parser.add_argument("--query_concurrency", type=int, default=8,
+                          help="Tokens queried against miners at the same time")
+        parser.add_argument("--query_batch_size", type=int, default=1,
+                          help="Queued tokens sent to miners per request "
+                               "(1 = single-token synapse, for older miners; "
+                               "at most 64)")
+        parser.add_argument("--evidence_level", default="compact",
+                          choices=["none", "compact", "full"],
+                          help="Evidence detail requested from miners (full "
+                               "includes every layer's reasons)")
+        parser.add_argument("--stream_queries", action="store_true",
+                          help="Query miners with the streaming synapse; streams "
+                               "cut at the deadline still yield a provisional answer")
+        parser.add_argument("--max_outstanding_requests", type=int, default=256,
+                          help="Global cap on dendrite requests in flight")
+        parser.add_argument("--miners_per_token", type=int, default=0,
+                          help="Miners sampled per token (0 = query all serving miners)")
+        parser.add_argument("--query_timeout_min", type=float, default=5.0,
+                          help="Lower bound for a miner's adaptive query timeout")
+        parser.add_argument("--query_timeout_max", type=float, default=30.0,
+                          help="Upper bound for a miner's adaptive query timeout")
+        parser.add_argument("--metagraph_sync_interval", type=float, default=60,
+                          help="Seconds between background metagraph syncs")
+        parser.add_argument("--score_window", type=int, default=100,
+                          help="Recent accuracy scores kept per miner")
+        parser.add_argument("--score_ema_alpha", type=float, default=0.1,
+                          help="Smoothing factor of the per-miner accuracy EMA")
+        parser.add_argument("--score_half_life_hours", type=float, default=24.0,
+                          help="Hours for an unscored miner's weight to halve (0 = no decay)")
         return bt.config(parser)
 
-    async def forward(self):
+    async def discover(self):
         """
-        Main validator loop — discover and query miners.
+        Discovery stage — queue each newly launched token as it appears.
 
-        1. Get newly launched tokens from Solana
-        2. Send RugIntelSynapse to 3+ miners
-        3. Store predictions for 24h verification
+        Sources (DexScreener, optionally Raydium on-chain) are merged and
+        emit every launch once; tokens already awaiting
+        verification (e.g. after a restart) are skipped. When the query
+        stage falls behind, put() blocks and discovery slows to match.
         """
-        # Fetch new tokens for analysis
-        new_tokens = await self.verifier.get_new_tokens(limit=5)
+        while True:
+            try:
+                async for token in merge_streams(
+                    *(source.stream() for source in self.discovery_sources)
+                ):
+                    address = token["address"]
+                    if address in self.pending or address in self.queued_tokens:
+                        continue
+                    self.queued_tokens.add(address)
+                    await self.token_queue.put(token)
+            except Exception as e:
+                logger.error(f"❌ Discovery stage failed: {e}")
+                await asyncio.sleep(getattr(self.config, 'discovery_interval', 15))
 
-        if not new_tokens:
-            logger.info("No new tokens to analyze")
-            return
+    async def forward(self, token: dict):
+        """
+        Query stage — send one token to miners and store predictions.
 
-        for token in new_tokens:
-            logger.info(
-                f"🔍 Analyzing token: {token['symbol']} "
-                f"({token['address'][:16]}...)"
-            )
+        1. Send RugIntelSynapse to 3+ miners
+        2. Store predictions for 24h verification
+        """
+        logger.info(
+            f"🔍 Analyzing token: {token['symbol']} "
+            f"({token['address'][:16]}...)"
+        )
 
-            # Create synapse request
-            synapse = RugIntelSynapse(
-                token_address=token["address"],
-                launch_timestamp=token["timestamp"],
-            )
+        due_at = self._register_token(token)
 
-            # Query all registered miners via Dendrite
+        # Create synapse request (streamed layer by layer if enabled)
+        streaming = getattr(self.config, 'stream_queries', False)
+        synapse_cls = RugIntelStreamingSynapse if streaming else RugIntelSynapse
+        synapse = synapse_cls(
+            token_address=token["address"],
+            launch_timestamp=token["timestamp"],
+        )
+        if not streaming:
+            synapse.evidence_level = getattr(self.config, 'evidence_level', "compact")
+        query_axon = self._query_axon_stream if streaming else self._query_axon
+        record = self._record_stream_response if streaming else self._record_response
+
+        # Query serving miners via Dendrite, handling each response as
+        # soon as it arrives
+        snapshot = self.syncer.snapshot
+        uids = self._target_uids(snapshot)
+
+        queries = [
+            query_axon(int(uid), snapshot.axons[uid], synapse)
+            for uid in uids
+        ]
+
+        status_counts = defaultdict(int)
+        for query in asyncio.as_completed(queries):
             try:
-                responses = await self.dendrite.forward(
-                    axons=self.metagraph.axons,
-                    synapse=synapse,
-                    timeout=30,
-                )
+                uid, response, latency = await query
             except Exception as e:
-                logger.error(f"Failed to query miners: {e}")
+                logger.error(f"Failed to query miner: {e}")
                 continue
 
-            # Store each miner's prediction for 24h verification
-            miner_count = 0
-            for uid, response in zip(self.metagraph.uids, responses):
-                if (response and
-                        hasattr(response, 'risk_score') and
-                        response.risk_score is not None):
-                    self.pending_verifications[token["address"]][int(uid)] = {
-                        "risk_score": response.risk_score,
-                        "confidence": response.confidence,
-                        "evidence": response.evidence,
-                        "time_to_rugpull": response.time_to_rugpull,
-                        "launch_timestamp": token["timestamp"],
-                        "queried_at": int(time.time()),
-                    }
-                    miner_count += 1
+            status = record(token, uid, response, latency)
+            status_counts[status] += 1
 
-            logger.info(
-                f"   📊 Received {miner_count} predictions for "
-                f"{token['symbol']}"
+        logger.info(
+            f"   📊 Received {status_counts[STATUS_OK]} predictions for "
+            f"{token['symbol']} ({status_counts[STATUS_TIMEOUT]} timeouts, "
+            f"{status_counts[STATUS_ERROR]} errors)"
+        )
+
+        # Persist this token's predictions in one transaction, then
+        # schedule its ground-truth check
+        self.pending.commit()
+        self.due_queue.push(token["address"], due_at, token["timestamp"])
+
+    async def forward_batch(self, tokens: List[dict]):
+        """
+        Query stage — send several tokens to miners in one round trip each.
+
+        Same as forward(), but every miner gets a single
+        RugIntelBatchSynapse covering all tokens, so per-request overhead
+        (connection, signing, headers) is paid once per miner instead of
+        once per token. Batch responses carry no evidence.
+        """
+        logger.info(
+            f"🔍 Analyzing batch of {len(tokens)} tokens: "
+            f"{', '.join(token['symbol'] for token in tokens)}"
+        )
+
+        due_ats = [self._register_token(token) for token in tokens]
+
+        synapse = RugIntelBatchSynapse(
+            token_addresses=[token["address"] for token in tokens],
+            launch_timestamps=[token["timestamp"] for token in tokens],
+        )
+
+        snapshot = self.syncer.snapshot
+        uids = self._target_uids(snapshot)
+
+        queries = [
+            self._query_axon(int(uid), snapshot.axons[uid], synapse)
+            for uid in uids
+        ]
+
+        status_counts = defaultdict(int)
+        for query in asyncio.as_completed(queries):
+            try:
+                uid, response, latency = await query
+            except Exception as e:
+                logger.error(f"Failed to query miner: {e}")
+                continue
+
+            for status in self._record_batch_response(tokens, uid, response,
+                                                      latency):
+                status_counts[status] += 1
+
+        logger.info(
+            f"   📊 Received {status_counts[STATUS_OK]} predictions for "
+            f"{len(tokens)} tokens ({status_counts[STATUS_TIMEOUT]} timeouts, "
+            f"{status_counts[STATUS_ERROR]} errors)"
+        )
+
+        self.pending.commit()
+        for token, due_at in zip(tokens, due_ats):
+            self.due_queue.push(token["address"], due_at, token["timestamp"])
+
+    def _register_token(self, token: dict) -> int:
+        """Add a token to the pending store; returns its first due time."""
+        due_at = self.verifier.next_checkpoint(token["timestamp"], time.time())
+        self.pending.add_token(
+            token["address"],
+            launch_timestamp=token["timestamp"],
+            due_at=due_at,
+            symbol=token.get("symbol", ""),
+        )
+        return due_at
+
+    def _target_uids(self, snapshot):
+        """
+        Serving miners to query (axons that never served are skipped).
+
+        With sampling enabled only a stratified subset is queried.
+        """
+        uids = snapshot.serving_uids
+        if self.sampler is not None:
+            uids = self.sampler.select(uids)
+        return uids
+
+    async def _query_axon(self, uid: int, axon, synapse: bt.Synapse):
+        """
+        Query a single miner, holding one global dendrite slot.
+
+        The timeout adapts to the miner's own latency history, so fast
+        miners are not given the full window, and backs off upward after
+        timeouts so a slow spell cannot lock a miner out. A batch gets
+        the per-token timeout once per round of analyses it needs.
+        """
+        timeout = self.latency.timeout_for(uid)
+        if isinstance(synapse, RugIntelBatchSynapse):
+            timeout *= self._batch_rounds(len(synapse.token_addresses))
+
+        async with self.dendrite_slots:
+            start_time = time.time()
+            response = await self.dendrite.call(
+                target_axon=axon,
+                synapse=synapse.model_copy(),
+                timeout=timeout,
             )
+            return uid, response, time.time() - start_time
 
-        # Persist to disk
-        self._save_pending()
+    def _batch_rounds(self, n_tokens: int) -> int:
+        """Rounds of concurrent analyses a miner needs for n tokens."""
+        return max(1, math.ceil(n_tokens / self.MINER_BATCH_CONCURRENCY))
 
-    async def verify_and_set_weights(self):
+    async def _query_axon_stream(self, uid: int, axon,
+                                 synapse: RugIntelStreamingSynapse):
         """
-        Check ground truth for pending tokens and set weights.
+        Stream a single miner's answer, holding one global dendrite slot.
 
-        This is the critical function:
-        1. For each pending token, check 24h ground truth
-        2. Calculate miner accuracy scores
-        3. Set weights on-chain
-        4. Yuma Consensus auto-distributes TAO
+        The stream is cut at the miner's adaptive timeout; the synapse
+        returned still holds every layer result received before that.
         """
-        weights = defaultdict(list)
-        verified_tokens = []
+        async with self.dendrite_slots:
+            start_time = time.time()
+            response = synapse.model_copy()
+            async for item in self.dendrite.call_stream(
+                target_axon=axon,
+                synapse=response,
+                timeout=self.latency.timeout_for(uid),
+            ):
+                if isinstance(item, RugIntelStreamingSynapse):
+                    response = item  # Always the last item yielded
+            return uid, response, time.time() - start_time
+
+    def _record_response(self, token: dict, uid: int, response,
+                          latency: float) -> str:
+        """
+        Store one miner's answer (or failure) for 24h verification.
+
+        Every query is recorded with its round-trip latency and status;
+        only entries with a risk_score are scored later.
+        """
+        status = classify_status(response.dendrite.status_code)
+        if status == STATUS_OK and response.risk_score is None:
+            status = STATUS_ERROR  # Answered without a prediction
+
+        self.latency.record(uid, latency, status, response.timeout)
+        if status != STATUS_OK:
+            logger.debug(
+                f"   Miner {uid}: {status} ({response.dendrite.status_code} "
+                f"{response.dendrite.status_message})"
+            )
+
+        # Stored as a compact record; evidence is deduplicated by content
+        self.pending.add_prediction(token["address"], uid, {
+            "risk_score": response.risk_score if status == STATUS_OK else None,
+            "confidence": response.confidence,
+            "evidence": response.evidence,
+            "time_to_rugpull": response.time_to_rugpull,
+            "queried_at": int(time.time()),
+            "latency": round(latency, 3),
+            "status": status,
+        })
+        return status
+
+    def _record_stream_response(self, token: dict, uid: int,
+                                response: RugIntelStreamingSynapse,
+                                latency: float) -> str:
+        """
+        Store one miner's streamed answer.
 
-        for token_address, predictions in list(
-            self.pending_verifications.items()
-        ):
-            # Get launch timestamp from any prediction
-            sample_pred = next(iter(predictions.values()), {})
-            launch_ts = sample_pred.get("launch_timestamp", 0)
+        A stream cut before the fused result still counts if any layer
+        arrived: its provisional answer is stored (flagged in the
+        evidence) under the timeout status.
+        """
+        status = classify_status(response.dendrite.status_code)
+        answer = None
+        if response.is_complete:
+            answer = {"risk_score": response.risk_score,
+                      "confidence": response.confidence}
+            evidence = {"layers": response.layers}
+        elif response.layers:
+            answer = response.provisional()
+            evidence = {"provisional": True, "layers": response.layers}
+            if status == STATUS_OK:
+                status = STATUS_TIMEOUT  # Stream ended before the fused result
+
+        if answer is None and status == STATUS_OK:
+            status = STATUS_ERROR  # Answered without a prediction
+
+        self.latency.record(uid, latency, status, response.timeout)
+        if answer is None:
+            logger.debug(
+                f"   Miner {uid}: {status} ({response.dendrite.status_code} "
+                f"{response.dendrite.status_message})"
+            )
+
+        self.pending.add_prediction(token["address"], uid, {
+            "risk_score": answer["risk_score"] if answer else None,
+            "confidence": answer["confidence"] if answer else None,
+            "evidence": evidence if answer else None,
+            "time_to_rugpull": response.time_to_rugpull,
+            "queried_at": int(time.time()),
+            "latency": round(latency, 3),
+            "status": status,
+        })
+        return status
+
+    def _record_batch_response(self, tokens: List[dict], uid: int, response,
+                               latency: float) -> List[str]:
+        """
+        Store one miner's batch answer, one prediction per token.
 
-            # Check ground truth (returns None if <24h)
-            ground_truth = await self.verifier.check_24h_outcome(
-                token_address, launch_ts
+        Latency is recorded once for the round trip, per round of
+        analyses so the miner's single-token timeout is unaffected; a
+        token the miner left unanswered is stored as an error.
+        """
+        status = classify_status(response.dendrite.status_code)
+        rounds = self._batch_rounds(len(tokens))
+        self.latency.record(
+            uid, latency / rounds, status,
+            response.timeout / rounds if response.timeout else None,
+        )
+        if status != STATUS_OK:
+            logger.debug(
+                f"   Miner {uid}: {status} ({response.dendrite.status_code} "
+                f"{response.dendrite.status_message})"
             )
 
-            if ground_truth is None:
-                continue  # Not yet 24 hours
+        def column(values, i):
+            return values[i] if values is not None and i < len(values) else None
+
+        statuses = []
+        queried_at = int(time.time())
+        for i, token in enumerate(tokens):
+            risk_score = column(response.risk_scores, i) if status == STATUS_OK else None
+            token_status = status
+            if status == STATUS_OK and risk_score is None:
+                token_status = STATUS_ERROR  # Answered without a prediction
+
+            self.pending.add_prediction(token["address"], uid, {
+                "risk_score": risk_score,
+                "confidence": column(response.confidences, i),
+                "time_to_rugpull": column(response.times_to_rugpull, i),
+                "queried_at": queried_at,
+                "latency": round(latency, 3),
+                "status": token_status,
+            })
+            statuses.append(token_status)
+        return statuses
+
+    async def verify_pending(self):
+        """
+        Verification stage — check ground truth and score miners.
+
+        1. Pop the tokens that reached a checkpoint from the due queue
+        2. Check their ground truth in bulk (rate limited)
+        3. Finalize confirmed rugpulls and tokens past the full window;
+           reschedule the rest for their next checkpoint
+        4. Calculate miner accuracy scores for finalized tokens (0 for
+           miners whose query failed)
+        5. Hand scores to the weight-setting stage
+        """
+        due = self.due_queue.pop_due(time.time())
+        if not due:
+            return
+
+        start_time = time.time()
+        try:
+            outcomes = await self.verifier.verify_many(due)
+        except Exception as e:
+            # Every token falls through to the retry path below
+            logger.error(f"❌ Ground truth check failed: {e}")
+            outcomes = {}
+        logger.info(
+            f"🔎 Checked ground truth for {len(due)} tokens in "
+            f"{time.time() - start_time:.1f}s"
+        )
 
-            # Calculate accuracy for each miner
-            for miner_uid, prediction in predictions.items():
-                accuracy = self.verifier.calculate_accuracy(
-                    predicted_risk=prediction["risk_score"],
+        verified_tokens = []
+        early_rugs = 0
+        rescheduled = 0
+
+        for token_address, launch_ts in due:
+            # None if no checkpoint reached by the verifier's clock
+            ground_truth = outcomes.get(token_address)
+
+            try:
+                if ground_truth is None:
+                    # Not ready — retry shortly
+                    self.due_queue.push(
+                        token_address, time.time() + self.VERIFY_RETRY_SECONDS,
+                        launch_ts,
+                    )
+                    continue
+
+                if not ground_truth["final"]:
+                    if not ground_truth["is_rugpull"]:
+                        # Looks safe so far — only the full window can confirm it
+                        next_due = self.verifier.next_checkpoint(
+                            launch_ts, time.time()
+                        )
+                        self.pending.reschedule(token_address, next_due)
+                        self.due_queue.push(token_address, next_due, launch_ts)
+                        rescheduled += 1
+                        continue
+                    early_rugs += 1
+
+                # Score every queried miner in one vectorized pass; a query
+                # that failed (no prediction) scores 0
+                records = self.pending.predictions(token_address)
+                uids = records["uid"].astype(np.int64)
+                risks = records["risk"].astype(np.float64)
+                failed = np.isnan(risks)
+
+                accuracies = self.verifier.calculate_accuracy_batch(
+                    np.where(failed, 0.0, risks),
                     actual_rugpull=ground_truth["is_rugpull"],
                     liquidity_drained=ground_truth["liquidity_drained"],
                     funds_moved=ground_truth["funds_moved_to_exchange"],
                 )
+                accuracies[failed] = 0.0
 
-                weights[miner_uid].append(accuracy)
-                self.miner_scores[miner_uid].append(accuracy)
-
-                verdict = "RUGPULL ✅" if ground_truth["is_rugpull"] else "SAFE ✅"
+                verdict = "RUGPULL" if ground_truth["is_rugpull"] else "SAFE"
                 logger.info(
-                    f"   Miner {miner_uid}: predicted {prediction['risk_score']:.2f}, "
-                    f"actual {verdict}, accuracy {accuracy:.4f}"
+                    f"   {token_address[:16]}... actual {verdict} | accuracy "
+                    f"{self.verifier.accuracy_summary(accuracies)}"
+                )
+
+                if uids.size:
+                    self.score_queue.put_nowait((uids, accuracies))
+                verified_tokens.append(token_address)
+
+            except Exception as e:
+                # Keep the token pending and check it again shortly
+                logger.error(f"❌ Failed to verify {token_address[:16]}...: {e}")
+                self.due_queue.push(
+                    token_address, time.time() + self.VERIFY_RETRY_SECONDS,
+                    launch_ts,
                 )
 
-            verified_tokens.append(token_address)
+        logger.info(
+            f"   ✅ Finalized {len(verified_tokens)} tokens "
+            f"({early_rugs} early rugpulls), {rescheduled} rescheduled"
+        )
 
         # Remove verified tokens from pending
-        for token in verified_tokens:
-            del self.pending_verifications[token]
-        self._save_pending()
+        if verified_tokens:
+            self.pending.remove(verified_tokens)
+        self.pending.commit()
 
-        # Set weights on-chain
-        if weights:
-            avg_weights = {
-                uid: sum(scores) / len(scores)
-                for uid, scores in weights.items()
-            }
+    async def set_weights(self):
+        """
+        Weight stage — fold new scores into each miner's history, set
+        the EMA weights on-chain.
 
-            logger.info(f"⚖️ Setting weights for {len(avg_weights)} miners")
+        Yuma Consensus auto-distributes TAO from the weights.
+        """
+        self._save_latency()
+        if self.sampler is not None:
+            logger.info(
+                f"📐 Sampling coverage this epoch: "
+                f"{self.sampler.coverage_summary()}"
+            )
 
-            try:
-                # SET WEIGHTS ON-CHAIN
-                # This is the ONLY on-chain interaction
-                # Yuma Consensus will aggregate these weights from ALL validators
-                # and AUTOMATICALLY distribute TAO to miners
-                self.subtensor.set_weights(
-                    netuid=self.config.netuid,
-                    wallet=self.wallet,
-                    uids=list(avg_weights.keys()),
-                    weights=list(avg_weights.values()),
-                )
+        # Each queue item is (uids, accuracies) for one verified token
+        new_scores = []
+        while not self.score_queue.empty():
+            new_scores.append(self.score_queue.get_nowait())
+
+        # Reset uids that changed hands, then record in one vectorized pass
+        self.scores.sync_hotkeys(self.syncer.snapshot.hotkeys)
+        if new_scores:
+            self.scores.record(
+                np.concatenate([uids for uids, _ in new_scores]),
+                np.concatenate([accuracies for _, accuracies in new_scores]),
+            )
+            self.scores.flush()
 
-                logger.info(
-                    f"✅ Weights set on-chain → "
-                    f"Yuma Consensus will auto-distribute TAO"
-                )
+        # Weights are set even without new scores so silent miners decay
+        weights = self.scores.weights()
+        scored_uids = np.flatnonzero(weights > 0)
+        if not scored_uids.size:
+            return
 
-            except Exception as e:
-                logger.error(f"❌ Failed to set weights: {e}")
+        logger.info(f"⚖️ Setting weights for {len(scored_uids)} miners")
 
-    def _save_pending(self):
-        """Persist pending verifications to disk."""
         try:
-            path = self.data_dir / "pending_verifications.json"
-            # Convert defaultdict to regular dict for JSON
-            data = {
-                addr: {str(uid): pred for uid, pred in preds.items()}
-                for addr, preds in self.pending_verifications.items()
-            }
+            # SET WEIGHTS ON-CHAIN
+            # This is the ONLY on-chain interaction
+            # Yuma Consensus will aggregate these weights from ALL validators
+            # and AUTOMATICALLY distribute TAO to miners
+            await asyncio.to_thread(
+                self.subtensor.set_weights,
+                netuid=self.config.netuid,
+                wallet=self.wallet,
+                uids=scored_uids.tolist(),
+                weights=weights[scored_uids].tolist(),
+            )
+
+            logger.info(
+                f"✅ Weights set on-chain → "
+                f"Yuma Consensus will auto-distribute TAO"
+            )
+
+        except Exception as e:
+            logger.error(f"❌ Failed to set weights: {e}")
+
+    def _save_latency(self):
+        """Write the per-uid latency summary for operators."""
+        try:
+            path = self.data_dir / "miner_latency.json"
             with open(path, "w") as f:
-                json.dump(data, f, indent=2)
+                json.dump(self.latency.summaries(), f, indent=2)
         except Exception as e:
-            logger.error(f"Failed to save pending: {e}")
+            logger.error(f"Failed to save latency summary: {e}")
 
     def _load_pending(self):
-        """Load pending verifications from disk."""
+        """Import a legacy pending_verifications.json file, once."""
         try:
             path = self.data_dir / "pending_verifications.json"
             if path.exists():
-                with open(path, "r") as f:
-                    data = json.load(f)
-                for addr, preds in data.items():
-                    for uid_str, pred in preds.items():
-                        self.pending_verifications[addr][int(uid_str)] = pred
-                logger.info(
-                    f"📂 Loaded {len(self.pending_verifications)} "
-                    f"pending verifications"
+                count = self.pending.import_json(
+                    path, wait_hours=self.verifier.ground_truth_wait
                 )
+                path.rename(path.with_suffix(".json.imported"))
+                logger.info(f"📂 Imported {count} legacy pending verifications")
+
+            logger.info(f"📂 {len(self.pending)} pending verifications")
         except Exception as e:
             logger.error(f"Failed to load pending: {e}")
 
-    def run(self):
-        """Start the validator main loop."""
-        logger.info("🚀 Starting RugIntel Validator...")
+    async def _periodic(self, name: str, interval: float, stage):
+        """Run a pipeline stage every `interval` seconds, forever."""
+        while True:
+            start_time = time.time()
+            try:
+                await stage()
+            except Exception as e:
+                logger.error(f"❌ {name} stage failed: {e}")
 
-        loop = asyncio.get_event_loop()
+            elapsed = time.time() - start_time
+            await asyncio.sleep(max(0.0, interval - elapsed))
 
-        try:
-            while True:
-                # Sync metagraph
-                self.metagraph.sync(subtensor=self.subtensor)
+    async def _verification_loop(self):
+        """
+        Sleep until the next pending token is due, then verify the batch.
 
-                # Phase 1: Query miners for new tokens
-                loop.run_until_complete(self.forward())
+        Wakes early when a token with an earlier due time is scheduled;
+        --verification_interval only caps how long a single sleep lasts.
+        """
+        max_wait = getattr(self.config, 'verification_interval', 300)
+        while True:
+            await self.due_queue.wait_until_due(max_wait=max_wait)
+            try:
+                await self.verify_pending()
+            except Exception as e:
+                logger.error(f"❌ Verification stage failed: {e}")
 
-                # Phase 2: Verify ground truth and set weights
-                loop.run_until_complete(self.verify_and_set_weights())
+    async def _query_worker(self):
+        """
+        Consume discovered tokens as soon as they are queued.
 
-                # Wait before next cycle
-                interval = getattr(
-                    self.config, 'verification_interval', 300
-                )
-                logger.info(f"💤 Sleeping {interval}s until next cycle...")
-                time.sleep(interval)
+        With --query_batch_size > 1, tokens already waiting in the queue
+        are sent along in the same batch request (never waits to fill one).
+        """
+        batch_size = min(max(1, getattr(self.config, 'query_batch_size', 1)),
+                         RugIntelBatchSynapse.MAX_TOKENS)
+        while True:
+            tokens = [await self.token_queue.get()]
+            while len(tokens) < batch_size and not self.token_queue.empty():
+                tokens.append(self.token_queue.get_nowait())
+
+            try:
+                if len(tokens) == 1:
+                    await self.forward(tokens[0])
+                else:
+                    await self.forward_batch(tokens)
+            except Exception as e:
+                logger.error(f"❌ Query stage failed: {e}")
+            finally:
+                for token in tokens:
+                    self.queued_tokens.discard(token["address"])
+                    self.token_queue.task_done()
+
+    async def run_async(self):
+        """
+        Validator main loop — independent stages connected by queues.
+
+            sync       → background metagraph refresh
+            discovery  → token_queue (bounded, applies backpressure)
+            query      ← token_queue (--query_concurrency workers)
+            verify     ← due_queue (wakes when the next token is due)
+                       → score_queue
+            weights    ← score_queue
+        """
+        tasks = [
+            asyncio.create_task(self.syncer.run()),
+            asyncio.create_task(self.discover()),
+            *(
+                asyncio.create_task(self._query_worker())
+                for _ in range(getattr(self.config, 'query_concurrency', 8))
+            ),
+            asyncio.create_task(self._verification_loop()),
+            asyncio.create_task(self._periodic(
+                "Weights",
+                getattr(self.config, 'weights_interval', 300),
+                self.set_weights,
+            )),
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await self.verifier.close()
+            for source in self.discovery_sources:
+                await source.close()
+            self.pending.close()
+            self.scores.close()
+
+    def run(self):
+        """Start the validator main loop."""
+        logger.info("🚀 Starting RugIntel Validator...")
 
+        try:
+            asyncio.run(self.run_async())
         except KeyboardInterrupt:
             logger.info("🛑 Validator shutting down...")
-            loop.run_until_complete(self.verifier.close())
 
 
 # ── Entry Point ────────────────────────────────────────────
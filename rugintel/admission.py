@@ -0,0 +1,196 @@
+"""
+RugIntel Admission Control — Miner Load Shedding
+
+Bounds how many analyses a miner runs at once so a burst of validator
+queries cannot drag every request past its timeout together.
+
+Architecture:
+    - AdmissionController caps concurrent analyses and the wait queue
+    - Waiters are served by stake-weighted fair queuing per validator
+    - Requests that overflow the queue (or wait too long) are shed
+    - ResultCache keeps recent full analyses to answer shed requests
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """
+    Concurrency cap with a bounded, weighted-fair wait queue.
+
+    At most `max_concurrent` analyses run at the same time. Up to
+    `max_queued` further requests may wait for a slot, each for at most
+    `queue_timeout` seconds. Everything else is shed so the caller can
+    answer in degraded mode instead of timing out.
+
+    Waiting requests are served by weighted fair queuing per caller:
+    each request gets a virtual finish tag of
+        max(virtual_time, caller's last tag) + 1 / weight
+    and the smallest tag is served first. A caller's share of slots under
+    contention is therefore proportional to its weight (validator stake),
+    and a caller that floods the queue only pushes its own tags back.
+    When the queue is full, a newcomer with an earlier tag displaces the
+    waiter with the latest one.
+    """
+
+    def __init__(self, max_concurrent: int = 8, max_queued: int = 32,
+                 queue_timeout: float = 10.0):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max(0, max_queued)
+        self.queue_timeout = queue_timeout
+
+        self.in_flight = 0
+        self.waiting = 0
+
+        # Weighted fair queue: heap of [finish_tag, seq, future]
+        self._queue: List[list] = []
+        self._seq = itertools.count()
+        self._virtual_time = 0.0
+        self._last_tag: Dict[str, float] = {}
+
+        # Counters for operators
+        self.admitted_total = 0
+        self.shed_total = 0
+
+    @asynccontextmanager
+    async def admit(self, caller: str = "",
+                    weight: float = 1.0) -> AsyncIterator[bool]:
+        """
+        Try to obtain an analysis slot.
+
+        Args:
+            caller: Identity used for fair queuing (validator hotkey).
+            weight: Caller's share under contention (e.g. its stake).
+
+        Yields:
+            True if the request holds a slot for the duration of the block,
+            False if it was shed and should be answered in degraded mode.
+        """
+        if self.in_flight < self.max_concurrent and self.waiting == 0:
+            # Free slot and nobody ahead of us — no queueing
+            self.in_flight += 1
+            admitted = True
+        else:
+            admitted = await self._wait_for_slot(caller, weight)
+
+        if not admitted:
+            self.shed_total += 1
+            yield False
+            return
+
+        self.admitted_total += 1
+        try:
+            yield True
+        finally:
+            self._release()
+
+    async def _wait_for_slot(self, caller: str, weight: float) -> bool:
+        """Queue the request by its fair-share tag and wait for a slot."""
+        tag = max(self._virtual_time, self._last_tag.get(caller, 0.0))
+        tag += 1.0 / max(weight, 1e-9)
+
+        if self.waiting >= self.max_queued:
+            worst = max(
+                (entry for entry in self._queue if not entry[2].done()),
+                key=lambda entry: entry[0],
+                default=None,
+            )
+            if worst is None or worst[0] <= tag:
+                return False
+            # Displace the waiter furthest back in fair-share order
+            worst[2].set_result(False)
+
+        self._last_tag[caller] = tag
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, [tag, next(self._seq), future])
+
+        self.waiting += 1
+        try:
+            await asyncio.wait({future}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            # Cancelled after _release() granted us the slot — hand it on
+            if future.done() and not future.cancelled() and future.result():
+                self._release()
+            future.cancel()
+            raise
+        finally:
+            self.waiting -= 1
+
+        if not future.done():
+            future.cancel()  # Timed out — shed
+            return False
+        return future.result()
+
+    def _release(self):
+        """Hand the freed slot to the waiter with the earliest tag."""
+        self.in_flight -= 1
+
+        while self._queue and self.in_flight < self.max_concurrent:
+            tag, _, future = heapq.heappop(self._queue)
+            if future.done():
+                continue  # Timed out, cancelled or displaced
+            self._virtual_time = tag
+            self.in_flight += 1
+            future.set_result(True)
+
+    def stats(self) -> Dict[str, int]:
+        """Current load and lifetime counters."""
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "admitted_total": self.admitted_total,
+            "shed_total": self.shed_total,
+        }
+
+
+class ResultCache:
+    """
+    Small TTL + LRU cache of full analysis results, keyed by token address.
+
+    Used to answer shed requests with the most recent full analysis
+    rather than a cheap degraded estimate, and to hold prefetched
+    analyses. Thread-safe: prefetching runs outside the axon's loop.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token_address: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result with its age, or None if missing/stale."""
+        with self._lock:
+            entry = self._entries.get(token_address)
+            if entry is None:
+                return None
+
+            stored_at, result = entry
+            age = time.time() - stored_at
+            if age > self.ttl_seconds:
+                del self._entries[token_address]
+                return None
+
+            self._entries.move_to_end(token_address)
+        return {**result, "cache_age_seconds": round(age, 1)}
+
+    def put(self, token_address: str, result: Dict[str, Any]):
+        """Store a full analysis result, evicting the oldest if full."""
+        with self._lock:
+            self._entries[token_address] = (time.time(), result)
+            self._entries.move_to_end(token_address)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,470 @@
+"""
+RugIntel Snapshot Archive — Columnar, Memory-Mapped Feature History
+
+Fusion weights and layer thresholds can only be judged against what each
+layer actually saw at analysis time. The miner can append every analyzed
+token's feature record (rugintel.features) to an on-disk archive, label
+it later with ground truth, and backtests scan it without parsing JSON.
+
+Architecture:
+    - Columnar: each chunk is a directory with one .npy file per column
+      ("risk_score", "market.volume_ratio", ...), so a scan maps only the
+      columns it needs
+    - Chunked: the active chunk is preallocated (chunk_rows) and filled in
+      place through memory maps; it is sealed — trimmed to its row count —
+      when full or older than rotate_seconds
+    - The active chunk's row count is persisted on flush() and every
+      meta_interval_rows appends, not per record; rows past the persisted
+      count are rewritten after a crash
+    - Retention: sealed chunks beyond max_chunks or older than
+      retention_days are deleted, oldest first
+    - Outcomes live in a second archive with the same layout and are
+      joined to snapshots by address in one vectorized pass
+    - A persisted label cursor (chunk, row) lets each labelling pass scan
+      only the snapshots appended since the last one
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from rugintel import features
+
+logger = logging.getLogger(__name__)
+
+# Ground truth for an archived token (see GroundTruthVerifier)
+OUTCOME_DTYPE = np.dtype([
+    ("address", "S44"),
+    ("launch_timestamp", np.int64),
+    ("verified_at", np.int64),
+    ("is_rugpull", np.uint8),
+    ("liquidity_drained", np.uint8),
+    ("funds_moved", np.uint8),
+])
+
+
+def join_outcomes(records: np.ndarray,
+                  outcomes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pair feature records with the latest outcome for their address.
+
+    Records without an outcome are dropped.
+
+    Returns:
+        (feature records, outcome records), aligned row for row.
+    """
+    if not len(records) or not len(outcomes):
+        return records[:0], outcomes[:0]
+
+    # Latest outcome per address, then a sorted lookup per snapshot
+    order = np.lexsort((outcomes["verified_at"], outcomes["address"]))
+    outcomes = outcomes[order]
+    last = np.r_[outcomes["address"][1:] != outcomes["address"][:-1], True]
+    outcomes = outcomes[last]
+
+    index = np.searchsorted(outcomes["address"], records["address"])
+    index = np.clip(index, 0, len(outcomes) - 1)
+    matched = outcomes["address"][index] == records["address"]
+    return records[matched], outcomes[index[matched]]
+
+
+def flatten_dtype(dtype: np.dtype, prefix: str = "") -> List[Tuple[str, np.dtype]]:
+    """Leaf (column name, dtype) pairs; nested fields are joined with '.'."""
+    columns = []
+    for name in dtype.names:
+        field = dtype.fields[name][0]
+        if field.names:
+            columns.extend(flatten_dtype(field, f"{prefix}{name}."))
+        else:
+            columns.append((f"{prefix}{name}", field))
+    return columns
+
+
+def _leaf(records: np.ndarray, column: str) -> np.ndarray:
+    for key in column.split("."):
+        records = records[key]
+    return records
+
+
+class ColumnarArchive:
+    """
+    Append-only chunked column store for one structured dtype.
+
+    Thread-safe: the miner appends from the axon's thread and its own.
+    """
+
+    def __init__(self, directory: Path, dtype: np.dtype,
+                 chunk_rows: int = 65536, rotate_seconds: float = 86400,
+                 max_chunks: Optional[int] = None,
+                 retention_days: Optional[float] = None,
+                 meta_interval_rows: int = 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dtype = np.dtype(dtype)
+        self.columns = flatten_dtype(self.dtype)
+        self._dtype_tag = str(self.dtype.descr)
+        self.chunk_rows = max(1, chunk_rows)
+        self.rotate_seconds = rotate_seconds
+        self.max_chunks = max_chunks
+        self.retention_days = retention_days
+        self.meta_interval_rows = max(1, meta_interval_rows)
+
+        self._lock = threading.Lock()
+        self._active: Optional[Path] = None
+        self._active_meta: Dict = {}
+        self._persisted_rows = 0
+        self._maps: Dict[str, np.memmap] = {}
+
+        self._resume()
+        self._apply_retention()
+
+    # ── Chunks ─────────────────────────────────────────────
+
+    def chunks(self) -> List[Path]:
+        """Chunk directories, oldest first."""
+        return sorted(
+            path for path in self.directory.iterdir()
+            if path.is_dir() and path.name.startswith("chunk-")
+        )
+
+    @staticmethod
+    def _read_meta(chunk: Path) -> Dict:
+        try:
+            with open(chunk / "meta.json", "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_meta(chunk: Path, meta: Dict):
+        tmp_path = chunk / "meta.json.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, chunk / "meta.json")
+
+    def _chunk_rows(self, chunk: Path, meta: Dict) -> int:
+        """Row count of a chunk; the active chunk's may be ahead of disk."""
+        if chunk == self._active:
+            return self._active_meta["rows"]
+        return meta.get("rows", 0)
+
+    def _persist_active_meta(self):
+        if self._active is not None and self._active_meta["rows"] != self._persisted_rows:
+            self._write_meta(self._active, self._active_meta)
+            self._persisted_rows = self._active_meta["rows"]
+
+    def _resume(self):
+        """Reopen the newest unsealed chunk, if any."""
+        for chunk in reversed(self.chunks()):
+            meta = self._read_meta(chunk)
+            if not meta.get("sealed") and meta.get("dtype") == self._dtype_tag:
+                self._open_active(chunk, meta)
+                return
+
+    def _open_active(self, chunk: Path, meta: Dict):
+        self._active = chunk
+        self._active_meta = meta
+        self._persisted_rows = meta.get("rows", 0)
+        self._maps = {
+            name: open_memmap(chunk / f"{name}.npy", mode="r+")
+            for name, _ in self.columns
+        }
+
+    def _new_chunk(self):
+        created_at = int(time.time())
+        chunks = self.chunks()
+        seq = int(chunks[-1].name.rsplit("-", 1)[1]) + 1 if chunks else 0
+        chunk = self.directory / f"chunk-{created_at:010d}-{seq:06d}"
+        chunk.mkdir()
+        for name, dtype in self.columns:
+            column = open_memmap(chunk / f"{name}.npy", mode="w+",
+                                 dtype=dtype, shape=(self.chunk_rows,))
+            del column
+        meta = {
+            "rows": 0,
+            "sealed": False,
+            "created_at": created_at,
+            "dtype": self._dtype_tag,
+        }
+        self._write_meta(chunk, meta)
+        self._open_active(chunk, meta)
+
+    def _seal_active(self):
+        """Trim the active chunk to its row count and mark it read-only."""
+        chunk, rows = self._active, self._active_meta["rows"]
+        for name in list(self._maps):
+            column = self._maps.pop(name)
+            column.flush()
+            if rows < len(column):
+                trimmed = np.array(column[:rows])
+                del column
+                np.save(chunk / f"{name}.tmp.npy", trimmed)
+                os.replace(chunk / f"{name}.tmp.npy", chunk / f"{name}.npy")
+
+        self._active_meta["sealed"] = True
+        self._write_meta(chunk, self._active_meta)
+        self._active, self._active_meta = None, {}
+        logger.info(f"📦 Sealed archive chunk {chunk.name} ({rows} rows)")
+        self._apply_retention()
+
+    def _apply_retention(self):
+        sealed = [
+            chunk for chunk in self.chunks()
+            if self._read_meta(chunk).get("sealed")
+        ]
+        doomed = set()
+        if self.max_chunks is not None and len(sealed) > self.max_chunks:
+            doomed.update(sealed[:len(sealed) - self.max_chunks])
+        if self.retention_days is not None:
+            cutoff = time.time() - self.retention_days * 86400
+            doomed.update(
+                chunk for chunk in sealed
+                if self._read_meta(chunk).get("created_at", 0) < cutoff
+            )
+        for chunk in sorted(doomed):
+            shutil.rmtree(chunk, ignore_errors=True)
+            logger.info(f"🗑️ Dropped archive chunk {chunk.name} (retention)")
+
+    def _needs_rotation(self) -> bool:
+        if self._active is None:
+            return False
+        rows = self._active_meta["rows"]
+        age = time.time() - self._active_meta.get("created_at", 0)
+        return (rows >= self.chunk_rows
+                or bool(rows and self.rotate_seconds and age >= self.rotate_seconds))
+
+    # ── Writing ────────────────────────────────────────────
+
+    def append(self, records: np.ndarray):
+        """Append one record (0-d) or a batch (1-d) of self.dtype."""
+        records = np.atleast_1d(np.asarray(records, dtype=self.dtype))
+        with self._lock:
+            while records.size:
+                if self._needs_rotation():
+                    self._seal_active()
+                if self._active is None:
+                    self._new_chunk()
+
+                start = self._active_meta["rows"]
+                take = min(records.size, self.chunk_rows - start)
+                for name, _ in self.columns:
+                    self._maps[name][start:start + take] = _leaf(records[:take], name)
+
+                self._active_meta["rows"] = start + take
+                if start + take - self._persisted_rows >= self.meta_interval_rows:
+                    self._persist_active_meta()
+                records = records[take:]
+
+    def rotate(self):
+        """Seal the active chunk now (no-op if empty)."""
+        with self._lock:
+            if self._active is not None and self._active_meta["rows"]:
+                self._seal_active()
+
+    def flush(self):
+        """Write mapped pages and the row count of the active chunk to disk."""
+        with self._lock:
+            for column in self._maps.values():
+                column.flush()
+            self._persist_active_meta()
+
+    def close(self):
+        """Flush and release the active chunk (it stays unsealed)."""
+        with self._lock:
+            for column in self._maps.values():
+                column.flush()
+            self._persist_active_meta()
+            self._maps = {}
+            self._active, self._active_meta = None, {}
+
+    # ── Reading ────────────────────────────────────────────
+
+    def iter_chunks(self, columns: Optional[Sequence[str]] = None
+                    ) -> Iterator[Dict[str, np.ndarray]]:
+        """Per chunk, read-only memory maps of the requested columns."""
+        for _, _, data in self.scan(columns):
+            yield data
+
+    def scan(self, columns: Optional[Sequence[str]] = None,
+             since: Optional[Tuple[str, int]] = None
+             ) -> Iterator[Tuple[str, int, Dict[str, np.ndarray]]]:
+        """
+        (chunk name, first row, columns) for the rows at or after `since`.
+
+        `since` is a (chunk name, row) position; chunks older than it are
+        skipped without being opened. None scans everything.
+        """
+        names = list(columns) if columns is not None else [n for n, _ in self.columns]
+        for chunk in self.chunks():
+            start = 0
+            if since is not None:
+                if chunk.name < since[0]:
+                    continue
+                if chunk.name == since[0]:
+                    start = since[1]
+            meta = self._read_meta(chunk)
+            rows = self._chunk_rows(chunk, meta)
+            if rows <= start:
+                continue
+            if meta.get("dtype") != self._dtype_tag:
+                logger.warning(f"Skipping archive chunk {chunk.name}: different schema")
+                continue
+            yield chunk.name, start, {
+                name: np.load(chunk / f"{name}.npy", mmap_mode="r")[start:rows]
+                for name in names
+            }
+
+    def read(self, columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Requested columns across all chunks, concatenated."""
+        names = list(columns) if columns is not None else [n for n, _ in self.columns]
+        parts = list(self.iter_chunks(names))
+        return {
+            name: (np.concatenate([part[name] for part in parts]) if parts
+                   else np.empty(0, dtype=dict(self.columns)[name]))
+            for name in names
+        }
+
+    def read_records(self) -> np.ndarray:
+        """Every row as a self.dtype structured array."""
+        data = self.read()
+        n = len(next(iter(data.values()))) if data else 0
+        records = np.zeros(n, dtype=self.dtype)
+        for name, values in data.items():
+            _leaf(records, name)[...] = values
+        return records
+
+    def __len__(self) -> int:
+        return sum(
+            self._chunk_rows(chunk, self._read_meta(chunk)) for chunk in self.chunks()
+        )
+
+
+class SnapshotArchive:
+    """
+    Feature snapshots of analyzed tokens plus their ground-truth outcomes.
+
+    Layout under `directory`: snapshots/ (FEATURE_DTYPE columns) and
+    outcomes/ (OUTCOME_DTYPE columns).
+    """
+
+    def __init__(self, directory: Path, chunk_rows: int = 65536,
+                 rotate_seconds: float = 86400,
+                 max_chunks: Optional[int] = None,
+                 retention_days: Optional[float] = None):
+        self.directory = Path(directory)
+        limits = dict(chunk_rows=chunk_rows, rotate_seconds=rotate_seconds,
+                      max_chunks=max_chunks, retention_days=retention_days)
+        self.snapshots = ColumnarArchive(self.directory / "snapshots",
+                                         features.FEATURE_DTYPE, **limits)
+        self.outcomes = ColumnarArchive(self.directory / "outcomes",
+                                        OUTCOME_DTYPE, **limits)
+
+        # Snapshot rows before the cursor have all been through a labelling pass
+        self._cursor_path = self.directory / "label_cursor.json"
+        self._cursor = self._load_cursor()
+        self._next_cursor = self._cursor
+
+    def _load_cursor(self) -> Optional[Tuple[str, int]]:
+        try:
+            with open(self._cursor_path, "r") as f:
+                cursor = json.load(f)
+            return cursor["chunk"], int(cursor["row"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def record(self, record: np.ndarray):
+        """Archive one or more feature records."""
+        self.snapshots.append(record)
+
+    def record_outcomes(self, outcomes: Dict[str, Dict], launch_timestamps: Dict[str, int]):
+        """
+        Archive verified outcomes.
+
+        Args:
+            outcomes: address → GroundTruthVerifier result.
+            launch_timestamps: address → launch timestamp.
+        """
+        if not outcomes:
+            return
+        rows = np.zeros(len(outcomes), dtype=OUTCOME_DTYPE)
+        now = int(time.time())
+        for i, (address, outcome) in enumerate(outcomes.items()):
+            rows[i] = (
+                address.encode(), int(launch_timestamps.get(address, 0)), now,
+                bool(outcome.get("is_rugpull")),
+                bool(outcome.get("liquidity_drained")),
+                bool(outcome.get("funds_moved_to_exchange")),
+            )
+        self.outcomes.append(rows)
+
+    def unlabelled(self, older_than: float) -> List[Tuple[str, int]]:
+        """
+        (address, launch_timestamp) of archived tokens with no outcome yet.
+
+        Only snapshots past the label cursor are scanned. The cursor moves
+        to the first snapshot not yet due when mark_labelled() is called.
+        """
+        addresses, launches = [], []
+        cursor = self._cursor
+        settled = True
+        for chunk, start, snaps in self.snapshots.scan(
+            ["address", "launch_timestamp"], since=self._cursor
+        ):
+            due = snaps["launch_timestamp"] <= older_than
+            if settled:
+                waiting = np.flatnonzero(~due)
+                settled = not waiting.size
+                cursor = (chunk, start + int(waiting[0]) if waiting.size
+                          else start + len(due))
+            addresses.append(snaps["address"][due])
+            launches.append(snaps["launch_timestamp"][due])
+        self._next_cursor = cursor
+
+        if not addresses:
+            return []
+        addresses = np.concatenate(addresses)
+        launches = np.concatenate(launches)
+        candidates = np.unique(addresses)
+        labelled = self.outcomes.read(["address"])["address"]
+        missing = candidates[~np.isin(candidates, labelled)]
+
+        launch_of = dict(zip(addresses.tolist(), launches.tolist()))
+        return [(address.decode(), int(launch_of[address])) for address in missing.tolist()]
+
+    def mark_labelled(self):
+        """Persist the cursor found by the last unlabelled() call."""
+        if self._next_cursor is None or self._next_cursor == self._cursor:
+            return
+        # Rows behind the cursor (and their outcomes) must be on disk first
+        self.flush()
+        tmp_path = self._cursor_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"chunk": self._next_cursor[0], "row": self._next_cursor[1]}, f)
+        os.replace(tmp_path, self._cursor_path)
+        self._cursor = self._next_cursor
+
+    def joined(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Snapshots that have an outcome, with the outcome row for each.
+
+        Returns:
+            (feature records, outcome records), aligned row for row.
+        """
+        return join_outcomes(self.snapshots.read_records(),
+                             self.outcomes.read_records())
+
+    def flush(self):
+        self.snapshots.flush()
+        self.outcomes.flush()
+
+    def close(self):
+        self.snapshots.close()
+        self.outcomes.close()
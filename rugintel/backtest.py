@@ -0,0 +1,485 @@
+"""
+RugIntel Backtest — Re-score Archived Tokens under Alternative Settings
+
+Fusion weights and layer thresholds (WalletLayer.TOP_HOLDER_CRITICAL_PCT,
+MarketLayer.VOLUME_SPIKE_CRITICAL, the TemporalLayer windows, ...) are
+hand-picked. Instead of deploying a change and waiting a day for validator
+feedback, replay archived feature records (rugintel.features) with known
+outcomes (rugintel.archive) under many configurations at once.
+
+Architecture:
+    - A configuration is one value per parameter: "weights.<layer>" for
+      fusion weights, "<layer>.<CONSTANT>" for thresholds; unspecified
+      parameters keep the live value
+    - Wallet, market and temporal scores are recomputed from archived
+      features with the layers' rules as array expressions; other layers
+      (and rows whose features are missing) keep their archived score
+    - Layer scores are computed once per distinct threshold combination
+      and shared by every configuration that uses it
+    - Configurations are evaluated in blocks, so memory stays bounded
+      however many are swept
+    - Reported per configuration: mean validator accuracy
+      (GroundTruthVerifier.calculate_accuracy_batch), Brier score and
+      expected calibration error (ECE) of the fused risk score
+
+Weights are normalized to sum to 1 per configuration (the live weights
+already do), so sweeping a single weight stays on the same scale.
+
+Usage:
+    python -m rugintel.backtest --archive_dir ./archive \\
+        --grid wallet.TOP_HOLDER_CRITICAL_PCT=0.3:0.7:9 \\
+        --grid weights.temporal=0.1,0.2,0.3
+"""
+
+import argparse
+import itertools
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from rugintel import features
+from rugintel.archive import OUTCOME_DTYPE, SnapshotArchive, join_outcomes
+from rugintel.intelligence import TwelveLayerFusion
+from rugintel.layers.layer3_wallet import WalletLayer
+from rugintel.layers.layer4_market import MarketLayer
+from rugintel.layers.layer7_temporal import TemporalLayer
+from rugintel.verification import GroundTruthVerifier
+
+# Layer constants that can be swept, by layer
+THRESHOLDS = {
+    "wallet": (WalletLayer, (
+        "TOP_HOLDER_CRITICAL_PCT", "TOP_HOLDER_WARNING_PCT", "MIN_HOLDER_COUNT",
+    )),
+    "market": (MarketLayer, (
+        "VOLUME_SPIKE_CRITICAL", "VOLUME_SPIKE_WARNING", "LOW_LIQUIDITY_USD",
+    )),
+    "temporal": (TemporalLayer, (
+        "EXTREME_RISK_WINDOW", "HIGH_RISK_WINDOW", "MODERATE_RISK_WINDOW",
+        "LOW_RISK_WINDOW",
+    )),
+}
+
+METRICS = ("accuracy", "brier", "ece")
+
+# Score matrix elements (configurations × tokens) evaluated per block
+BLOCK_ELEMENTS = 1 << 22
+
+
+def default_parameters() -> Dict[str, float]:
+    """Every tunable parameter with its live value."""
+    params = {
+        f"weights.{name}": float(weight)
+        for name, weight in TwelveLayerFusion.LAYER_WEIGHTS.items()
+    }
+    for layer, (cls, constants) in THRESHOLDS.items():
+        for constant in constants:
+            params[f"{layer}.{constant}"] = float(getattr(cls, constant))
+    return params
+
+
+def expand(configs: Dict[str, Sequence[float]]) -> Dict[str, np.ndarray]:
+    """
+    Configurations as one float64 array (length n) per parameter.
+
+    Parameters missing from `configs` take their live value; scalars are
+    broadcast.
+
+    Raises:
+        ValueError: on an unknown parameter or mismatched lengths.
+    """
+    defaults = default_parameters()
+    unknown = set(configs) - set(defaults)
+    if unknown:
+        raise ValueError(f"Unknown backtest parameters: {sorted(unknown)}")
+
+    given = {name: np.atleast_1d(np.asarray(values, dtype=np.float64))
+             for name, values in configs.items()}
+    n = max((len(values) for values in given.values()), default=1)
+    expanded = {}
+    for name, default in defaults.items():
+        values = given.get(name, np.array([default]))
+        if len(values) not in (1, n):
+            raise ValueError(f"{name}: {len(values)} values for {n} configurations")
+        expanded[name] = np.broadcast_to(values, (n,)).copy()
+    return expanded
+
+
+def grid(axes: Dict[str, Sequence[float]], include_live: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Cartesian product of parameter values, as expand()ed configurations.
+
+    With include_live, configuration 0 is the live setup (the baseline).
+    """
+    names = list(axes)
+    product = list(itertools.product(*(axes[name] for name in names)))
+    configs = {name: [values[i] for values in product] for i, name in enumerate(names)}
+    if include_live:
+        defaults = default_parameters()
+        configs = {name: [defaults[name]] + values for name, values in configs.items()}
+    return expand(configs)
+
+
+# ── Layer rules as array expressions ───────────────────────
+#
+# Each mirrors the layer's _calculate_risk(). Thresholds come in as (U, 1)
+# columns, features as (N,) rows; the result is a (U, N) score table.
+# Features are stored as float32, so thresholds are compared in float32:
+# a value equal to a threshold stays equal.
+
+def _threshold(params: Dict[str, np.ndarray], name: str) -> np.ndarray:
+    return params[name].astype(np.float32)[:, None]
+
+
+def _wallet_scores(block: np.ndarray, params: Dict[str, np.ndarray]) -> np.ndarray:
+    top = block["top_holder_pct"]
+    top_5 = block["top_5_pct"]
+    holders = block["holder_count"]
+    critical = _threshold(params, "wallet.TOP_HOLDER_CRITICAL_PCT")
+    warning = _threshold(params, "wallet.TOP_HOLDER_WARNING_PCT")
+    minimum = _threshold(params, "wallet.MIN_HOLDER_COUNT")
+
+    score = np.where(top > critical, 0.9, np.where(top > warning, 0.7, 0.0))
+    score = np.maximum(score, np.where(top_5 > 0.80, 0.8,
+                                       np.where(top_5 > 0.60, 0.5, 0.0)))
+    few = holders < minimum
+    score = np.where(few, np.minimum(score + 0.15, 1.0), score)
+
+    flagged = (top > critical) | (top > warning) | (top_5 > 0.60) | few
+    return np.where(flagged, score, 0.15)
+
+
+def _market_scores(block: np.ndarray, params: Dict[str, np.ndarray]) -> np.ndarray:
+    volume_5m = block["volume_5m"].astype(np.float64)
+    volume_1h = block["volume_1h"].astype(np.float64)
+    liquidity = block["liquidity_usd"]
+    txns = block["txns_5m_buys"].astype(np.float64) + block["txns_5m_sells"]
+    price_5m = block["price_change_5m"]
+    critical = params["market.VOLUME_SPIKE_CRITICAL"][:, None]
+    warning = params["market.VOLUME_SPIKE_WARNING"][:, None]
+    low_liquidity = _threshold(params, "market.LOW_LIQUIDITY_USD")
+
+    # The unrounded ratio, as the layer compares it
+    average_5m = np.where(volume_1h > 0, volume_1h / 12, 1.0)
+    ratio = volume_5m / np.maximum(average_5m, 1.0)
+
+    score = np.where(ratio >= critical, 0.95, np.where(ratio >= warning, 0.6, 0.0))
+    score = np.maximum(score, np.where(liquidity < low_liquidity, 0.7,
+                                       np.where(liquidity < 20000, 0.4, 0.0)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wash = (txns > 0) & (volume_5m > 0) & (volume_5m / txns > 10000)
+    pump = price_5m > 200
+    score = np.where(wash, np.minimum(score + 0.2, 1.0), score)
+    score = np.where(pump, np.minimum(score + 0.2, 1.0), score)
+
+    flagged = (ratio >= np.minimum(critical, warning)) | (liquidity < 20000) \
+        | (liquidity < low_liquidity) | wash | pump
+    return np.where(flagged, score, 0.1)
+
+
+def _temporal_scores(block: np.ndarray, params: Dict[str, np.ndarray]) -> np.ndarray:
+    minutes = block["minutes_since_launch"]
+    price_5m = block["price_change_5m"]
+    price_1h = block["price_change_1h"]
+    hours = np.round(minutes.astype(np.float64) / 60, 2)
+
+    score = np.select(
+        [
+            minutes < 0,
+            minutes < _threshold(params, "temporal.EXTREME_RISK_WINDOW"),
+            minutes < _threshold(params, "temporal.HIGH_RISK_WINDOW"),
+            minutes < _threshold(params, "temporal.MODERATE_RISK_WINDOW"),
+            minutes < _threshold(params, "temporal.LOW_RISK_WINDOW"),
+        ],
+        [0.5, 0.95, 0.85, 0.6, 0.35],
+        default=np.maximum(0.1, 0.3 - hours * 0.01),
+    )
+
+    # Pump-dump trajectory (fixed 30 minute window in the layer)
+    early = (minutes > 0) & (minutes < 30)
+    score = np.where(early & (price_5m > 500), np.minimum(score + 0.1, 1.0), score)
+    dump = early & (price_5m < -50) & (price_1h > 100)
+    return np.where(dump, np.minimum(score + 0.15, 1.0), score)
+
+
+RESCORE_RULES = {
+    "wallet": _wallet_scores,
+    "market": _market_scores,
+    "temporal": _temporal_scores,
+}
+
+
+def layer_score_table(records: np.ndarray, layer: str,
+                      params: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One layer's scores under every configuration, deduplicated.
+
+    Returns:
+        (table, index): table is (U, N) with one row per distinct
+        threshold combination; configuration i scores as table[index[i]].
+    """
+    block = records[layer]
+    archived = block["score"].astype(np.float64)
+    n_configs = len(next(iter(params.values())))
+    if layer not in RESCORE_RULES:
+        return archived[None, :], np.zeros(n_configs, dtype=np.intp)
+
+    names = [f"{layer}.{constant}" for constant in THRESHOLDS[layer][1]]
+    combos, index = np.unique(np.stack([params[name] for name in names], axis=1),
+                              axis=0, return_inverse=True)
+    unique_params = {name: combos[:, i] for i, name in enumerate(names)}
+
+    table = np.round(RESCORE_RULES[layer](block, unique_params), 4)
+    # Rows the layer could not featurize (errors, placeholders) keep their score
+    present = np.logical_and.reduce([
+        np.isfinite(block[feature]) for feature in THRESHOLDS[layer][0].feature_names()
+    ])
+    return np.where(present, table, archived), index.reshape(-1)
+
+
+def risk_scores(records: np.ndarray, configs: Dict[str, np.ndarray],
+                tables: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None,
+                start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+    """
+    Fused risk scores for configurations [start:stop] — shape (C, N).
+
+    `tables` (from layer_score_table) can be passed to reuse them
+    across blocks.
+    """
+    configs = expand(configs)
+    if tables is None:
+        tables = {layer: layer_score_table(records, layer, configs)
+                  for layer in features.LAYER_CLASSES}
+    stop = len(configs["weights.social"]) if stop is None else stop
+
+    weights = np.stack([configs[f"weights.{layer}"][start:stop]
+                        for layer in features.LAYER_CLASSES], axis=1)
+    # Weights already summing to 1 are used as-is, so the live setup
+    # reproduces the miner's arithmetic (and its rounding) exactly
+    total = weights.sum(axis=1, keepdims=True)
+    weights = weights / np.where(np.isclose(total, 1.0), 1.0, total)
+
+    fused = np.zeros((stop - start, len(records)))
+    buffer = np.empty_like(fused)
+    for i, layer in enumerate(features.LAYER_CLASSES):
+        table, index = tables[layer]
+        if len(table) == 1:
+            np.multiply(weights[:, i, None], table, out=buffer)
+        else:
+            np.take(table, index[start:stop], axis=0, out=buffer)
+            buffer *= weights[:, i, None]
+        fused += buffer
+    np.clip(fused, 0.0, 1.0, out=fused)
+    # Half-way ties can round one unit apart from the miner's round()
+    return np.round(fused, 4, out=fused)
+
+
+def _outcome_kind(outcomes: np.ndarray) -> np.ndarray:
+    """0 for safe tokens, 1-4 for rugpulls by (liquidity_drained, funds_moved)."""
+    rugged = outcomes["is_rugpull"].astype(np.intp) > 0
+    severity = (outcomes["liquidity_drained"] > 0).astype(np.intp) \
+        + 2 * (outcomes["funds_moved"] > 0)
+    return np.where(rugged, 1 + severity, 0)
+
+
+def _columns(mask: np.ndarray):
+    """Column selector for `mask`: a slice (a view) when it is one run."""
+    indices = np.flatnonzero(mask)
+    if len(indices) and indices[-1] - indices[0] + 1 == len(indices):
+        return slice(indices[0], indices[-1] + 1)
+    return indices
+
+
+def mean_accuracy(risks: np.ndarray, outcomes: np.ndarray,
+                  verifier: Optional[GroundTruthVerifier] = None) -> np.ndarray:
+    """
+    Mean validator accuracy per configuration — risks is (C, N).
+
+    Fastest when tokens are grouped by outcome kind (evaluate() sorts
+    them), since each group is then a slice.
+    """
+    verifier = verifier or GroundTruthVerifier()
+    kind = _outcome_kind(outcomes)
+    total = np.zeros(len(risks))
+    # Severity bonuses depend on the outcome: one call per outcome kind
+    for value in np.unique(kind):
+        columns = _columns(kind == value)
+        severity = value - 1
+        if value == 0:
+            scores = verifier.calculate_accuracy_batch(risks[:, columns], False)
+        else:
+            scores = verifier.calculate_accuracy_batch(
+                risks[:, columns], True, bool(severity & 1), bool(severity & 2)
+            )
+        total += scores.sum(axis=1)
+    return total / risks.shape[1]
+
+
+def brier_score(risks: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """Mean squared error of risk against 0/1 outcomes, per configuration."""
+    positives = _columns(labels > 0)
+    squares = np.einsum("ij,ij->i", risks, risks)
+    return (squares - 2 * risks[:, positives].sum(axis=1)
+            + np.count_nonzero(labels > 0)) / risks.shape[1]
+
+
+def calibration_error(risks: np.ndarray, labels: np.ndarray, bins: int = 10) -> np.ndarray:
+    """Expected calibration error per configuration (equal-width bins)."""
+    n_configs, n = risks.shape
+    flat = (risks * bins).astype(np.intp)
+    np.minimum(flat, bins - 1, out=flat)
+    flat += np.arange(n_configs)[:, None] * bins
+    size = n_configs * bins
+    predicted = np.bincount(flat.ravel(), weights=risks.ravel(), minlength=size)
+    observed = np.bincount(flat[:, _columns(labels > 0)].ravel(), minlength=size)
+    gaps = np.abs(predicted - observed).reshape(n_configs, bins)
+    return gaps.sum(axis=1) / n
+
+
+def evaluate(records: np.ndarray, outcomes: np.ndarray,
+             configs: Dict[str, Sequence[float]], bins: int = 10) -> np.ndarray:
+    """
+    Score every configuration against known outcomes.
+
+    Args:
+        records: FEATURE_DTYPE records.
+        outcomes: OUTCOME_DTYPE rows aligned with records.
+        configs: parameter → values (see expand()).
+
+    Returns:
+        Structured array, one row per configuration: every parameter
+        plus accuracy (higher is better), brier and ece (lower is better).
+    """
+    configs = expand(configs)
+    names = list(configs)
+    n_configs = len(configs[names[0]])
+    results = np.zeros(n_configs, dtype=[(name, np.float64) for name in names + list(METRICS)])
+    for name in names:
+        results[name] = configs[name]
+    if not len(records):
+        for metric in METRICS:
+            results[metric] = np.nan
+        return results
+
+    # Group tokens by outcome so metric subsets are slices, not copies
+    order = np.argsort(_outcome_kind(outcomes), kind="stable")
+    records, outcomes = records[order], outcomes[order]
+
+    tables = {layer: layer_score_table(records, layer, configs)
+              for layer in features.LAYER_CLASSES}
+    labels = outcomes["is_rugpull"].astype(np.float64)
+    verifier = GroundTruthVerifier()
+    step = max(1, BLOCK_ELEMENTS // len(records))
+
+    for start in range(0, n_configs, step):
+        stop = min(start + step, n_configs)
+        risks = risk_scores(records, configs, tables, start, stop)
+        results["accuracy"][start:stop] = mean_accuracy(risks, outcomes, verifier)
+        results["brier"][start:stop] = brier_score(risks, labels)
+        results["ece"][start:stop] = calibration_error(risks, labels, bins)
+    return results
+
+
+def load_history(archive_dir: Optional[Path] = None,
+                 features_path: Optional[Path] = None,
+                 outcomes_path: Optional[Path] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Labelled feature records, from a SnapshotArchive directory or from a
+    features .npy (features.save) plus an outcomes .npy (OUTCOME_DTYPE).
+
+    Records missing a layer score are dropped.
+    """
+    if archive_dir is not None:
+        records, outcomes = SnapshotArchive(archive_dir).joined()
+    else:
+        outcomes = np.load(Path(outcomes_path), allow_pickle=False)
+        if outcomes.dtype != OUTCOME_DTYPE:
+            raise ValueError(f"{outcomes_path}: not an outcome file")
+        records, outcomes = join_outcomes(features.load(features_path), outcomes)
+
+    complete = np.logical_and.reduce([
+        np.isfinite(records[layer]["score"]) for layer in features.LAYER_CLASSES
+    ]) if len(records) else np.zeros(0, dtype=bool)
+    return records[complete], outcomes[complete]
+
+
+def _parse_axis(spec: str) -> Tuple[str, List[float]]:
+    """"name=a,b,c" or "name=start:stop:num" (inclusive linspace)."""
+    name, _, values = spec.partition("=")
+    if not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUES, got {spec!r}")
+    try:
+        if ":" in values:
+            start, stop, num = values.split(":")
+            return name, np.linspace(float(start), float(stop), int(num)).tolist()
+        return name, [float(value) for value in values.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad values in {spec!r}")
+
+
+def _format_row(row, columns: Sequence[str]) -> str:
+    return "  ".join(f"{row[column]:>{max(len(column), 8)}.4g}" for column in columns)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m rugintel.backtest",
+        description="Re-score archived tokens under alternative fusion "
+                    "weights and layer thresholds.",
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--archive_dir", type=Path,
+                        help="Miner snapshot archive (--archive_dir of the miner)")
+    source.add_argument("--features", type=Path,
+                        help="Feature records saved with rugintel.features.save")
+    parser.add_argument("--outcomes", type=Path,
+                        help="Outcome records (.npy, OUTCOME_DTYPE) for --features")
+    parser.add_argument("--grid", type=_parse_axis, action="append", default=[],
+                        metavar="NAME=VALUES",
+                        help="Values to sweep: a,b,c or start:stop:num. Repeat "
+                             "for a cartesian product. Names: "
+                             + ", ".join(default_parameters()))
+    parser.add_argument("--sort", choices=METRICS, default="accuracy",
+                        help="Metric to rank configurations by")
+    parser.add_argument("--bins", type=int, default=10,
+                        help="Calibration bins for ECE")
+    parser.add_argument("--top", type=int, default=10,
+                        help="Configurations to print")
+    parser.add_argument("--output", type=Path,
+                        help="Save every configuration's results (.npy)")
+    args = parser.parse_args(argv)
+
+    if args.features is not None and args.outcomes is None:
+        parser.error("--features requires --outcomes")
+
+    records, outcomes = load_history(args.archive_dir, args.features, args.outcomes)
+    if not len(records):
+        print("No labelled records to backtest.", file=sys.stderr)
+        return 1
+
+    try:
+        configs = grid(dict(args.grid))
+    except ValueError as e:
+        parser.error(str(e))
+    results = evaluate(records, outcomes, configs, bins=args.bins)
+    if args.output is not None:
+        np.save(args.output, results, allow_pickle=False)
+
+    swept = [name for name, _ in args.grid]
+    columns = swept + list(METRICS)
+    order = np.argsort(-results[args.sort] if args.sort == "accuracy" else results[args.sort],
+                       kind="stable")
+
+    rugpulls = int(outcomes["is_rugpull"].sum())
+    print(f"{len(records)} labelled records ({rugpulls} rugpulls), "
+          f"{len(results)} configurations")
+    print("  ".join(f"{column:>{max(len(column), 8)}}" for column in columns))
+    print(_format_row(results[0], columns) + "   (live)")
+    for i in order[:args.top]:
+        print(_format_row(results[i], columns))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
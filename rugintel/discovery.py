@@ -0,0 +1,435 @@
+"""
+RugIntel Token Discovery — Streaming New-Launch Sources
+
+The first minutes after launch are the highest-risk window, so validators
+need every new token as soon as it is visible, not a handful per cycle.
+
+Architecture:
+    - Each source is an async generator: it polls its upstream at a fixed
+      cadence and yields token records as soon as they are seen
+    - SeenSet (a rotating pair of hash sets) drops tokens already emitted,
+      with memory bounded by its capacity; sources sharing one SeenSet
+      never emit the same launch twice
+    - RaydiumPoolDiscovery reads pool initializations straight from the
+      chain, minutes before an indexer such as DexScreener lists the pair
+    - merge_streams() interleaves several sources into one stream
+    - Token records share the shape used across the validator:
+      {"address", "name", "symbol", "timestamp", "source"}
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from rugintel.ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class SeenSet:
+    """
+    Approximate "seen recently" set with bounded memory.
+
+    Keys live in a current and a previous generation; when the current one
+    reaches half the capacity it becomes the previous one and the oldest
+    generation is dropped. A key is remembered for at least capacity / 2
+    insertions.
+    """
+
+    def __init__(self, capacity: int = 100_000):
+        self.capacity = max(2, capacity)
+        self._current: set = set()
+        self._previous: set = set()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._current or key in self._previous
+
+    def add(self, key: str) -> bool:
+        """Insert a key; returns True if it was not seen before."""
+        if key in self:
+            return False
+
+        if len(self._current) >= self.capacity // 2:
+            self._previous = self._current
+            self._current = set()
+        self._current.add(key)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
+
+
+class DexScreenerDiscovery:
+    """
+    Stream newly created Solana pairs from DexScreener.
+
+    Every pair in each poll is inspected; pairs older than `max_age`
+    seconds and tokens already in the seen-set are skipped.
+    """
+
+    DEXSCREENER_BASE = "https://api.dexscreener.com/latest/dex"
+
+    def __init__(self, poll_interval: float = 15.0, max_age: float = 3600.0,
+                 seen: Optional[SeenSet] = None):
+        self.poll_interval = poll_interval
+        self.max_age = max_age
+        self.seen = seen if seen is not None else SeenSet()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+        return self._session
+
+    async def _fetch_pairs(self) -> List[Dict[str, Any]]:
+        session = await self._get_session()
+        async with session.get(f"{self.DEXSCREENER_BASE}/pairs/solana") as resp:
+            if resp.status != 200:
+                logger.warning(f"DexScreener discovery returned {resp.status}")
+                return []
+            data = await resp.json()
+        return data.get("pairs") or []
+
+    def _new_tokens(self, pairs: List[Dict[str, Any]],
+                    now: float) -> List[Dict[str, Any]]:
+        """Recent, unseen tokens in one page of pairs."""
+        cutoff_ms = (now - self.max_age) * 1000
+
+        tokens = []
+        for pair in pairs:
+            created = pair.get("pairCreatedAt") or 0
+            if created <= cutoff_ms:
+                continue
+
+            base_token = pair.get("baseToken") or {}
+            address = base_token.get("address", "")
+            if not address or not self.seen.add(address):
+                continue
+
+            tokens.append({
+                "address": address,
+                "name": base_token.get("name", ""),
+                "symbol": base_token.get("symbol", ""),
+                "timestamp": int(created / 1000),
+                "source": "dexscreener",
+            })
+
+        return tokens
+
+    async def poll_once(self) -> List[Dict[str, Any]]:
+        """One poll: every new token not emitted before."""
+        return self._new_tokens(await self._fetch_pairs(), time.time())
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield each new launch once, polling every `poll_interval` seconds."""
+        while True:
+            start_time = time.time()
+            try:
+                tokens = await self.poll_once()
+            except Exception as e:
+                logger.error(f"DexScreener discovery failed: {e}")
+                tokens = []
+
+            for token in tokens:
+                yield token
+
+            elapsed = time.time() - start_time
+            await asyncio.sleep(max(0.0, self.poll_interval - elapsed))
+
+    async def close(self):
+        """Close HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+
+class RaydiumPoolDiscovery:
+    """
+    Stream token launches from Raydium AMM v4 pool initializations.
+
+    Each poll pages getSignaturesForAddress back to the last signature
+    seen, fetches the new transactions in JSON-RPC batches and decodes
+    `initialize2` instructions into token records. The default address
+    is the pool-creation fee account, which only `initialize2` touches,
+    so swaps on the AMM are never paged or fetched.
+
+    The newest processed signature is checkpointed to disk so restarts
+    resume where they left off; without a checkpoint only the most
+    recent page is read. A transaction that could not be fetched holds
+    the checkpoint before it, so the next poll retries it.
+    """
+
+    RAYDIUM_AMM_V4 = "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
+    RAYDIUM_POOL_FEE = "7YttLkHDoNj9wyDur5pM1ejNaAvT9X4eqaYcHQqtj2G5"
+    WSOL_MINT = "So11111111111111111111111111111111111111112"
+
+    # initialize2 account layout: amm pool at 4, coin / pc mints at 8 / 9
+    INIT_ACCOUNTS = 21
+    AMM_INDEX = 4
+    COIN_MINT_INDEX = 8
+    PC_MINT_INDEX = 9
+
+    def __init__(self, rpc_url: Optional[str] = None,
+                 poll_interval: float = 5.0,
+                 checkpoint_path: Optional[Path] = None,
+                 seen: Optional[SeenSet] = None,
+                 address: Optional[str] = None,
+                 page_size: int = 1000, max_pages: int = 10,
+                 batch_size: int = 50, rps: float = 10.0):
+        self.rpc_url = rpc_url or os.getenv(
+            "SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com"
+        )
+        self.poll_interval = poll_interval
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.seen = seen if seen is not None else SeenSet()
+        self.address = address or self.RAYDIUM_POOL_FEE
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.batch_size = batch_size
+        self.rate_limit = RateLimiter(rps)
+
+        self.last_signature: Optional[str] = self._load_checkpoint()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    # ── Checkpoint ─────────────────────────────────────────
+
+    def _load_checkpoint(self) -> Optional[str]:
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return None
+        try:
+            with open(self.checkpoint_path, "r") as f:
+                return json.load(f).get("last_signature")
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load Raydium checkpoint: {e}")
+            return None
+
+    def _save_checkpoint(self):
+        if self.checkpoint_path is None:
+            return
+        try:
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.checkpoint_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"last_signature": self.last_signature}, f)
+            os.replace(tmp_path, self.checkpoint_path)
+        except OSError as e:
+            logger.error(f"Failed to save Raydium checkpoint: {e}")
+
+    # ── RPC ────────────────────────────────────────────────
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+        return self._session
+
+    async def _rpc(self, method: str, params: list) -> Any:
+        """One JSON-RPC call; raises on an RPC error."""
+        await self.rate_limit.acquire()
+        session = await self._get_session()
+        async with session.post(
+            self.rpc_url,
+            json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params},
+            headers={"Content-Type": "application/json"},
+        ) as resp:
+            data = await resp.json()
+
+        if "error" in data:
+            raise RuntimeError(f"{method} failed: {data['error']}")
+        return data.get("result")
+
+    async def _rpc_batch(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """A JSON-RPC batch; missing or errored entries come back as None."""
+        await self.rate_limit.acquire()
+        session = await self._get_session()
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        async with session.post(
+            self.rpc_url,
+            json=payload,
+            headers={"Content-Type": "application/json"},
+        ) as resp:
+            data = await resp.json()
+
+        if isinstance(data, dict):
+            data = [data]
+        by_id = {
+            entry.get("id"): entry.get("result") for entry in data
+            if isinstance(entry, dict)
+        }
+        return [by_id.get(i) for i in range(len(calls))]
+
+    # ── Decoding ───────────────────────────────────────────
+
+    @classmethod
+    def decode_pool_init(cls, tx: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Token record for a Raydium pool-initialization transaction.
+
+        Expects a jsonParsed getTransaction result. Returns None for any
+        other transaction (swaps, deposits, failed transactions).
+        """
+        if not tx:
+            return None
+
+        meta = tx.get("meta") or {}
+        if meta.get("err") is not None:
+            return None
+        if not any("initialize2" in line for line in meta.get("logMessages") or []):
+            return None
+
+        transaction = tx.get("transaction") or {}
+        instructions = list(
+            (transaction.get("message") or {}).get("instructions") or []
+        )
+        # Launchpads create pools through CPI, so check inner instructions too
+        for inner in meta.get("innerInstructions") or []:
+            instructions.extend(inner.get("instructions") or [])
+
+        for ix in instructions:
+            accounts = ix.get("accounts") or []
+            if (ix.get("programId") != cls.RAYDIUM_AMM_V4
+                    or len(accounts) < cls.INIT_ACCOUNTS):
+                continue
+
+            coin_mint = accounts[cls.COIN_MINT_INDEX]
+            pc_mint = accounts[cls.PC_MINT_INDEX]
+            mint = pc_mint if coin_mint == cls.WSOL_MINT else coin_mint
+            signatures = transaction.get("signatures") or [""]
+
+            return {
+                "address": mint,
+                "name": "",
+                "symbol": "",
+                "timestamp": int(tx.get("blockTime") or time.time()),
+                "source": "raydium",
+                "pool": accounts[cls.AMM_INDEX],
+                "signature": signatures[0],
+            }
+
+        return None
+
+    # ── Polling ────────────────────────────────────────────
+
+    async def _new_signatures(self) -> List[Dict[str, Any]]:
+        """Signatures newer than the checkpoint, newest first."""
+        collected: List[Dict[str, Any]] = []
+        before = None
+        max_pages = self.max_pages if self.last_signature else 1
+
+        for _ in range(max_pages):
+            options: Dict[str, Any] = {"limit": self.page_size}
+            if self.last_signature:
+                options["until"] = self.last_signature
+            if before:
+                options["before"] = before
+
+            page = await self._rpc(
+                "getSignaturesForAddress", [self.address, options]
+            ) or []
+            collected.extend(page)
+
+            if len(page) < self.page_size:
+                break
+            before = page[-1]["signature"]
+        else:
+            if self.last_signature:
+                logger.warning(
+                    f"Raydium discovery fell more than {max_pages} pages "
+                    f"behind — skipping older signatures"
+                )
+
+        return collected
+
+    async def poll_once(self) -> List[Dict[str, Any]]:
+        """One poll: tokens from pools initialized since the checkpoint."""
+        entries = await self._new_signatures()
+        if not entries:
+            return []
+
+        # Oldest first, so tokens are emitted in launch order
+        ordered = list(reversed(entries))
+        to_fetch = [
+            i for i, entry in enumerate(ordered) if entry.get("err") is None
+        ]
+
+        tokens = []
+        processed = len(ordered)  # Leading entries fully handled
+        for start in range(0, len(to_fetch), self.batch_size):
+            chunk = to_fetch[start:start + self.batch_size]
+            txs = await self._rpc_batch([
+                ("getTransaction", [ordered[i]["signature"], {
+                    "encoding": "jsonParsed",
+                    "maxSupportedTransactionVersion": 0,
+                }])
+                for i in chunk
+            ])
+            for i, tx in zip(chunk, txs):
+                if tx is None:
+                    processed = i  # Missing, errored or rate limited
+                    break
+                token = self.decode_pool_init(tx)
+                if token is not None and self.seen.add(token["address"]):
+                    tokens.append(token)
+            if processed < len(ordered):
+                logger.warning(
+                    f"Raydium discovery could not fetch "
+                    f"{ordered[processed]['signature'][:16]}... — "
+                    f"retrying from there next poll"
+                )
+                break
+
+        # Only advance past transactions that have been processed
+        if processed:
+            self.last_signature = ordered[processed - 1]["signature"]
+            self._save_checkpoint()
+        return tokens
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield each new pool's token once, polling every `poll_interval`."""
+        while True:
+            start_time = time.time()
+            try:
+                tokens = await self.poll_once()
+            except Exception as e:
+                logger.error(f"Raydium discovery failed: {e}")
+                tokens = []
+
+            for token in tokens:
+                yield token
+
+            elapsed = time.time() - start_time
+            await asyncio.sleep(max(0.0, self.poll_interval - elapsed))
+
+    async def close(self):
+        """Close HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+
+async def merge_streams(*streams: AsyncIterator[Dict[str, Any]]
+                        ) -> AsyncIterator[Dict[str, Any]]:
+    """Interleave several discovery streams, yielding items as they arrive."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+    async def pump(stream):
+        async for item in stream:
+            await queue.put(item)
+
+    tasks = [asyncio.create_task(pump(stream)) for stream in streams]
+    try:
+        while True:
+            yield await queue.get()
+    finally:
+        for task in tasks:
+            task.cancel()
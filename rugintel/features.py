@@ -0,0 +1,171 @@
+"""
+RugIntel Feature Schema — Fixed-Layout Numeric Features per Token
+
+Every layer's signals (top_holder_pct, volume_ratio, minutes_since_launch,
+rugcheck_score, similarity scores, ...) are kept as a small float array
+per LayerResult. For batch scoring, backtests and offline analysis they
+are copied into one structured NumPy record per token, so thousands of
+tokens stack into a contiguous array that can be saved and memory-mapped
+— no JSON parsing.
+
+Layout (FEATURE_SCHEMA_VERSION = 1):
+
+    schema_version     u2    layout version of the record
+    address            S44   token mint (base58)
+    launch_timestamp   i8    unix seconds
+    analyzed_at        i8    unix seconds
+    risk_score         f8    fused score
+    confidence         f8    fused confidence
+    <layer>            one nested block per layer, in fusion order:
+        score          f8
+        confidence     f8
+        failed         u1    1 if the layer errored
+        <feature>      f4    one column per entry of the layer's FEATURES
+
+    social:    total_tweets, new_accounts, shill_keywords, low_follower_bots
+    liquidity: lp_found, lp_locked, lock_duration_hours
+    wallet:    top_holder_pct, top_5_pct, top_10_pct, holder_count
+    market:    volume_5m, volume_1h, volume_ratio, liquidity_usd,
+               price_change_5m, txns_5m_buys, txns_5m_sells
+    contract:  rugcheck_score, mint_authority, freeze_authority, honeypot,
+               total_risks
+    visual:    name_match_similarity, symbol_match_similarity
+    temporal:  minutes_since_launch, price_change_5m, price_change_1h,
+               fomo_phase
+
+Booleans are stored as 0/1; unavailable values are NaN. Scores stay
+float64 so thresholds (e.g. > 0.8) see the exact value the miner sent.
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from rugintel.layers.layer1_social import SocialLayer
+from rugintel.layers.layer2_liquidity import LiquidityLayer
+from rugintel.layers.layer3_wallet import WalletLayer
+from rugintel.layers.layer4_market import MarketLayer
+from rugintel.layers.layer5_contract import ContractLayer
+from rugintel.layers.layer6_visual import VisualLayer
+from rugintel.layers.layer7_temporal import TemporalLayer
+
+FEATURE_SCHEMA_VERSION = 1
+
+# Layer classes in fusion order (TwelveLayerFusion.LAYER_NAMES)
+LAYER_CLASSES = {
+    "social": SocialLayer,
+    "liquidity": LiquidityLayer,
+    "wallet": WalletLayer,
+    "market": MarketLayer,
+    "contract": ContractLayer,
+    "visual": VisualLayer,
+    "temporal": TemporalLayer,
+}
+
+
+def _layer_dtype(layer_cls) -> np.dtype:
+    return np.dtype(
+        [("score", np.float64), ("confidence", np.float64), ("failed", np.uint8)]
+        + [(name, np.float32) for name in layer_cls.feature_names()]
+    )
+
+
+FEATURE_DTYPE = np.dtype([
+    ("schema_version", np.uint16),
+    ("address", "S44"),
+    ("launch_timestamp", np.int64),
+    ("analyzed_at", np.int64),
+    ("risk_score", np.float64),
+    ("confidence", np.float64),
+] + [(name, _layer_dtype(cls)) for name, cls in LAYER_CLASSES.items()])
+
+
+def empty(n: int) -> np.ndarray:
+    """n blank feature records: current version, NaN values, no address."""
+    records = np.zeros(n, dtype=FEATURE_DTYPE)
+    records["schema_version"] = FEATURE_SCHEMA_VERSION
+    records["risk_score"] = np.nan
+    records["confidence"] = np.nan
+    for name, cls in LAYER_CLASSES.items():
+        block = records[name]
+        block["score"] = np.nan
+        block["confidence"] = np.nan
+        for feature in cls.feature_names():
+            block[feature] = np.nan
+    return records
+
+
+def to_record(token_address: str, launch_timestamp: int,
+              result: Dict[str, Any],
+              analyzed_at: Optional[int] = None) -> np.ndarray:
+    """
+    One token's analysis result as a 0-d FEATURE_DTYPE record.
+
+    `result` is a TwelveLayerFusion.analyze() result (its `layers` are
+    read; no evidence dicts are built).
+    """
+    record = empty(1)
+    record["address"] = token_address.encode()
+    record["launch_timestamp"] = int(launch_timestamp)
+    record["analyzed_at"] = int(analyzed_at if analyzed_at is not None else time.time())
+    record["risk_score"] = _number(result.get("risk_score"))
+    record["confidence"] = _number(result.get("confidence"))
+
+    layer_results = result.get("layers") or {}
+    for name, cls in LAYER_CLASSES.items():
+        layer_result = layer_results.get(name)
+        if layer_result is None:
+            continue
+        record[name] = (
+            layer_result.score,
+            layer_result.confidence,
+            1 if layer_result.error else 0,
+            *cls.feature_values(layer_result).tolist(),
+        )
+
+    return record.reshape(())
+
+
+def _number(value) -> float:
+    return np.nan if value is None else float(value)
+
+
+def stack(records: Iterable[np.ndarray]) -> np.ndarray:
+    """Contiguous (n,) array from individual records."""
+    records = [np.asarray(record, dtype=FEATURE_DTYPE).reshape(()) for record in records]
+    if not records:
+        return empty(0)
+    return np.stack(records)
+
+
+def save(path: Path, records: np.ndarray):
+    """Write records as a .npy file (memory-mappable with load())."""
+    np.save(Path(path), np.asarray(records, dtype=FEATURE_DTYPE), allow_pickle=False)
+
+
+def load(path: Path, mmap: bool = True) -> np.ndarray:
+    """
+    Read records saved with save(), memory-mapped by default.
+
+    Raises:
+        ValueError: if the file was written under a different schema.
+    """
+    records = np.load(Path(path), mmap_mode="r" if mmap else None,
+                      allow_pickle=False)
+    check_schema(records)
+    return records
+
+
+def check_schema(records: np.ndarray):
+    """Raise ValueError unless `records` use the current feature layout."""
+    if records.dtype == FEATURE_DTYPE:
+        return
+    version = "unknown"
+    if records.dtype.names and "schema_version" in records.dtype.names and len(records):
+        version = int(records["schema_version"][0])
+    raise ValueError(
+        f"Feature schema mismatch: data is version {version}, "
+        f"expected {FEATURE_SCHEMA_VERSION}"
+    )
@@ -6,7 +6,8 @@ applies weighted fusion, and produces a composite risk assessment.
 
 Architecture:
     - All layers run off-chain via asyncio.gather()
-    - Each layer returns a LayerResult (score, confidence, evidence)
+    - Each layer returns a LayerResult (score, confidence, FEATURES values)
+    - Evidence dicts are built only for the detail level a response needs
     - Weighted average produces the final risk_score
     - Confidence is computed from layer agreement
 """
@@ -14,9 +15,11 @@ Architecture:
 import asyncio
 import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 
+from rugintel import features
 from rugintel.layers.base import LayerResult
+from rugintel.layers.reasons import render_evidence
 from rugintel.layers.layer1_social import SocialLayer
 from rugintel.layers.layer2_liquidity import LiquidityLayer
 from rugintel.layers.layer3_wallet import WalletLayer
@@ -27,6 +30,15 @@ from rugintel.layers.layer7_temporal import TemporalLayer
 
 logger = logging.getLogger(__name__)
 
+# Evidence detail levels a validator can request (see RugIntelSynapse)
+EVIDENCE_NONE = "none"
+EVIDENCE_COMPACT = "compact"
+EVIDENCE_FULL = "full"
+EVIDENCE_LEVELS = (EVIDENCE_NONE, EVIDENCE_COMPACT, EVIDENCE_FULL)
+
+# Compact-evidence code for a shed response's degraded_mode (0 = full analysis)
+DEGRADED_MODE_CODES = {"cache": 1.0, "fast": 2.0}
+
 
 class TwelveLayerFusion:
     """
@@ -75,7 +87,9 @@ class TwelveLayerFusion:
     async def analyze(self, token_address: str,
                       launch_timestamp: int = 0,
                       token_name: str = "",
-                      token_symbol: str = "") -> Dict[str, Any]:
+                      token_symbol: str = "",
+                      on_layer: Optional[Callable[[str, LayerResult], Awaitable[None]]] = None,
+                      ) -> Dict[str, Any]:
         """
         Run all 7 layers in parallel and fuse results.
 
@@ -84,28 +98,40 @@ class TwelveLayerFusion:
             launch_timestamp: Unix timestamp of token launch.
             token_name: Token name (for Layer 6 typosquatting check).
             token_symbol: Token symbol (for Layer 6).
+            on_layer: Optional async callback, awaited with (name, result)
+                as each layer finishes — used to stream partial results.
 
         Returns:
-            Dict with risk_score, confidence, evidence, time_to_rugpull.
+            Dict with risk_score, confidence, layers (LayerResult per
+            layer, see evidence_at_level) and time_to_rugpull.
         """
         start_time = time.time()
 
+        async def run_layer(name: str, call: Awaitable[LayerResult]) -> LayerResult:
+            result = await call
+            if on_layer is not None:
+                try:
+                    await on_layer(name, result)
+                except Exception as e:
+                    logger.warning(f"Layer callback failed for {name}: {e}")
+            return result
+
         # Run all layers in parallel — this is the core of off-chain computation
         results = await asyncio.gather(
-            self.layers["social"].safe_analyze(token_address),
-            self.layers["liquidity"].safe_analyze(token_address),
-            self.layers["wallet"].safe_analyze(token_address),
-            self.layers["market"].safe_analyze(token_address),
-            self.layers["contract"].safe_analyze(token_address),
-            self.layers["visual"].safe_analyze(
+            run_layer("social", self.layers["social"].safe_analyze(token_address)),
+            run_layer("liquidity", self.layers["liquidity"].safe_analyze(token_address)),
+            run_layer("wallet", self.layers["wallet"].safe_analyze(token_address)),
+            run_layer("market", self.layers["market"].safe_analyze(token_address)),
+            run_layer("contract", self.layers["contract"].safe_analyze(token_address)),
+            run_layer("visual", self.layers["visual"].safe_analyze(
                 token_address,
                 token_name=token_name,
                 token_symbol=token_symbol,
-            ),
-            self.layers["temporal"].safe_analyze(
+            )),
+            run_layer("temporal", self.layers["temporal"].safe_analyze(
                 token_address,
                 launch_timestamp=launch_timestamp,
-            ),
+            )),
         )
 
         # Map results to layer names
@@ -117,9 +143,6 @@ class TwelveLayerFusion:
         # Calculate overall confidence
         confidence = self._calculate_confidence(layer_results)
 
-        # Compile evidence from all layers
-        evidence = self._compile_evidence(layer_results)
-
         # Estimate time to rugpull
         time_to_rugpull = self._estimate_timing(layer_results, fused_score)
 
@@ -133,11 +156,67 @@ class TwelveLayerFusion:
         return {
             "risk_score": fused_score,
             "confidence": confidence,
-            "evidence": evidence,
+            "layers": layer_results,
             "time_to_rugpull": time_to_rugpull,
             "analysis_time_seconds": round(elapsed, 3),
         }
 
+    async def analyze_fast(self, token_address: str,
+                           launch_timestamp: int = 0,
+                           token_name: str = "",
+                           token_symbol: str = "") -> Dict[str, Any]:
+        """
+        Fast, low-confidence assessment from cheap (offline) layers only.
+
+        Used when the miner is overloaded. Network-bound layers are
+        replaced by a neutral zero-confidence placeholder, so the fused
+        score leans on temporal and visual signals and confidence stays low.
+
+        Returns:
+            Same shape as analyze().
+        """
+        start_time = time.time()
+
+        cheap_results = {
+            "visual": await self.layers["visual"].safe_analyze(
+                token_address,
+                token_name=token_name,
+                token_symbol=token_symbol,
+            ),
+            "temporal": self.layers["temporal"].analyze_offline(
+                launch_timestamp
+            ),
+        }
+
+        layer_results = {
+            name: cheap_results.get(name) or LayerResult(
+                score=0.5, confidence=0.0,
+                details={"skipped": "degraded mode"},
+            )
+            for name in self.LAYER_NAMES
+        }
+
+        fused_score = self._fuse_scores(layer_results)
+        elapsed = time.time() - start_time
+
+        return {
+            "risk_score": fused_score,
+            "confidence": self._calculate_confidence(layer_results),
+            "layers": layer_results,
+            "time_to_rugpull": self._estimate_timing(layer_results, fused_score),
+            "analysis_time_seconds": round(elapsed, 3),
+        }
+
+    def feature_record(self, token_address: str, launch_timestamp: int,
+                       result: Dict[str, Any]):
+        """
+        An analyze() result as a fixed-layout numeric record.
+
+        See rugintel.features for the (versioned) layout; records from
+        many tokens stack with features.stack().
+        """
+        return features.to_record(token_address, launch_timestamp, result)
+
     def _fuse_scores(self, layer_results: Dict[str, LayerResult]) -> float:
         """
         Combine layer scores using weighted average.
@@ -186,9 +265,51 @@ class TwelveLayerFusion:
         confidence = min(max(weighted_conf - error_penalty, 0.0), 1.0)
         return round(confidence, 4)
 
-    def _compile_evidence(self,
-                           layer_results: Dict[str, LayerResult]) -> Dict[str, Any]:
+    def _compile_evidence(self, layer_results: Dict[str, LayerResult],
+                          level: str = EVIDENCE_FULL) -> Optional[Dict[str, Any]]:
         """Compile evidence from all layers into a single dict."""
+        return self.evidence_at_level({"layers": layer_results}, level)
+
+    def evidence_at_level(self, result: Optional[Dict[str, Any]],
+                          level: str) -> Optional[Dict[str, Any]]:
+        """
+        Evidence of an analyze() result at the requested detail level.
+
+        none:    None
+        compact: per layer, score / confidence / failed plus the layer's
+                 FEATURES as floats, and top-level `shed` / `degraded`
+                 flags — fixed keys, no strings
+        full:    every layer's evidence dict, with reason codes rendered
+                 to text (also used for unknown levels)
+
+        Only the full level builds evidence dicts; compact reads the
+        layers' FEATURES arrays directly.
+        """
+        if level == EVIDENCE_NONE or result is None:
+            return None
+        layer_results = result.get("layers") or {}
+        if level != EVIDENCE_COMPACT:
+            evidence = self._full_evidence(layer_results)
+            for flag in ("shed", "degraded_mode"):
+                if flag in result:
+                    evidence[flag] = result[flag]
+            return render_evidence(evidence)
+
+        compact = {}
+        for name, layer in self.layers.items():
+            layer_result = layer_results.get(name)
+            compact[name] = {
+                "score": layer_result.score if layer_result else None,
+                "confidence": layer_result.confidence if layer_result else None,
+                "failed": 1.0 if layer_result and layer_result.error else 0.0,
+                **layer.compact_evidence(layer_result),
+            }
+        compact["shed"] = 1.0 if result.get("shed") else 0.0
+        compact["degraded"] = DEGRADED_MODE_CODES.get(result.get("degraded_mode"), 0.0)
+        return compact
+
+    def _full_evidence(self,
+                       layer_results: Dict[str, LayerResult]) -> Dict[str, Any]:
         evidence = {}
         for name, result in layer_results.items():
             evidence[name] = {
@@ -214,11 +335,11 @@ class TwelveLayerFusion:
         if fused_score < 0.5:
             return None  # Low risk — no timing estimate needed
 
-        temporal_evidence = layer_results.get("temporal", LayerResult()).evidence
-        minutes_since = temporal_evidence.get("minutes_since_launch", -1)
-        risk_window = temporal_evidence.get("risk_window", "UNKNOWN")
+        temporal = layer_results.get("temporal", LayerResult())
+        minutes_since = temporal.feature("minutes_since_launch")
+        risk_window = temporal.details.get("risk_window", "UNKNOWN")
 
-        if minutes_since < 0:
+        if minutes_since is None or minutes_since < 0:
             return None
 
         # Heuristic timing estimate based on risk window
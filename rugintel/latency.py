@@ -0,0 +1,149 @@
+"""
+RugIntel Miner Latency Tracking
+
+How fast a miner answers a fresh-launch question is part of the value of
+its intelligence, so validators record every query's round trip.
+
+Architecture:
+    - Each dendrite response is classified as ok / timeout / error
+    - MinerLatencyTracker keeps per-uid counters, an EMA of latency and
+      a bounded window of recent latencies for percentiles (a timeout
+      counts as at least the timeout it hit)
+    - summaries() gives operators (and later scoring) a per-uid view
+    - timeout_for() derives each miner's query timeout from its own
+      history, clamped to global bounds
+"""
+
+import logging
+from collections import deque
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_ERROR = "error"
+
+
+def classify_status(status_code: Optional[int]) -> str:
+    """Map a dendrite status code to ok / timeout / error."""
+    try:
+        code = int(status_code)
+    except (TypeError, ValueError):
+        return STATUS_ERROR
+
+    if code == 200:
+        return STATUS_OK
+    if code == 408:
+        return STATUS_TIMEOUT
+    return STATUS_ERROR
+
+
+class _UidStats:
+    """Latency counters for a single uid."""
+
+    __slots__ = ("queries", "ok", "timeouts", "errors", "consecutive_timeouts",
+                 "ema", "recent")
+
+    def __init__(self, window: int):
+        self.queries = 0
+        self.ok = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.consecutive_timeouts = 0
+        self.ema: Optional[float] = None
+        self.recent: deque = deque(maxlen=window)
+
+
+class MinerLatencyTracker:
+    """
+    Per-uid round-trip latency and failure statistics.
+
+    Successful responses feed the latency EMA. The percentile window also
+    takes timeouts, as a sample of at least the timeout that was hit —
+    otherwise the timeout would censor exactly the slow answers it needs
+    to see. Errors (fast refusals, bad responses) say nothing about
+    latency and are only counted.
+
+    Adaptive timeouts:
+    - No history yet → max_timeout (give a new miner the full window)
+    - Otherwise → p90 latency × TIMEOUT_MARGIN, clamped to the bounds
+    - Each consecutive timeout multiplies that by BACKOFF_FACTOR (up to
+      max_timeout), so a miner that slowed down is given longer until it
+      answers again instead of being cut off for good
+    """
+
+    TIMEOUT_MARGIN = 1.5
+    BACKOFF_FACTOR = 2.0
+
+    def __init__(self, window: int = 50, ema_alpha: float = 0.2,
+                 min_timeout: float = 5.0, max_timeout: float = 30.0):
+        self.window = window
+        self.ema_alpha = ema_alpha
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._stats: Dict[int, _UidStats] = {}
+
+    def record(self, uid: int, latency: float, status: str,
+               timeout: Optional[float] = None):
+        """
+        Record one query's outcome for a uid.
+
+        `timeout` is the timeout the query ran with; a timed-out query is
+        sampled at no less than that.
+        """
+        stats = self._stats.get(uid)
+        if stats is None:
+            stats = self._stats[uid] = _UidStats(self.window)
+
+        stats.queries += 1
+        if status == STATUS_OK:
+            stats.ok += 1
+            stats.consecutive_timeouts = 0
+            stats.recent.append(latency)
+            if stats.ema is None:
+                stats.ema = latency
+            else:
+                stats.ema += self.ema_alpha * (latency - stats.ema)
+        elif status == STATUS_TIMEOUT:
+            stats.timeouts += 1
+            stats.consecutive_timeouts += 1
+            stats.recent.append(max(latency, timeout or 0.0))
+        else:
+            stats.errors += 1
+
+    def timeout_for(self, uid: int) -> float:
+        """Query timeout for a uid, derived from its own latency history."""
+        stats = self._stats.get(uid)
+        if stats is None or not stats.recent:
+            return self.max_timeout
+
+        p90 = float(np.percentile(np.asarray(stats.recent), 90))
+        timeout = max(p90 * self.TIMEOUT_MARGIN, self.min_timeout)
+        timeout *= self.BACKOFF_FACTOR ** min(stats.consecutive_timeouts, 16)
+        return round(min(max(timeout, self.min_timeout), self.max_timeout), 2)
+
+    def summary(self, uid: int) -> Dict[str, Any]:
+        """Latency and failure summary for one uid."""
+        stats = self._stats.get(uid)
+        if stats is None:
+            return {"queries": 0}
+
+        recent = np.asarray(stats.recent, dtype=np.float64)
+        return {
+            "queries": stats.queries,
+            "ok": stats.ok,
+            "timeouts": stats.timeouts,
+            "errors": stats.errors,
+            "timeout_rate": round(stats.timeouts / stats.queries, 4),
+            "latency_ema": round(stats.ema, 3) if stats.ema is not None else None,
+            "latency_p50": round(float(np.percentile(recent, 50)), 3) if recent.size else None,
+            "latency_p90": round(float(np.percentile(recent, 90)), 3) if recent.size else None,
+            "timeout": self.timeout_for(uid),
+        }
+
+    def summaries(self) -> Dict[int, Dict[str, Any]]:
+        """Summaries for every uid seen so far."""
+        return {uid: self.summary(uid) for uid in sorted(self._stats)}
@@ -5,30 +5,78 @@ Each layer must implement the `analyze()` method and return a LayerResult.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 from abc import ABC, abstractmethod
 
 import aiohttp
 import logging
+import numpy as np
+
+from rugintel.layers.reasons import Reasons
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class LayerResult:
-    """Standard result from any intelligence layer."""
+    """
+    Standard result from any intelligence layer.
+
+    Slotted to keep per-call allocation small. The layer's FEATURES are
+    stored as a float array and its reasons as codes; the evidence dict
+    is only built when something reads `evidence` (a full-detail
+    response), with reasons rendered to text when serialized.
+    """
     score: float = 0.0
     """Risk score from this layer (0.0 = safe, 1.0 = high risk)."""
 
     confidence: float = 0.0
     """How confident is this layer in its score (0.0 - 1.0)."""
 
-    evidence: Dict[str, Any] = field(default_factory=dict)
-    """Supporting evidence/data that led to this score."""
+    features: Optional[np.ndarray] = None
+    """The layer's FEATURES values (float64, NaN = unavailable), or None."""
+
+    feature_paths: Tuple[str, ...] = ()
+    """FEATURES of the layer that filled `features`, in the same order."""
+
+    reasons: Reasons = field(default_factory=Reasons)
+    """The layer's reason codes (empty if it recorded none)."""
+
+    details: Dict[str, Any] = field(default_factory=dict)
+    """Non-numeric supporting evidence (notes, matches, risk window)."""
 
     error: Optional[str] = None
     """Error message if the layer failed to analyze."""
 
+    def feature(self, path: str) -> Optional[float]:
+        """One FEATURES value by path, None if unavailable."""
+        if self.features is None or path not in self.feature_paths:
+            return None
+        value = float(self.features[self.feature_paths.index(path)])
+        return None if np.isnan(value) else value
+
+    @property
+    def evidence(self) -> Dict[str, Any]:
+        """
+        Supporting evidence as a dict, built on each access.
+
+        Details, FEATURES values at their (dotted) paths and reasons.
+        """
+        evidence = dict(self.details)
+        if self.features is not None:
+            evidence["score"] = self.score
+            for path, value in zip(self.feature_paths, self.features.tolist()):
+                *parents, key = path.split(".")
+                node = evidence
+                for parent in parents:
+                    child = dict(node.get(parent) or {})
+                    node[parent] = child
+                    node = child
+                node[key] = None if np.isnan(value) else value
+        if self.reasons:
+            evidence["reasons"] = self.reasons
+        return evidence
+
 
 class BaseLayer(ABC):
     """
@@ -41,6 +89,14 @@ class BaseLayer(ABC):
     4. Returns a LayerResult with score, confidence, and evidence
     """
 
+    FEATURES: Tuple[str, ...] = ()
+    """
+    Numeric evidence this layer exposes, in schema order: the columns of
+    its block in rugintel.features and the keys of compact evidence.
+    Nested values use dotted paths (e.g. "txns_5m.buys"). Changing this
+    changes the feature layout — bump FEATURE_SCHEMA_VERSION.
+    """
+
     def __init__(self):
         self._session: Optional[aiohttp.ClientSession] = None
 
@@ -52,6 +108,50 @@ class BaseLayer(ABC):
             )
         return self._session
 
+    @classmethod
+    def feature_names(cls) -> Tuple[str, ...]:
+        """FEATURES as flat names (dotted paths keyed with underscores)."""
+        return tuple(path.replace(".", "_") for path in cls.FEATURES)
+
+    def _result(self, score: float, confidence: float,
+                features: Sequence[Any], reasons: Optional[Reasons] = None,
+                **details) -> LayerResult:
+        """
+        A LayerResult carrying this layer's FEATURES.
+
+        `features` are the values in FEATURES order; booleans become
+        0.0 / 1.0 and None becomes NaN.
+        """
+        return LayerResult(
+            score=score,
+            confidence=confidence,
+            features=np.array(features, dtype=np.float64),
+            feature_paths=self.FEATURES,
+            reasons=reasons if reasons is not None else Reasons(),
+            details=details,
+        )
+
+    @classmethod
+    def feature_values(cls, result: Optional[LayerResult]) -> np.ndarray:
+        """A result's FEATURES values, all NaN if it has none."""
+        if result is None or result.features is None:
+            return np.full(len(cls.FEATURES), np.nan)
+        return result.features
+
+    @classmethod
+    def compact_evidence(cls, result: Optional[LayerResult]) -> Dict[str, Optional[float]]:
+        """
+        FEATURES of a result as floats, keyed by feature name.
+
+        Every feature key is always present (None when unavailable).
+        Dotted paths are keyed with underscores.
+        """
+        return {
+            name: None if np.isnan(value) else value
+            for name, value in zip(cls.feature_names(),
+                                   cls.feature_values(result).tolist())
+        }
+
     async def close(self):
         """Close the HTTP session."""
         if self._session and not self._session.closed:
@@ -83,6 +183,5 @@ class BaseLayer(ABC):
             return LayerResult(
                 score=0.5,  # Neutral score on failure
                 confidence=0.0,  # Zero confidence
-                evidence={},
                 error=str(e),
             )
@@ -15,6 +15,7 @@ import logging
 from typing import Optional
 
 from rugintel.layers.base import BaseLayer, LayerResult
+from rugintel.layers.reasons import ReasonCode, Reasons
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,11 @@ class SocialLayer(BaseLayer):
     Weight: 0.07 (noisy but valuable when correlated with other layers)
     """
 
+    FEATURES = (
+        "total_tweets", "new_accounts", "shill_keywords",
+        "low_follower_bots",
+    )
+
     def __init__(self):
         super().__init__()
         self.twitter_bearer = os.getenv("TWITTER_BEARER_TOKEN", "")
@@ -54,7 +60,7 @@ class SocialLayer(BaseLayer):
             return LayerResult(
                 score=0.3,  # Slight baseline risk (most new tokens are shilled)
                 confidence=0.1,  # Very low confidence without real data
-                evidence={
+                details={
                     "source": "heuristic_fallback",
                     "reason": "No Twitter API key configured",
                 },
@@ -82,12 +88,12 @@ class SocialLayer(BaseLayer):
                     # Rate limited — return neutral
                     return LayerResult(
                         score=0.3, confidence=0.1,
-                        evidence={"error": "Twitter rate limited"},
+                        details={"error": "Twitter rate limited"},
                     )
                 if resp.status != 200:
                     return LayerResult(
                         score=0.3, confidence=0.1,
-                        evidence={"error": f"Twitter API error: {resp.status}"},
+                        details={"error": f"Twitter API error: {resp.status}"},
                     )
 
                 data = await resp.json()
@@ -100,26 +106,20 @@ class SocialLayer(BaseLayer):
             if not tweets:
                 return LayerResult(
                     score=0.1, confidence=0.3,
-                    evidence={"tweet_count": 0, "assessment": "No social activity"},
+                    details={"tweet_count": 0, "assessment": "No social activity"},
                 )
 
             # Analyze patterns
-            pump_signals = self._detect_pump_signals(tweets, users)
-
-            return LayerResult(
-                score=pump_signals["score"],
-                confidence=pump_signals["confidence"],
-                evidence=pump_signals,
-            )
+            return self._detect_pump_signals(tweets, users)
 
         except Exception as e:
             logger.error(f"Twitter API error: {e}")
             return LayerResult(
                 score=0.3, confidence=0.1,
-                evidence={"error": str(e)},
+                details={"error": str(e)},
             )
 
-    def _detect_pump_signals(self, tweets: list, users: dict) -> dict:
+    def _detect_pump_signals(self, tweets: list, users: dict) -> LayerResult:
         """
         Analyze tweet patterns for coordinated pump activity.
 
@@ -170,43 +170,39 @@ class SocialLayer(BaseLayer):
 
         # Score calculation
         score = 0.0
-        reasons = []
+        reasons = Reasons()
 
         # >10 new accounts posting = strong pump signal
         if new_account_count >= 10:
             score += 0.4
-            reasons.append(f"{new_account_count} new accounts (<30 days)")
+            reasons.add(ReasonCode.SOCIAL_NEW_ACCOUNTS_MANY, count=new_account_count)
         elif new_account_count >= 5:
             score += 0.2
-            reasons.append(f"{new_account_count} new accounts")
+            reasons.add(ReasonCode.SOCIAL_NEW_ACCOUNTS, count=new_account_count)
 
         # Shill keywords ratio
         shill_ratio = shill_keyword_count / max(total_tweets, 1)
         if shill_ratio > 0.5:
             score += 0.3
-            reasons.append(f"High shill keyword ratio: {shill_ratio:.0%}")
+            reasons.add(ReasonCode.SOCIAL_SHILL_HIGH, ratio=shill_ratio)
         elif shill_ratio > 0.2:
             score += 0.15
-            reasons.append(f"Moderate shill keywords: {shill_ratio:.0%}")
+            reasons.add(ReasonCode.SOCIAL_SHILL_MODERATE, ratio=shill_ratio)
 
         # Low follower bot activity
         bot_ratio = low_follower_count / max(total_tweets, 1)
         if bot_ratio > 0.6:
             score += 0.3
-            reasons.append(f"Likely bot activity: {bot_ratio:.0%} low-follower")
+            reasons.add(ReasonCode.SOCIAL_BOTS_LIKELY, ratio=bot_ratio)
         elif bot_ratio > 0.3:
             score += 0.15
-            reasons.append(f"Some bot activity: {bot_ratio:.0%} low-follower")
+            reasons.add(ReasonCode.SOCIAL_BOTS_SOME, ratio=bot_ratio)
 
         score = min(score, 1.0)
         confidence = min(0.3 + (total_tweets / 100) * 0.5, 0.8)
 
-        return {
-            "score": round(score, 4),
-            "confidence": round(confidence, 4),
-            "total_tweets": total_tweets,
-            "new_accounts": new_account_count,
-            "shill_keywords": shill_keyword_count,
-            "low_follower_bots": low_follower_count,
-            "reasons": reasons,
-        }
+        return self._result(
+            round(score, 4), round(confidence, 4),
+            [total_tweets, new_account_count, shill_keyword_count, low_follower_count],
+            reasons,
+        )
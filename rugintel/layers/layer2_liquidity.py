@@ -17,6 +17,7 @@ import time
 import logging
 
 from rugintel.layers.base import BaseLayer, LayerResult
+from rugintel.layers.reasons import ReasonCode, Reasons
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,10 @@ class LiquidityLayer(BaseLayer):
     Data source: Solana RPC (getAccountInfo, getTokenLargestAccounts)
     """
 
+    FEATURES = (
+        "lp_found", "lp_locked", "lock_duration_hours",
+    )
+
     # Known Raydium AMM program ID
     RAYDIUM_AMM_V4 = "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
 
@@ -63,21 +68,15 @@ class LiquidityLayer(BaseLayer):
             lock_status = await self._check_lp_lock(session, lp_info)
 
             # Step 3: Calculate risk score
-            score, evidence = self._calculate_risk(lp_info, lock_status)
-
-            confidence = 0.7 if lp_info.get("pool_found") else 0.3
-
-            return LayerResult(
-                score=score,
-                confidence=confidence,
-                evidence=evidence,
-            )
+            result = self._calculate_risk(lp_info, lock_status)
+            result.confidence = 0.7 if lp_info.get("pool_found") else 0.3
+            return result
 
         except Exception as e:
             logger.error(f"Liquidity layer error: {e}")
             return LayerResult(
                 score=0.5, confidence=0.1,
-                evidence={"error": str(e)},
+                details={"error": str(e)},
             )
 
     async def _get_lp_accounts(self, session, token_address: str) -> dict:
@@ -165,7 +164,7 @@ class LiquidityLayer(BaseLayer):
             logger.error(f"Failed to check LP lock: {e}")
             return {"locked": False, "error": str(e)}
 
-    def _calculate_risk(self, lp_info: dict, lock_status: dict) -> tuple:
+    def _calculate_risk(self, lp_info: dict, lock_status: dict) -> LayerResult:
         """
         Calculate liquidity risk score.
 
@@ -177,39 +176,34 @@ class LiquidityLayer(BaseLayer):
         - LP locked > 30 days → 0.1 (low risk)
         """
         score = 0.0
-        reasons = []
+        reasons = Reasons()
 
         if not lp_info.get("pool_found"):
             score = 0.8
-            reasons.append("No liquidity pool found")
+            reasons.add(ReasonCode.LP_NOT_FOUND)
         elif not lock_status.get("locked"):
             score = 0.9
-            reasons.append("LP tokens NOT locked — can be drained anytime")
+            reasons.add(ReasonCode.LP_NOT_LOCKED)
         else:
             lock_hours = lock_status.get("lock_duration_hours")
             if lock_hours is not None:
                 if lock_hours < 72:
                     score = 0.7
-                    reasons.append(
-                        f"LP locked for only {lock_hours}h (<72h threshold)"
-                    )
+                    reasons.add(ReasonCode.LP_LOCK_SHORT, hours=lock_hours)
                 elif lock_hours < 720:  # 30 days
                     score = 0.3
-                    reasons.append(f"LP locked for {lock_hours}h (moderate)")
+                    reasons.add(ReasonCode.LP_LOCK_MODERATE, hours=lock_hours)
                 else:
                     score = 0.1
-                    reasons.append(f"LP locked for {lock_hours}h (long-term)")
+                    reasons.add(ReasonCode.LP_LOCK_LONG, hours=lock_hours)
             else:
                 score = 0.4
-                reasons.append("LP locked but duration unknown")
-
-        evidence = {
-            "score": round(score, 4),
-            "lp_found": lp_info.get("pool_found", False),
-            "lp_locked": lock_status.get("locked", False),
-            "lock_duration_hours": lock_status.get("lock_duration_hours"),
-            "largest_lp_account": lp_info.get("largest_account", ""),
-            "reasons": reasons,
-        }
-
-        return round(score, 4), evidence
+                reasons.add(ReasonCode.LP_LOCK_UNKNOWN)
+
+        return self._result(
+            round(score, 4), 0.0,
+            [lp_info.get("pool_found", False), lock_status.get("locked", False),
+             lock_status.get("lock_duration_hours")],
+            reasons,
+            largest_lp_account=lp_info.get("largest_account", ""),
+        )
@@ -14,6 +14,7 @@ import os
 import logging
 
 from rugintel.layers.base import BaseLayer, LayerResult
+from rugintel.layers.reasons import ReasonCode, Reasons
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,10 @@ class WalletLayer(BaseLayer):
     Data source: Solana RPC (getTokenLargestAccounts, getSignaturesForAddress)
     """
 
+    FEATURES = (
+        "top_holder_pct", "top_5_pct", "top_10_pct", "holder_count",
+    )
+
     # Threshold constants
     TOP_HOLDER_CRITICAL_PCT = 0.50  # >50% = high risk
     TOP_HOLDER_WARNING_PCT = 0.30   # >30% = moderate risk
@@ -61,19 +66,15 @@ class WalletLayer(BaseLayer):
             concentration = self._calculate_concentration(holders, supply)
 
             # Calculate final score
-            score, evidence = self._calculate_risk(concentration)
-
-            return LayerResult(
-                score=score,
-                confidence=0.6 if holders else 0.2,
-                evidence=evidence,
-            )
+            result = self._calculate_risk(concentration)
+            result.confidence = 0.6 if holders else 0.2
+            return result
 
         except Exception as e:
             logger.error(f"Wallet layer error: {e}")
             return LayerResult(
                 score=0.5, confidence=0.1,
-                evidence={"error": str(e)},
+                details={"error": str(e)},
             )
 
     async def _get_top_holders(self, session, token_address: str) -> list:
@@ -153,7 +154,7 @@ class WalletLayer(BaseLayer):
             "holder_count": len(holders),
         }
 
-    def _calculate_risk(self, concentration: dict) -> tuple:
+    def _calculate_risk(self, concentration: dict) -> LayerResult:
         """
         Calculate wallet concentration risk score.
 
@@ -164,7 +165,7 @@ class WalletLayer(BaseLayer):
         - <50 holders = additional risk boost
         """
         score = 0.0
-        reasons = []
+        reasons = Reasons()
 
         top_pct = concentration.get("top_holder_pct", 0)
         top_5_pct = concentration.get("top_5_pct", 0)
@@ -173,37 +174,37 @@ class WalletLayer(BaseLayer):
         # Top holder concentration
         if top_pct > self.TOP_HOLDER_CRITICAL_PCT:
             score = max(score, 0.9)
-            reasons.append(
-                f"CRITICAL: Top wallet holds {top_pct:.0%} of supply (>{self.TOP_HOLDER_CRITICAL_PCT:.0%})"
-            )
+            reasons.add(ReasonCode.WALLET_TOP_HOLDER_CRITICAL, pct=top_pct,
+                        threshold=self.TOP_HOLDER_CRITICAL_PCT)
         elif top_pct > self.TOP_HOLDER_WARNING_PCT:
             score = max(score, 0.7)
-            reasons.append(
-                f"WARNING: Top wallet holds {top_pct:.0%} of supply"
-            )
+            reasons.add(ReasonCode.WALLET_TOP_HOLDER_WARNING, pct=top_pct)
 
         # Top 5 concentration
         if top_5_pct > 0.80:
             score = max(score, 0.8)
-            reasons.append(f"Top 5 wallets hold {top_5_pct:.0%} of supply")
+            reasons.add(ReasonCode.WALLET_TOP5_CRITICAL, pct=top_5_pct)
         elif top_5_pct > 0.60:
             score = max(score, 0.5)
-            reasons.append(f"Top 5 wallets hold {top_5_pct:.0%}")
+            reasons.add(ReasonCode.WALLET_TOP5_WARNING, pct=top_5_pct)
 
         # Few holders
         if holder_count < self.MIN_HOLDER_COUNT:
             score = min(score + 0.15, 1.0)
-            reasons.append(f"Only {holder_count} holders (< {self.MIN_HOLDER_COUNT})")
+            reasons.add(ReasonCode.WALLET_FEW_HOLDERS, count=holder_count,
+                        minimum=self.MIN_HOLDER_COUNT)
 
         # Default low risk
         if not reasons:
             score = 0.15
-            reasons.append("Healthy holder distribution")
+            reasons.add(ReasonCode.WALLET_HEALTHY)
 
-        evidence = {
-            "score": round(score, 4),
-            **concentration,
-            "reasons": reasons,
-        }
+        details = {}
+        if "top_holder_address" in concentration:
+            details["top_holder_address"] = concentration["top_holder_address"]
 
-        return round(score, 4), evidence
+        return self._result(
+            round(score, 4), 0.0,
+            [concentration.get(path) for path in self.FEATURES],
+            reasons, **details,
+        )
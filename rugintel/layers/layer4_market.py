@@ -14,6 +14,7 @@ import time
 import logging
 
 from rugintel.layers.base import BaseLayer, LayerResult
+from rugintel.layers.reasons import ReasonCode, Reasons
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,11 @@ class MarketLayer(BaseLayer):
     Data source: DexScreener API (free, no key required)
     """
 
+    FEATURES = (
+        "volume_5m", "volume_1h", "volume_ratio", "liquidity_usd",
+        "price_change_5m", "txns_5m.buys", "txns_5m.sells",
+    )
+
     DEXSCREENER_BASE = "https://api.dexscreener.com/latest/dex"
 
     # Thresholds
@@ -55,22 +61,18 @@ class MarketLayer(BaseLayer):
             if not market_data:
                 return LayerResult(
                     score=0.6, confidence=0.2,
-                    evidence={"error": "Token not found on DexScreener"},
+                    details={"error": "Token not found on DexScreener"},
                 )
 
-            score, evidence = self._calculate_risk(market_data)
-
-            return LayerResult(
-                score=score,
-                confidence=0.65,
-                evidence=evidence,
-            )
+            result = self._calculate_risk(market_data)
+            result.confidence = 0.65
+            return result
 
         except Exception as e:
             logger.error(f"Market layer error: {e}")
             return LayerResult(
                 score=0.5, confidence=0.1,
-                evidence={"error": str(e)},
+                details={"error": str(e)},
             )
 
     async def _fetch_dexscreener(self, session, token_address: str) -> dict:
@@ -141,14 +143,14 @@ class MarketLayer(BaseLayer):
             logger.error(f"DexScreener fetch error: {e}")
             return {}
 
-    def _calculate_risk(self, data: dict) -> tuple:
+    def _calculate_risk(self, data: dict) -> LayerResult:
         """
         Calculate market anomaly risk score.
 
         Key rule: Volume >100× in 2 minutes = 94% pump&dump
         """
         score = 0.0
-        reasons = []
+        reasons = Reasons()
 
         volume_5m = data.get("volume_5m", 0)
         volume_1h = data.get("volume_1h", 0)
@@ -164,24 +166,20 @@ class MarketLayer(BaseLayer):
 
         if volume_ratio >= self.VOLUME_SPIKE_CRITICAL:
             score = max(score, 0.95)
-            reasons.append(
-                f"CRITICAL: Volume spike {volume_ratio:.0f}× "
-                f"(>{self.VOLUME_SPIKE_CRITICAL}× = 94% pump&dump)"
-            )
+            reasons.add(ReasonCode.MARKET_VOLUME_SPIKE_CRITICAL, ratio=volume_ratio,
+                        threshold=self.VOLUME_SPIKE_CRITICAL)
         elif volume_ratio >= self.VOLUME_SPIKE_WARNING:
             score = max(score, 0.6)
-            reasons.append(f"Volume spike {volume_ratio:.0f}× (suspicious)")
+            reasons.add(ReasonCode.MARKET_VOLUME_SPIKE, ratio=volume_ratio)
 
         # 2. Low liquidity
         if liquidity < self.LOW_LIQUIDITY_USD:
             score = max(score, 0.7)
-            reasons.append(
-                f"Very low liquidity: ${liquidity:,.0f} "
-                f"(<${self.LOW_LIQUIDITY_USD:,})"
-            )
+            reasons.add(ReasonCode.MARKET_LIQUIDITY_VERY_LOW, liquidity=liquidity,
+                        threshold=self.LOW_LIQUIDITY_USD)
         elif liquidity < 20000:
             score = max(score, 0.4)
-            reasons.append(f"Low liquidity: ${liquidity:,.0f}")
+            reasons.add(ReasonCode.MARKET_LIQUIDITY_LOW, liquidity=liquidity)
 
         # 3. Wash trading detection (high volume, few transactions)
         total_txns_5m = buys_5m + sells_5m
@@ -189,28 +187,20 @@ class MarketLayer(BaseLayer):
             vol_per_txn = volume_5m / total_txns_5m
             if vol_per_txn > 10000:  # >$10K per transaction average
                 score = min(score + 0.2, 1.0)
-                reasons.append(
-                    f"Possible wash trading: ${vol_per_txn:,.0f} avg per txn"
-                )
+                reasons.add(ReasonCode.MARKET_WASH_TRADING, per_txn=vol_per_txn)
 
         # 4. Extreme price pump (often before dump)
         if price_change_5m > 200:  # >200% in 5 min
             score = min(score + 0.2, 1.0)
-            reasons.append(f"Extreme price pump: +{price_change_5m:.0f}% in 5min")
+            reasons.add(ReasonCode.MARKET_PRICE_PUMP, pct=price_change_5m)
 
         if not reasons:
             score = 0.1
-            reasons.append("Normal market activity")
-
-        evidence = {
-            "score": round(score, 4),
-            "volume_5m": volume_5m,
-            "volume_1h": volume_1h,
-            "volume_ratio": round(volume_ratio, 1),
-            "liquidity_usd": liquidity,
-            "price_change_5m": price_change_5m,
-            "txns_5m": {"buys": buys_5m, "sells": sells_5m},
-            "reasons": reasons,
-        }
-
-        return round(score, 4), evidence
+            reasons.add(ReasonCode.MARKET_NORMAL)
+
+        return self._result(
+            round(score, 4), 0.0,
+            [volume_5m, volume_1h, round(volume_ratio, 1), liquidity,
+             price_change_5m, buys_5m, sells_5m],
+            reasons,
+        )
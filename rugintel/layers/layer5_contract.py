@@ -14,6 +14,7 @@ import os
 import logging
 
 from rugintel.layers.base import BaseLayer, LayerResult
+from rugintel.layers.reasons import ReasonCode, Reasons
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,11 @@ class ContractLayer(BaseLayer):
     Data source: RugCheck.xyz API (free)
     """
 
+    FEATURES = (
+        "rugcheck_score", "mint_authority", "freeze_authority", "honeypot",
+        "total_risks",
+    )
+
     RUGCHECK_BASE = "https://api.rugcheck.xyz/v1"
 
     # Risk flags from RugCheck
@@ -62,26 +68,23 @@ class ContractLayer(BaseLayer):
             if not report:
                 return LayerResult(
                     score=0.6, confidence=0.2,
-                    evidence={
+                    details={
                         "error": "Token not found on RugCheck",
                         "note": "Unlisted tokens are inherently riskier",
                     },
                 )
 
-            score, evidence = self._parse_report(report)
+            result = self._parse_report(report)
 
             # RugCheck has 22% false negative — cap confidence
-            return LayerResult(
-                score=score,
-                confidence=0.65,  # Never 100% — known 22% false negative
-                evidence=evidence,
-            )
+            result.confidence = 0.65  # Never 100% — known 22% false negative
+            return result
 
         except Exception as e:
             logger.error(f"Contract layer error: {e}")
             return LayerResult(
                 score=0.5, confidence=0.1,
-                evidence={"error": str(e)},
+                details={"error": str(e)},
             )
 
     async def _fetch_rugcheck(self, session, token_address: str) -> dict:
@@ -102,7 +105,7 @@ class ContractLayer(BaseLayer):
             logger.error(f"RugCheck API error: {e}")
             return {}
 
-    def _parse_report(self, report: dict) -> tuple:
+    def _parse_report(self, report: dict) -> LayerResult:
         """
         Parse RugCheck report into risk score.
 
@@ -111,7 +114,7 @@ class ContractLayer(BaseLayer):
         - score: overall risk score (0-100, higher = safer)
         """
         score = 0.0
-        reasons = []
+        reasons = Reasons()
 
         # Check for risks/flags
         risks = report.get("risks", [])
@@ -124,50 +127,44 @@ class ContractLayer(BaseLayer):
 
         if has_mint:
             score += 0.35
-            reasons.append("CRITICAL: Mint authority active — can create unlimited tokens")
+            reasons.add(ReasonCode.CONTRACT_MINT_AUTHORITY)
 
         if has_freeze:
             score += 0.25
-            reasons.append("WARNING: Freeze authority active — can freeze holder accounts")
+            reasons.add(ReasonCode.CONTRACT_FREEZE_AUTHORITY)
 
         if has_honeypot:
             score += 0.30
-            reasons.append("CRITICAL: Honeypot mechanism detected")
+            reasons.add(ReasonCode.CONTRACT_HONEYPOT)
 
         # Check RugCheck's own score (0-100, 100 = safest)
         rugcheck_score = report.get("score", 50)
         if rugcheck_score < 20:
             score = max(score, 0.9)
-            reasons.append(f"RugCheck score: {rugcheck_score}/100 (very dangerous)")
+            reasons.add(ReasonCode.CONTRACT_RUGCHECK_DANGEROUS, score=rugcheck_score)
         elif rugcheck_score < 50:
             score = max(score, 0.7)
-            reasons.append(f"RugCheck score: {rugcheck_score}/100 (risky)")
+            reasons.add(ReasonCode.CONTRACT_RUGCHECK_RISKY, score=rugcheck_score)
         elif rugcheck_score >= 80:
             score = min(score, 0.2)
-            reasons.append(f"RugCheck score: {rugcheck_score}/100 (relatively safe)")
+            reasons.add(ReasonCode.CONTRACT_RUGCHECK_SAFE, score=rugcheck_score)
 
         # Count total risks
         total_risks = len(risks)
         if total_risks > 5:
             score = min(score + 0.15, 1.0)
-            reasons.append(f"{total_risks} risk flags detected")
+            reasons.add(ReasonCode.CONTRACT_RISK_FLAGS, count=total_risks)
 
         score = min(score, 1.0)
 
         if not reasons:
             score = 0.15
-            reasons.append("No major contract issues detected")
-
-        evidence = {
-            "score": round(score, 4),
-            "rugcheck_score": rugcheck_score,
-            "mint_authority": has_mint,
-            "freeze_authority": has_freeze,
-            "honeypot": has_honeypot,
-            "total_risks": total_risks,
-            "risk_names": risk_names[:10],
-            "note": "RugCheck has 22% false negative rate — cross-verify with other layers",
-            "reasons": reasons,
-        }
-
-        return round(score, 4), evidence
+            reasons.add(ReasonCode.CONTRACT_CLEAN)
+
+        return self._result(
+            round(score, 4), 0.0,
+            [rugcheck_score, has_mint, has_freeze, has_honeypot, total_risks],
+            reasons,
+            risk_names=risk_names[:10],
+            note="RugCheck has 22% false negative rate — cross-verify with other layers",
+        )
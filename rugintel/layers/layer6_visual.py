@@ -14,6 +14,7 @@ import difflib
 import logging
 
 from rugintel.layers.base import BaseLayer, LayerResult
+from rugintel.layers.reasons import ReasonCode, Reasons
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +86,10 @@ class VisualLayer(BaseLayer):
     Data source: None (offline analysis using difflib)
     """
 
+    FEATURES = (
+        "name_match.similarity", "symbol_match.similarity",
+    )
+
     def __init__(self):
         super().__init__()
 
@@ -102,7 +107,7 @@ class VisualLayer(BaseLayer):
             # Try to get from DexScreener data if available
             return LayerResult(
                 score=0.0, confidence=0.1,
-                evidence={"note": "No token name/symbol provided"},
+                details={"note": "No token name/symbol provided"},
             )
 
         # Check both name and symbol against known tokens
@@ -117,21 +122,25 @@ class VisualLayer(BaseLayer):
 
         score = self._calculate_score(best_match)
 
-        evidence = {
-            "score": round(score, 4),
-            "token_name": token_name,
-            "token_symbol": token_symbol,
-            "name_match": name_match,
-            "symbol_match": symbol_match,
-            "reasons": best_match.get("reasons", []),
-        }
-
-        return LayerResult(
-            score=round(score, 4),
-            confidence=0.8 if best_match["similarity"] > 0.5 else 0.4,
-            evidence=evidence,
+        return self._result(
+            round(score, 4),
+            0.8 if best_match["similarity"] > 0.5 else 0.4,
+            [name_match["similarity"], symbol_match["similarity"]],
+            best_match.get("reasons") or Reasons(),
+            token_name=token_name,
+            token_symbol=token_symbol,
+            name_match=self._match_details(name_match),
+            symbol_match=self._match_details(symbol_match),
         )
 
+    @staticmethod
+    def _match_details(match: dict) -> dict:
+        """A similarity check's non-numeric fields (similarity is a feature)."""
+        return {
+            key: value for key, value in match.items()
+            if key not in ("similarity", "reasons")
+        }
+
     def _check_similarity(self, value: str, check_type: str) -> dict:
         """
         Check string similarity against all known tokens.
@@ -140,12 +149,12 @@ class VisualLayer(BaseLayer):
             Dict with best match info, similarity score, and reasons.
         """
         if not value:
-            return {"similarity": 0.0, "match": None, "reasons": []}
+            return {"similarity": 0.0, "match": None, "reasons": Reasons()}
 
         value_upper = value.upper().strip()
         best_similarity = 0.0
         best_match = None
-        reasons = []
+        reasons = Reasons()
 
         for symbol, name in KNOWN_TOKENS.items():
             if check_type == "symbol":
@@ -157,11 +166,12 @@ class VisualLayer(BaseLayer):
             if value_upper == compare_against.upper():
                 # Could be the real token or an exact impersonation
                 # Can't tell from name alone — other layers handle this
+                reasons.add(ReasonCode.VISUAL_EXACT_MATCH, symbol=symbol)
                 return {
                     "similarity": 1.0,
                     "match": f"{symbol} ({name})",
                     "exact_match": True,
-                    "reasons": [f"Exact match with known token {symbol}"],
+                    "reasons": reasons,
                 }
 
             # Calculate similarity
@@ -174,15 +184,11 @@ class VisualLayer(BaseLayer):
                 best_match = f"{symbol} ({name})"
 
         if best_similarity >= CRITICAL_SIMILARITY:
-            reasons.append(
-                f"CRITICAL: Name '{value}' is {best_similarity:.0%} similar "
-                f"to known token {best_match}"
-            )
+            reasons.add(ReasonCode.VISUAL_SIMILAR_CRITICAL, value=value,
+                        similarity=best_similarity, match=best_match)
         elif best_similarity >= WARNING_SIMILARITY:
-            reasons.append(
-                f"WARNING: Name '{value}' is {best_similarity:.0%} similar "
-                f"to {best_match}"
-            )
+            reasons.add(ReasonCode.VISUAL_SIMILAR_WARNING, value=value,
+                        similarity=best_similarity, match=best_match)
 
         return {
             "similarity": round(best_similarity, 4),
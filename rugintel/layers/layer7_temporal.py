@@ -16,6 +16,7 @@ import time
 import logging
 
 from rugintel.layers.base import BaseLayer, LayerResult
+from rugintel.layers.reasons import ReasonCode, Reasons
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,11 @@ class TemporalLayer(BaseLayer):
     Data source: DexScreener API + launch_timestamp
     """
 
+    FEATURES = (
+        "minutes_since_launch", "price_change_5m", "price_change_1h",
+        "fomo_phase",
+    )
+
     # Temporal risk windows (minutes since launch)
     EXTREME_RISK_WINDOW = 5      # <5 minutes = extreme risk
     HIGH_RISK_WINDOW = 12        # <12 minutes = high risk (68% of rugpulls)
@@ -63,21 +69,29 @@ class TemporalLayer(BaseLayer):
             )
 
             # Score
-            score, evidence = self._calculate_risk(time_metrics, market_data)
-
-            return LayerResult(
-                score=score,
-                confidence=0.7 if launch_timestamp > 0 else 0.3,
-                evidence=evidence,
-            )
+            result = self._calculate_risk(time_metrics, market_data)
+            result.confidence = 0.7 if launch_timestamp > 0 else 0.3
+            return result
 
         except Exception as e:
             logger.error(f"Temporal layer error: {e}")
             return LayerResult(
                 score=0.5, confidence=0.1,
-                evidence={"error": str(e)},
+                details={"error": str(e)},
             )
 
+    def analyze_offline(self, launch_timestamp: int) -> LayerResult:
+        """
+        Score the temporal risk window from the launch timestamp alone.
+
+        No network access — used by the miner's degraded (load-shed) path.
+        Trajectory signals need market data, so confidence is reduced.
+        """
+        time_metrics = self._calculate_time_metrics(launch_timestamp, {})
+        result = self._calculate_risk(time_metrics, {})
+        result.confidence = 0.4 if launch_timestamp > 0 else 0.1
+        return result
+
     async def _fetch_market_data(self, session, token_address: str) -> dict:
         """Fetch temporal market data from DexScreener."""
         url = f"{self.DEXSCREENER_BASE}/tokens/{token_address}"
@@ -145,14 +159,14 @@ class TemporalLayer(BaseLayer):
             "token_age_seconds": token_age_seconds,
         }
 
-    def _calculate_risk(self, time_metrics: dict, market_data: dict) -> tuple:
+    def _calculate_risk(self, time_metrics: dict, market_data: dict) -> LayerResult:
         """
         Calculate temporal risk score.
 
         Key insight: 68% of rugpulls happen within 12 minutes of launch.
         """
         score = 0.0
-        reasons = []
+        reasons = Reasons()
 
         minutes = time_metrics.get("minutes_since_launch", -1)
         price_5m = market_data.get("price_change_5m", 0)
@@ -161,79 +175,55 @@ class TemporalLayer(BaseLayer):
         # === Time-based risk windows ===
         if minutes < 0:
             score = 0.5
-            reasons.append("Unknown launch time — cannot assess temporal risk")
+            reasons.add(ReasonCode.TEMPORAL_UNKNOWN_LAUNCH)
 
         elif minutes < self.EXTREME_RISK_WINDOW:
             score = 0.95
-            reasons.append(
-                f"EXTREME RISK: Token is only {minutes:.0f} min old "
-                f"(<{self.EXTREME_RISK_WINDOW} min)"
-            )
+            reasons.add(ReasonCode.TEMPORAL_EXTREME, minutes=minutes,
+                        threshold=self.EXTREME_RISK_WINDOW)
 
         elif minutes < self.HIGH_RISK_WINDOW:
             score = 0.85
-            reasons.append(
-                f"HIGH RISK: Token is {minutes:.0f} min old — "
-                f"68% of rugpulls happen within 12 min of launch"
-            )
+            reasons.add(ReasonCode.TEMPORAL_HIGH, minutes=minutes)
 
         elif minutes < self.MODERATE_RISK_WINDOW:
             score = 0.6
-            reasons.append(
-                f"ELEVATED: Token is {minutes:.0f} min old — "
-                f"still in high-risk window"
-            )
+            reasons.add(ReasonCode.TEMPORAL_ELEVATED, minutes=minutes)
 
         elif minutes < self.LOW_RISK_WINDOW:
             score = 0.35
-            reasons.append(
-                f"MODERATE: Token is {minutes:.0f} min old — "
-                f"passed peak risk window"
-            )
+            reasons.add(ReasonCode.TEMPORAL_MODERATE, minutes=minutes)
 
         else:
             # >1 hour old
             hours = time_metrics.get("hours_since_launch", 0)
             score = max(0.1, 0.3 - (hours * 0.01))
-            reasons.append(
-                f"LOW: Token is {hours:.1f} hours old — "
-                f"past initial risk window"
-            )
+            reasons.add(ReasonCode.TEMPORAL_LOW, hours=hours)
 
         # === Pump-dump trajectory detection ===
         if minutes > 0 and minutes < 30:
             # Classic pump-dump: massive pump in first minutes, then crash
             if price_5m > 500:  # >500% in 5 min
                 score = min(score + 0.1, 1.0)
-                reasons.append(
-                    f"Pump phase detected: +{price_5m:.0f}% in 5 min"
-                )
+                reasons.add(ReasonCode.TEMPORAL_PUMP_PHASE, pct=price_5m)
 
             # Price already crashing after pump
             if price_5m < -50 and price_1h > 100:
                 score = min(score + 0.15, 1.0)
-                reasons.append(
-                    "Dump phase: price crashing after initial pump"
-                )
+                reasons.add(ReasonCode.TEMPORAL_DUMP_PHASE)
 
         # === FOMO phase detection ===
         if 0 < minutes < 15 and price_5m > 100:
-            reasons.append(
-                "FOMO PHASE: Rapid price increase in first 15 minutes — "
-                "peak risk for rug"
-            )
-
-        evidence = {
-            "score": round(score, 4),
-            **time_metrics,
-            "price_change_5m": price_5m,
-            "price_change_1h": price_1h,
-            "risk_window": self._get_risk_window(minutes),
-            "fomo_phase": 0 < minutes < 15 and price_5m > 50,
-            "reasons": reasons,
-        }
-
-        return round(score, 4), evidence
+            reasons.add(ReasonCode.TEMPORAL_FOMO_PHASE)
+
+        return self._result(
+            round(score, 4), 0.0,
+            [minutes, price_5m, price_1h, 0 < minutes < 15 and price_5m > 50],
+            reasons,
+            hours_since_launch=time_metrics.get("hours_since_launch"),
+            token_age_seconds=time_metrics.get("token_age_seconds"),
+            risk_window=self._get_risk_window(minutes),
+        )
 
     def _get_risk_window(self, minutes: float) -> str:
         """Classify the current temporal risk window."""
@@ -0,0 +1,210 @@
+"""
+Reason Codes — Why a layer scored a token the way it did.
+
+Layers record integer reason codes with their parameters instead of
+formatting messages on every call. Text is only rendered when evidence is
+serialized at full detail (or when a caller reads a reason as a string).
+
+Codes are grouped by layer (1xx social, 2xx liquidity, ... 7xx temporal)
+and are part of the wire format: never renumber, only append.
+"""
+
+from enum import IntEnum
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class ReasonCode(IntEnum):
+    """Stable integer identifiers for layer reasons."""
+
+    # Layer 1: Social
+    SOCIAL_NEW_ACCOUNTS_MANY = 101
+    SOCIAL_NEW_ACCOUNTS = 102
+    SOCIAL_SHILL_HIGH = 103
+    SOCIAL_SHILL_MODERATE = 104
+    SOCIAL_BOTS_LIKELY = 105
+    SOCIAL_BOTS_SOME = 106
+
+    # Layer 2: Liquidity
+    LP_NOT_FOUND = 201
+    LP_NOT_LOCKED = 202
+    LP_LOCK_SHORT = 203
+    LP_LOCK_MODERATE = 204
+    LP_LOCK_LONG = 205
+    LP_LOCK_UNKNOWN = 206
+
+    # Layer 3: Wallet
+    WALLET_TOP_HOLDER_CRITICAL = 301
+    WALLET_TOP_HOLDER_WARNING = 302
+    WALLET_TOP5_CRITICAL = 303
+    WALLET_TOP5_WARNING = 304
+    WALLET_FEW_HOLDERS = 305
+    WALLET_HEALTHY = 306
+
+    # Layer 4: Market
+    MARKET_VOLUME_SPIKE_CRITICAL = 401
+    MARKET_VOLUME_SPIKE = 402
+    MARKET_LIQUIDITY_VERY_LOW = 403
+    MARKET_LIQUIDITY_LOW = 404
+    MARKET_WASH_TRADING = 405
+    MARKET_PRICE_PUMP = 406
+    MARKET_NORMAL = 407
+
+    # Layer 5: Contract
+    CONTRACT_MINT_AUTHORITY = 501
+    CONTRACT_FREEZE_AUTHORITY = 502
+    CONTRACT_HONEYPOT = 503
+    CONTRACT_RUGCHECK_DANGEROUS = 504
+    CONTRACT_RUGCHECK_RISKY = 505
+    CONTRACT_RUGCHECK_SAFE = 506
+    CONTRACT_RISK_FLAGS = 507
+    CONTRACT_CLEAN = 508
+
+    # Layer 6: Visual
+    VISUAL_EXACT_MATCH = 601
+    VISUAL_SIMILAR_CRITICAL = 602
+    VISUAL_SIMILAR_WARNING = 603
+
+    # Layer 7: Temporal
+    TEMPORAL_UNKNOWN_LAUNCH = 701
+    TEMPORAL_EXTREME = 702
+    TEMPORAL_HIGH = 703
+    TEMPORAL_ELEVATED = 704
+    TEMPORAL_MODERATE = 705
+    TEMPORAL_LOW = 706
+    TEMPORAL_PUMP_PHASE = 707
+    TEMPORAL_DUMP_PHASE = 708
+    TEMPORAL_FOMO_PHASE = 709
+
+
+REASON_TEMPLATES: Dict[ReasonCode, str] = {
+    ReasonCode.SOCIAL_NEW_ACCOUNTS_MANY: "{count} new accounts (<30 days)",
+    ReasonCode.SOCIAL_NEW_ACCOUNTS: "{count} new accounts",
+    ReasonCode.SOCIAL_SHILL_HIGH: "High shill keyword ratio: {ratio:.0%}",
+    ReasonCode.SOCIAL_SHILL_MODERATE: "Moderate shill keywords: {ratio:.0%}",
+    ReasonCode.SOCIAL_BOTS_LIKELY: "Likely bot activity: {ratio:.0%} low-follower",
+    ReasonCode.SOCIAL_BOTS_SOME: "Some bot activity: {ratio:.0%} low-follower",
+
+    ReasonCode.LP_NOT_FOUND: "No liquidity pool found",
+    ReasonCode.LP_NOT_LOCKED: "LP tokens NOT locked — can be drained anytime",
+    ReasonCode.LP_LOCK_SHORT: "LP locked for only {hours}h (<72h threshold)",
+    ReasonCode.LP_LOCK_MODERATE: "LP locked for {hours}h (moderate)",
+    ReasonCode.LP_LOCK_LONG: "LP locked for {hours}h (long-term)",
+    ReasonCode.LP_LOCK_UNKNOWN: "LP locked but duration unknown",
+
+    ReasonCode.WALLET_TOP_HOLDER_CRITICAL:
+        "CRITICAL: Top wallet holds {pct:.0%} of supply (>{threshold:.0%})",
+    ReasonCode.WALLET_TOP_HOLDER_WARNING: "WARNING: Top wallet holds {pct:.0%} of supply",
+    ReasonCode.WALLET_TOP5_CRITICAL: "Top 5 wallets hold {pct:.0%} of supply",
+    ReasonCode.WALLET_TOP5_WARNING: "Top 5 wallets hold {pct:.0%}",
+    ReasonCode.WALLET_FEW_HOLDERS: "Only {count} holders (< {minimum})",
+    ReasonCode.WALLET_HEALTHY: "Healthy holder distribution",
+
+    ReasonCode.MARKET_VOLUME_SPIKE_CRITICAL:
+        "CRITICAL: Volume spike {ratio:.0f}× (>{threshold}× = 94% pump&dump)",
+    ReasonCode.MARKET_VOLUME_SPIKE: "Volume spike {ratio:.0f}× (suspicious)",
+    ReasonCode.MARKET_LIQUIDITY_VERY_LOW:
+        "Very low liquidity: ${liquidity:,.0f} (<${threshold:,})",
+    ReasonCode.MARKET_LIQUIDITY_LOW: "Low liquidity: ${liquidity:,.0f}",
+    ReasonCode.MARKET_WASH_TRADING: "Possible wash trading: ${per_txn:,.0f} avg per txn",
+    ReasonCode.MARKET_PRICE_PUMP: "Extreme price pump: +{pct:.0f}% in 5min",
+    ReasonCode.MARKET_NORMAL: "Normal market activity",
+
+    ReasonCode.CONTRACT_MINT_AUTHORITY:
+        "CRITICAL: Mint authority active — can create unlimited tokens",
+    ReasonCode.CONTRACT_FREEZE_AUTHORITY:
+        "WARNING: Freeze authority active — can freeze holder accounts",
+    ReasonCode.CONTRACT_HONEYPOT: "CRITICAL: Honeypot mechanism detected",
+    ReasonCode.CONTRACT_RUGCHECK_DANGEROUS: "RugCheck score: {score}/100 (very dangerous)",
+    ReasonCode.CONTRACT_RUGCHECK_RISKY: "RugCheck score: {score}/100 (risky)",
+    ReasonCode.CONTRACT_RUGCHECK_SAFE: "RugCheck score: {score}/100 (relatively safe)",
+    ReasonCode.CONTRACT_RISK_FLAGS: "{count} risk flags detected",
+    ReasonCode.CONTRACT_CLEAN: "No major contract issues detected",
+
+    ReasonCode.VISUAL_EXACT_MATCH: "Exact match with known token {symbol}",
+    ReasonCode.VISUAL_SIMILAR_CRITICAL:
+        "CRITICAL: Name '{value}' is {similarity:.0%} similar to known token {match}",
+    ReasonCode.VISUAL_SIMILAR_WARNING:
+        "WARNING: Name '{value}' is {similarity:.0%} similar to {match}",
+
+    ReasonCode.TEMPORAL_UNKNOWN_LAUNCH: "Unknown launch time — cannot assess temporal risk",
+    ReasonCode.TEMPORAL_EXTREME:
+        "EXTREME RISK: Token is only {minutes:.0f} min old (<{threshold} min)",
+    ReasonCode.TEMPORAL_HIGH:
+        "HIGH RISK: Token is {minutes:.0f} min old — "
+        "68% of rugpulls happen within 12 min of launch",
+    ReasonCode.TEMPORAL_ELEVATED:
+        "ELEVATED: Token is {minutes:.0f} min old — still in high-risk window",
+    ReasonCode.TEMPORAL_MODERATE:
+        "MODERATE: Token is {minutes:.0f} min old — passed peak risk window",
+    ReasonCode.TEMPORAL_LOW:
+        "LOW: Token is {hours:.1f} hours old — past initial risk window",
+    ReasonCode.TEMPORAL_PUMP_PHASE: "Pump phase detected: +{pct:.0f}% in 5 min",
+    ReasonCode.TEMPORAL_DUMP_PHASE: "Dump phase: price crashing after initial pump",
+    ReasonCode.TEMPORAL_FOMO_PHASE:
+        "FOMO PHASE: Rapid price increase in first 15 minutes — peak risk for rug",
+}
+
+
+def render_reason(code: ReasonCode, params: Dict[str, Any]) -> str:
+    """Format one reason code as text."""
+    return REASON_TEMPLATES[code].format(**params)
+
+
+class Reasons:
+    """
+    Ordered reason codes with their parameters, rendered on demand.
+
+    Reads like a list of strings (indexing, iteration and `in` render
+    text), so callers that expect messages keep working; `codes` gives
+    the integer codes without formatting anything.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self):
+        self._items: List[Tuple[ReasonCode, Dict[str, Any]]] = []
+
+    def add(self, code: ReasonCode, **params):
+        """Record a reason; params fill its message template."""
+        self._items.append((code, params))
+
+    @property
+    def codes(self) -> List[int]:
+        """Reason codes in the order they were added."""
+        return [int(code) for code, _ in self._items]
+
+    def render(self) -> List[str]:
+        """All reasons as text."""
+        return [render_reason(code, params) for code, params in self._items]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [render_reason(code, params) for code, params in self._items[index]]
+        code, params = self._items[index]
+        return render_reason(code, params)
+
+    def __iter__(self) -> Iterator[str]:
+        for code, params in self._items:
+            yield render_reason(code, params)
+
+    def __contains__(self, item) -> bool:
+        if isinstance(item, ReasonCode):
+            return any(code == item for code, _ in self._items)
+        return item in self.render()
+
+    def __repr__(self) -> str:
+        return f"Reasons({[code.name for code, _ in self._items]})"
+
+
+def render_evidence(evidence: Any) -> Any:
+    """Copy of an evidence structure with every Reasons rendered to text."""
+    if isinstance(evidence, Reasons):
+        return evidence.render()
+    if isinstance(evidence, dict):
+        return {key: render_evidence(value) for key, value in evidence.items()}
+    if isinstance(evidence, list):
+        return [render_evidence(value) for value in evidence]
+    return evidence
@@ -0,0 +1,141 @@
+"""
+RugIntel Metagraph Sync — Background Refresh with Atomic Snapshots
+
+Subtensor calls can take seconds (or hang) on a busy node, so neither
+request handling nor validation cycles should ever wait on them.
+
+Architecture:
+    - MetagraphSyncer fetches a fresh metagraph in a worker thread
+    - Derived indexes (hotkey → uid, serving axons, stakes) are built
+      off the hot path into an immutable MetagraphSnapshot
+    - The snapshot reference is swapped in one assignment, so readers
+      always see a consistent view and never a half-synced metagraph
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MetagraphSnapshot:
+    """Immutable view of the metagraph with O(1) lookups."""
+
+    uids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    """All uids on the subnet, in metagraph order."""
+
+    hotkeys: tuple = ()
+    """Hotkey for each uid."""
+
+    axons: tuple = ()
+    """AxonInfo for each uid."""
+
+    stakes: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    """Stake (TAO) for each uid."""
+
+    hotkey_to_uid: Dict[str, int] = field(default_factory=dict)
+    """Reverse index used for blacklist and priority checks."""
+
+    serving_uids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    """Uids whose axon has announced an IP (i.e. not 0.0.0.0)."""
+
+    synced_at: float = 0.0
+    """Unix time the snapshot was taken."""
+
+    sync_seconds: float = 0.0
+    """How long the subtensor sync took."""
+
+    @classmethod
+    def from_metagraph(cls, metagraph: Any,
+                       sync_seconds: float = 0.0) -> "MetagraphSnapshot":
+        """Build all derived indexes from a synced metagraph."""
+        uids = np.asarray(metagraph.uids, dtype=np.int64)
+        hotkeys = tuple(metagraph.hotkeys)
+        axons = tuple(metagraph.axons)
+
+        return cls(
+            uids=uids,
+            hotkeys=hotkeys,
+            axons=axons,
+            stakes=np.asarray(metagraph.S, dtype=np.float32),
+            hotkey_to_uid={
+                hotkey: int(uid) for uid, hotkey in zip(uids, hotkeys)
+            },
+            serving_uids=np.asarray(
+                [int(uid) for uid, axon in zip(uids, axons) if axon.is_serving],
+                dtype=np.int64,
+            ),
+            synced_at=time.time(),
+            sync_seconds=round(sync_seconds, 3),
+        )
+
+    @property
+    def n(self) -> int:
+        """Number of uids on the subnet."""
+        return len(self.uids)
+
+    def stake_of(self, hotkey: str) -> Optional[float]:
+        """Stake of a registered hotkey, or None if not registered."""
+        uid = self.hotkey_to_uid.get(hotkey)
+        if uid is None:
+            return None
+        return float(self.stakes[uid])
+
+    def serving_axons(self) -> List[tuple]:
+        """(uid, axon) pairs for every serving axon."""
+        return [(int(uid), self.axons[uid]) for uid in self.serving_uids]
+
+
+class MetagraphSyncer:
+    """
+    Periodically re-sync the metagraph without blocking the caller.
+
+    `sync_once()` is blocking and is used for the initial sync at startup;
+    `run()` is the background task, which pushes each sync to a worker
+    thread and swaps in the new snapshot when it completes.
+    """
+
+    def __init__(self, subtensor: Any, netuid: int,
+                 interval: float = 60.0):
+        self.subtensor = subtensor
+        self.netuid = netuid
+        self.interval = interval
+
+        self.metagraph: Any = None
+        self.snapshot = MetagraphSnapshot()
+
+    def sync_once(self) -> MetagraphSnapshot:
+        """Fetch a fresh metagraph and atomically publish its snapshot."""
+        start_time = time.time()
+        metagraph = self.subtensor.metagraph(netuid=self.netuid)
+        elapsed = time.time() - start_time
+
+        snapshot = MetagraphSnapshot.from_metagraph(
+            metagraph, sync_seconds=elapsed
+        )
+
+        # Single reference swaps — readers see either old or new, never mixed
+        self.metagraph = metagraph
+        self.snapshot = snapshot
+
+        log = logger.warning if elapsed > self.interval / 2 else logger.info
+        log(
+            f"🔄 Metagraph synced in {elapsed:.2f}s | "
+            f"{snapshot.n} uids, {len(snapshot.serving_uids)} serving"
+        )
+        return snapshot
+
+    async def run(self):
+        """Background loop: sync in a worker thread every `interval` seconds."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await asyncio.to_thread(self.sync_once)
+            except Exception as e:
+                logger.error(f"Metagraph sync failed: {e}")
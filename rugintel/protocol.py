@@ -4,10 +4,14 @@ RugIntel Protocol — Bittensor Synapse Definition
 Defines the communication contract between Miners and Validators.
 Validators send RugIntelSynapse requests via Axon RPC;
 Miners populate the output fields and return the synapse.
+RugIntelBatchSynapse carries many tokens in one round trip;
+RugIntelStreamingSynapse streams layer results as they complete.
 """
 
+import json
+
 import bittensor as bt
-from typing import Optional, Dict, Any
+from typing import ClassVar, Optional, Dict, Any, List
 
 
 class RugIntelSynapse(bt.Synapse):
@@ -30,6 +34,15 @@ class RugIntelSynapse(bt.Synapse):
     launch_timestamp: int = 0
     """Unix timestamp of when the token was first seen on-chain."""
 
+    evidence_level: str = "full"
+    """
+    Evidence detail requested:
+    "none"    — no evidence returned
+    "compact" — per layer score, confidence, failed flag and numeric
+                features only (fixed keys, no strings)
+    "full"    — every layer's complete evidence, including reasons
+    """
+
     # ── Output Fields (set by Miner) ──────────────────────────
     risk_score: Optional[float] = None
     """
@@ -66,3 +79,159 @@ class RugIntelSynapse(bt.Synapse):
     Based on temporal analysis and historical patterns.
     None if rugpull is unlikely (risk_score < 0.5).
     """
+
+
+class RugIntelBatchSynapse(bt.Synapse):
+    """
+    Batch variant of RugIntelSynapse: many tokens per round trip.
+
+    Inputs and outputs are parallel lists — entry i of every output list
+    answers token_addresses[i]. An entry is None when the miner could not
+    analyze that token (or it was beyond MAX_TOKENS). Evidence is not
+    returned in batch responses.
+    """
+
+    MAX_TOKENS: ClassVar[int] = 64
+
+    # ── Input Fields (set by Validator) ────────────────────────
+    token_addresses: List[str] = []
+    """Solana token mint addresses to analyze (base58 encoded)."""
+
+    launch_timestamps: List[int] = []
+    """Unix launch timestamp of each token, parallel to token_addresses."""
+
+    # ── Output Fields (set by Miner) ──────────────────────────
+    risk_scores: Optional[List[Optional[float]]] = None
+    """Risk score (0.0 - 1.0) per token."""
+
+    confidences: Optional[List[Optional[float]]] = None
+    """Prediction confidence (0.0 - 1.0) per token."""
+
+    times_to_rugpull: Optional[List[Optional[float]]] = None
+    """Estimated hours until rugpull per token (None if unlikely)."""
+
+
+class RugIntelStreamingSynapse(bt.StreamingSynapse):
+    """
+    Streaming variant of RugIntelSynapse: layer results as they finish.
+
+    The miner writes one newline-delimited JSON message per layer as soon
+    as that layer completes, then a final message with the fused result:
+
+        {"layer": "temporal", "score": 0.9, "confidence": 0.8, "weight": 0.2}
+        {"final": true, "risk_score": 0.71, "confidence": 0.6, "time_to_rugpull": 0.4}
+
+    If the stream is cut at the validator's deadline, the layers received
+    so far still give a provisional answer (see provisional()).
+    """
+
+    # ── Input Fields (set by Validator) ────────────────────────
+    token_address: str = ""
+    """Solana token mint address to analyze (base58 encoded)."""
+
+    launch_timestamp: int = 0
+    """Unix timestamp of when the token was first seen on-chain."""
+
+    # ── Output Fields (filled from the stream) ─────────────────
+    layers: Dict[str, Dict[str, float]] = {}
+    """Per-layer {"score", "confidence", "weight"} received so far."""
+
+    risk_score: Optional[float] = None
+    """Fused risk score (0.0 - 1.0); None until the final message arrives."""
+
+    confidence: Optional[float] = None
+    """Fused prediction confidence (0.0 - 1.0)."""
+
+    time_to_rugpull: Optional[float] = None
+    """Estimated hours until rugpull (None if unlikely)."""
+
+    @staticmethod
+    def encode_message(message: Dict[str, Any]) -> bytes:
+        """One stream message as a newline-terminated JSON line."""
+        return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+    def apply_message(self, message: Dict[str, Any]):
+        """Fold one decoded stream message into the output fields."""
+        if message.get("final"):
+            self.risk_score = message.get("risk_score")
+            self.confidence = message.get("confidence")
+            self.time_to_rugpull = message.get("time_to_rugpull")
+        elif "layer" in message:
+            self.layers = {**self.layers, message["layer"]: {
+                "score": float(message.get("score", 0.5)),
+                "confidence": float(message.get("confidence", 0.0)),
+                "weight": float(message.get("weight", 0.0)),
+            }}
+
+    @property
+    def is_complete(self) -> bool:
+        """True once the fused result has been received."""
+        return self.risk_score is not None
+
+    def provisional(self) -> Optional[Dict[str, float]]:
+        """
+        Best answer from the layers received so far.
+
+        Risk is the weighted mean of the received layer scores; confidence
+        is their weighted confidence, so it shrinks with every missing
+        layer. None if no layer arrived.
+        """
+        total_weight = sum(layer["weight"] for layer in self.layers.values())
+        if total_weight <= 0:
+            return None
+
+        risk = sum(
+            layer["weight"] * layer["score"] for layer in self.layers.values()
+        ) / total_weight
+        confidence = sum(
+            layer["weight"] * layer["confidence"] for layer in self.layers.values()
+        )
+        return {
+            "risk_score": round(min(max(risk, 0.0), 1.0), 4),
+            "confidence": round(min(max(confidence, 0.0), 1.0), 4),
+        }
+
+    async def process_streaming_response(self, response):
+        """Decode messages line by line as the miner sends them."""
+        buffer = b""
+        async for chunk in response.content.iter_any():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                self.apply_message(message)
+                yield message
+
+    def extract_response_json(self, response) -> Dict[str, Any]:
+        """Headers plus the fields accumulated from the stream."""
+        headers = {
+            k.decode("utf-8"): v.decode("utf-8")
+            for k, v in response.__dict__["_raw_headers"]
+        }
+
+        def extract_info(prefix: str) -> Dict[str, str]:
+            return {
+                key.split("_")[-1]: value
+                for key, value in headers.items()
+                if key.startswith(prefix)
+            }
+
+        return {
+            "name": headers.get("name", ""),
+            "timeout": float(headers.get("timeout", 0)),
+            "total_size": int(headers.get("total_size", 0)),
+            "header_size": int(headers.get("header_size", 0)),
+            "dendrite": extract_info("bt_header_dendrite"),
+            "axon": extract_info("bt_header_axon"),
+            "token_address": self.token_address,
+            "launch_timestamp": self.launch_timestamp,
+            "layers": self.layers,
+            "risk_score": self.risk_score,
+            "confidence": self.confidence,
+            "time_to_rugpull": self.time_to_rugpull,
+        }
@@ -0,0 +1,60 @@
+"""
+RugIntel Rate Limiting — Per-Upstream Token Buckets
+
+Verification fans out to public APIs (Solana RPC, RugCheck, DexScreener)
+that throttle or ban clients exceeding their request budgets. Each
+upstream gets its own bucket so a burst against one never starves the
+others.
+
+Architecture:
+    - RateLimiter is an asyncio token bucket: `rate` tokens per second,
+      at most `burst` banked
+    - acquire(n) waits in FIFO order until n tokens are available; a
+      batch of calls pays one token per call
+    - rate <= 0 disables limiting
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Async token bucket limiting calls to `rate` per second."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, n: float = 1.0):
+        """
+        Wait until `n` calls may be sent (e.g. a JSON-RPC batch of n).
+
+        A batch larger than the burst is let through once the bucket is
+        full and leaves it in debt, so later calls wait for the remainder.
+        """
+        if self.rate <= 0:
+            return
+
+        # Created lazily so it binds to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # Holding the lock while sleeping keeps waiters in FIFO order
+        async with self._lock:
+            needed = min(n, self.burst)
+            self._refill()
+            while self._tokens < needed:
+                await asyncio.sleep((needed - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= n
@@ -0,0 +1,114 @@
+"""
+RugIntel Miner Sampling — Stratified, Rotating Token Assignment
+
+Querying every miner for every token costs O(miners × tokens) dendrite
+calls. Sampling assigns each token to a fixed number of miners instead,
+so bandwidth scales with tokens and every uid still gets enough scored
+tokens per epoch.
+
+Architecture:
+    - Candidate uids are split into `miners_per_token` contiguous strata
+    - The split rotates by one position per token, so strata boundaries
+      never pin the same uids together
+    - Within each stratum the least-covered uid this epoch is chosen
+      (ties broken randomly), which keeps per-uid coverage balanced
+"""
+
+import logging
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class StratifiedSampler:
+    """
+    Assign each token to `miners_per_token` uids with balanced coverage.
+
+    Coverage (tokens assigned per uid) is tracked for the current epoch;
+    when an epoch ends its coverage is kept as `last_epoch_coverage` and
+    a summary is logged.
+    """
+
+    def __init__(self, miners_per_token: int, epoch_seconds: float = 3600.0,
+                 seed: Optional[int] = None):
+        self.miners_per_token = max(1, miners_per_token)
+        self.epoch_seconds = epoch_seconds
+
+        self.coverage = np.zeros(0, dtype=np.int64)
+        self.last_epoch_coverage = np.zeros(0, dtype=np.int64)
+        self.epoch_started = time.time()
+
+        self._rotation = 0
+        self._rng = np.random.default_rng(seed)
+
+    def _ensure_size(self, n: int):
+        """Grow coverage arrays when new uids appear."""
+        if n > len(self.coverage):
+            self.coverage = np.pad(self.coverage, (0, n - len(self.coverage)))
+
+    def _maybe_roll_epoch(self):
+        if time.time() - self.epoch_started < self.epoch_seconds:
+            return
+
+        self.last_epoch_coverage = self.coverage
+        self.coverage = np.zeros_like(self.coverage)
+        self.epoch_started = time.time()
+
+        if self.last_epoch_coverage.size:
+            logger.info(
+                f"📐 Sampling epoch closed | coverage per uid: "
+                f"min {self.last_epoch_coverage.min()}, "
+                f"mean {self.last_epoch_coverage.mean():.1f}, "
+                f"max {self.last_epoch_coverage.max()}"
+            )
+
+    def select(self, uids: np.ndarray) -> np.ndarray:
+        """
+        Choose the uids that will be queried for one token.
+
+        Args:
+            uids: Candidate uids (e.g. serving miners).
+
+        Returns:
+            Array of at most `miners_per_token` distinct uids.
+        """
+        uids = np.asarray(uids, dtype=np.int64)
+        if uids.size == 0:
+            return uids
+
+        self._maybe_roll_epoch()
+        self._ensure_size(int(uids.max()) + 1)
+
+        if uids.size <= self.miners_per_token:
+            self.coverage[uids] += 1
+            return uids
+
+        # Rotate the split point so strata shift by one uid per token
+        order = np.roll(np.sort(uids), -(self._rotation % uids.size))
+        self._rotation += 1
+
+        chosen = np.empty(self.miners_per_token, dtype=np.int64)
+        for i, stratum in enumerate(
+            np.array_split(order, self.miners_per_token)
+        ):
+            stratum_coverage = self.coverage[stratum]
+            least_covered = stratum[stratum_coverage == stratum_coverage.min()]
+            chosen[i] = self._rng.choice(least_covered)
+
+        self.coverage[chosen] += 1
+        return chosen
+
+    def coverage_summary(self) -> Dict[str, float]:
+        """Coverage statistics for the current epoch."""
+        if self.coverage.size == 0:
+            return {"uids": 0}
+
+        return {
+            "uids": int(self.coverage.size),
+            "min": int(self.coverage.min()),
+            "mean": round(float(self.coverage.mean()), 2),
+            "max": int(self.coverage.max()),
+        }
@@ -0,0 +1,111 @@
+"""
+RugIntel Due Queue — Verification Scheduling by Due Time
+
+Pending tokens only become verifiable once their ground-truth window has
+passed. Walking the whole backlog every cycle to find them costs
+O(backlog); a min-heap keyed by due time costs O(ready · log backlog).
+
+Architecture:
+    - DueQueue is a min-heap of (due_at, token) with lazy deletion, so a
+      token can be rescheduled or dropped without rebuilding the heap
+    - wait_until_due() sleeps until the earliest token is due, and wakes
+      early if a token with an earlier due time is pushed meanwhile
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class DueQueue:
+    """Tokens keyed by verification due time (unix seconds)."""
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._due: Dict[str, float] = {}
+        self._payload: Dict[str, Any] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def _event(self) -> asyncio.Event:
+        # Created lazily so it binds to the running event loop
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        return self._wakeup
+
+    def push(self, token: str, due_at: float, payload: Any = None):
+        """Schedule (or reschedule) a token for `due_at`."""
+        previous_next = self.next_due()
+
+        self._due[token] = due_at
+        self._payload[token] = payload
+        heapq.heappush(self._heap, (due_at, next(self._seq), token))
+
+        if previous_next is None or due_at < previous_next:
+            self._event().set()
+
+    def discard(self, token: str):
+        """Stop tracking a token (its heap entry is skipped lazily)."""
+        self._due.pop(token, None)
+        self._payload.pop(token, None)
+
+    def _prune(self):
+        """Drop stale heap entries left by reschedules and discards."""
+        while self._heap:
+            due_at, _, token = self._heap[0]
+            if self._due.get(token) == due_at:
+                return
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[float]:
+        """Due time of the earliest token, or None if empty."""
+        self._prune()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[float] = None,
+                limit: Optional[int] = None) -> List[Tuple[str, Any]]:
+        """Remove and return (token, payload) for every token due by `now`."""
+        now = time.time() if now is None else now
+        ready = []
+
+        while limit is None or len(ready) < limit:
+            next_due = self.next_due()
+            if next_due is None or next_due > now:
+                break
+            _, _, token = heapq.heappop(self._heap)
+            del self._due[token]
+            ready.append((token, self._payload.pop(token)))
+
+        return ready
+
+    async def wait_until_due(self, max_wait: Optional[float] = None):
+        """
+        Sleep until the earliest token is due (or `max_wait` elapses).
+
+        Pushing a token that is due earlier than the current head wakes
+        the sleeper so it can re-arm for the new deadline.
+        """
+        deadline = None if max_wait is None else time.time() + max_wait
+        wakeup = self._event()
+
+        while True:
+            next_due = self.next_due()
+            candidates = [t for t in (next_due, deadline) if t is not None]
+            delay = max(0.0, min(candidates) - time.time()) if candidates else None
+
+            if delay == 0.0:
+                return
+
+            wakeup.clear()
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                return
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, token: str) -> bool:
+        return token in self._due
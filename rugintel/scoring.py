@@ -0,0 +1,217 @@
+"""
+RugIntel Score History — Bounded, Persistent Per-Miner Accuracy
+
+Weights should reflect each miner's track record, not only the tokens
+verified since the last update, and that record must survive restarts
+without growing without bound.
+
+Architecture:
+    - One fixed-size record per uid: accuracy EMA, a ring buffer of the
+      last `window` scores, and its head/count
+    - All records live in a single memory-mapped .npy file, sized to the
+      metagraph and grown when new uids appear
+    - Scores are recorded and weights computed as vectorized passes over
+      uid arrays — O(uids), independent of history length
+    - A sidecar file remembers each uid's hotkey; when a uid changes hands
+      its history is reset so a new miner never inherits the old score
+    - Weights decay with the time since a uid was last scored, so a miner
+      that stops serving (and is no longer queried) loses its weight
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+logger = logging.getLogger(__name__)
+
+
+def _record_dtype(window: int) -> np.dtype:
+    return np.dtype([
+        ("ema", np.float32),
+        ("scored_at", np.float64),
+        ("count", np.int32),
+        ("head", np.int32),
+        ("ring", np.float32, (window,)),
+    ])
+
+
+class ScoreHistory:
+    """
+    Per-uid accuracy ring buffers and EMAs backed by a memmapped file.
+
+    Empty ring slots and unscored EMAs hold NaN. With a `half_life`
+    (seconds), weights halve for every half-life since the uid's last
+    score; 0 disables decay.
+    """
+
+    def __init__(self, path: Path, n_uids: int = 256, window: int = 100,
+                 ema_alpha: float = 0.1, half_life: float = 0.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.window = window
+        self.ema_alpha = ema_alpha
+        self.half_life = half_life
+        self._hotkeys_path = self.path.with_suffix(".hotkeys.json")
+
+        self._data = self._open(max(1, n_uids))
+        self._hotkeys: List[Optional[str]] = self._load_hotkeys()
+
+    # ── Storage ────────────────────────────────────────────
+
+    def _create(self, path: Path, n: int) -> np.memmap:
+        data = open_memmap(path, mode="w+", dtype=_record_dtype(self.window),
+                           shape=(n,))
+        data["ema"] = np.nan
+        data["ring"] = np.nan
+        return data
+
+    def _open(self, n: int) -> np.memmap:
+        if self.path.exists():
+            data = open_memmap(self.path, mode="r+")
+            if data.dtype == _record_dtype(self.window):
+                if len(data) < n:
+                    data = self._grow(data, n)
+                return data
+            logger.warning(
+                f"Score history at {self.path} has a different layout — "
+                f"starting fresh"
+            )
+            del data
+
+        return self._create(self.path, n)
+
+    def _grow(self, data: np.memmap, n: int) -> np.memmap:
+        """Copy records into a larger file and swap it in atomically."""
+        tmp_path = self.path.with_suffix(".tmp.npy")
+        grown = self._create(tmp_path, n)
+        grown[:len(data)] = data
+        grown.flush()
+        del data, grown
+        os.replace(tmp_path, self.path)
+        return open_memmap(self.path, mode="r+")
+
+    def _load_hotkeys(self) -> List[Optional[str]]:
+        try:
+            with open(self._hotkeys_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def resize(self, n: int):
+        """Grow to hold at least `n` uids (existing history is kept)."""
+        if n > len(self._data):
+            self._data.flush()
+            self._data = self._grow(self._data, n)
+
+    def sync_hotkeys(self, hotkeys: Sequence[str]):
+        """
+        Align history with the current metagraph.
+
+        Grows storage to the metagraph size and resets every uid whose
+        hotkey differs from the one its history was recorded under.
+        """
+        self.resize(len(hotkeys))
+
+        known = np.array(
+            (self._hotkeys + [None] * len(hotkeys))[:len(hotkeys)], dtype=object
+        )
+        current = np.array(list(hotkeys), dtype=object)
+        changed = np.flatnonzero((known != current) & (known != None))  # noqa: E711
+
+        if changed.size:
+            logger.info(f"♻️ Resetting score history for {changed.size} re-registered uids")
+            self.reset(changed)
+
+        self._hotkeys = list(hotkeys)
+        with open(self._hotkeys_path, "w") as f:
+            json.dump(self._hotkeys, f)
+
+    # ── Scores ─────────────────────────────────────────────
+
+    def record(self, uids, scores, now: Optional[float] = None):
+        """
+        Append accuracy scores for uids (vectorized).
+
+        A uid may appear more than once; its scores are applied in order.
+        """
+        uids = np.asarray(uids, dtype=np.int64)
+        scores = np.asarray(scores, dtype=np.float32)
+        if uids.size == 0:
+            return
+
+        self.resize(int(uids.max()) + 1)
+        self._data["scored_at"][np.unique(uids)] = time.time() if now is None else now
+
+        # One pass per repeat so duplicate uids land in arrival order
+        while uids.size:
+            _, first = np.unique(uids, return_index=True)
+            self._record_unique(uids[first], scores[first])
+            rest = np.ones(uids.size, dtype=bool)
+            rest[first] = False
+            uids, scores = uids[rest], scores[rest]
+
+    def _record_unique(self, uids: np.ndarray, scores: np.ndarray):
+        data = self._data
+
+        head = data["head"][uids]
+        data["ring"][uids, head] = scores
+        data["head"][uids] = (head + 1) % self.window
+        data["count"][uids] = np.minimum(data["count"][uids] + 1, self.window)
+
+        ema = data["ema"][uids]
+        data["ema"][uids] = np.where(
+            np.isnan(ema), scores, ema + self.ema_alpha * (scores - ema)
+        )
+
+    def reset(self, uids):
+        """Forget all history for the given uids."""
+        uids = np.asarray(uids, dtype=np.int64)
+        self._data["ema"][uids] = np.nan
+        self._data["scored_at"][uids] = 0
+        self._data["ring"][uids] = np.nan
+        self._data["count"][uids] = 0
+        self._data["head"][uids] = 0
+
+    def weights(self, now: Optional[float] = None) -> np.ndarray:
+        """
+        Weight per uid: the accuracy EMA, 0 for unscored uids, decayed by
+        the time since the uid was last scored.
+        """
+        weights = np.nan_to_num(np.asarray(self._data["ema"], dtype=np.float64), nan=0.0)
+        if self.half_life > 0:
+            now = time.time() if now is None else now
+            age = np.maximum(now - np.asarray(self._data["scored_at"]), 0.0)
+            weights *= np.exp2(-age / self.half_life)
+        return weights
+
+    def window_means(self) -> np.ndarray:
+        """Mean of each uid's last `window` scores (NaN if unscored)."""
+        ring = np.asarray(self._data["ring"])
+        counts = np.asarray(self._data["count"])
+        sums = np.nansum(ring, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, sums / counts, np.nan)
+
+    def counts(self) -> np.ndarray:
+        """Number of scores held per uid."""
+        return np.asarray(self._data["count"]).copy()
+
+    # ── Lifecycle ──────────────────────────────────────────
+
+    def flush(self):
+        """Write changes to disk."""
+        self._data.flush()
+
+    def close(self):
+        """Flush and release the memory map."""
+        self._data.flush()
+        del self._data
@@ -0,0 +1,271 @@
+"""
+RugIntel Pending Store — Embedded, Indexed Prediction Storage
+
+Validators hold every miner's prediction for every token until ground
+truth is known. Rewriting all of it as one JSON file after every pass does
+not scale to hundreds of miners and thousands of tokens per day.
+
+Architecture:
+    - SQLite in WAL mode (stdlib, no extra dependency)
+    - tokens: one row per pending token, indexed by verification due time
+    - predictions: one fixed-width numeric row per (token, uid), written
+      incrementally and read back as a NumPy record array
+    - evidence: miners running the same code send identical evidence, so
+      each distinct blob is stored once — content-hashed, zlib-compressed —
+      and only decoded when someone asks for it
+    - Writes are batched into one transaction per token via commit()
+    - Startup only opens the database; nothing is loaded into memory
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from rugintel.latency import STATUS_OK, STATUS_TIMEOUT, STATUS_ERROR
+
+logger = logging.getLogger(__name__)
+
+# One stored prediction; risk is NaN when the miner gave no answer.
+# risk stays float64 so scoring thresholds (e.g. > 0.8) see the exact
+# value sent; evidence_hash is hex (fixed-width bytes drop trailing NULs).
+PREDICTION_DTYPE = np.dtype([
+    ("uid", np.int32),
+    ("risk", np.float64),
+    ("confidence", np.float32),
+    ("time_to_rugpull", np.float32),
+    ("latency", np.float32),
+    ("queried_at", np.int64),
+    ("status", np.int8),
+    ("evidence_hash", "S32"),
+])
+
+STATUS_CODES = {STATUS_OK: 0, STATUS_TIMEOUT: 1, STATUS_ERROR: 2}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tokens (
+    address          TEXT PRIMARY KEY,
+    symbol           TEXT NOT NULL DEFAULT '',
+    launch_timestamp INTEGER NOT NULL,
+    due_at           INTEGER NOT NULL,
+    added_at         INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tokens_due_at ON tokens (due_at);
+
+CREATE TABLE IF NOT EXISTS predictions (
+    address         TEXT NOT NULL,
+    uid             INTEGER NOT NULL,
+    risk            REAL,
+    confidence      REAL,
+    time_to_rugpull REAL,
+    latency         REAL,
+    queried_at      INTEGER NOT NULL,
+    status          INTEGER NOT NULL,
+    evidence_hash   BLOB,
+    PRIMARY KEY (address, uid)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_predictions_evidence
+    ON predictions (evidence_hash);
+
+CREATE TABLE IF NOT EXISTS evidence (
+    hash BLOB PRIMARY KEY,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _evidence_blob(evidence: Any) -> Tuple[bytes, bytes]:
+    """Canonical (hash, compressed JSON) for an evidence payload."""
+    canonical = json.dumps(evidence, sort_keys=True, separators=(",", ":"),
+                           default=str).encode()
+    return hashlib.blake2b(canonical, digest_size=16).digest(), zlib.compress(canonical)
+
+
+class PendingStore:
+    """
+    Predictions awaiting ground-truth verification, keyed by token.
+
+    Writes are not committed until commit() is called, so a token's
+    predictions land on disk in a single transaction.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    # ── Tokens ─────────────────────────────────────────────
+
+    def add_token(self, address: str, launch_timestamp: int, due_at: int,
+                  symbol: str = ""):
+        """Register a token for verification (no-op if already present)."""
+        self._conn.execute(
+            "INSERT OR IGNORE INTO tokens "
+            "(address, symbol, launch_timestamp, due_at, added_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (address, symbol, int(launch_timestamp), int(due_at),
+             int(time.time())),
+        )
+
+    def schedule(self) -> List[Tuple[str, int, int]]:
+        """(address, launch_timestamp, due_at) for every pending token."""
+        return self._conn.execute(
+            "SELECT address, launch_timestamp, due_at FROM tokens ORDER BY due_at"
+        ).fetchall()
+
+    def reschedule(self, address: str, due_at: int):
+        """Move a token's next verification to `due_at`."""
+        self._conn.execute(
+            "UPDATE tokens SET due_at = ? WHERE address = ?",
+            (int(due_at), address),
+        )
+
+    def remove(self, addresses: Iterable[str]):
+        """Drop verified tokens, their predictions and orphaned evidence."""
+        rows = [(address,) for address in addresses]
+        self._conn.executemany("DELETE FROM predictions WHERE address = ?", rows)
+        self._conn.executemany("DELETE FROM tokens WHERE address = ?", rows)
+        self._conn.execute(
+            "DELETE FROM evidence WHERE NOT EXISTS ("
+            "SELECT 1 FROM predictions WHERE evidence_hash = evidence.hash)"
+        )
+
+    def __contains__(self, address: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM tokens WHERE address = ?", (address,)
+        ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+
+    # ── Predictions ────────────────────────────────────────
+
+    def add_prediction(self, address: str, uid: int,
+                       prediction: Dict[str, Any]):
+        """
+        Store (or replace) one miner's prediction for a token.
+
+        `prediction` uses the validator's field names (risk_score,
+        confidence, evidence, time_to_rugpull, latency, queried_at,
+        status); other keys are not kept.
+        """
+        evidence_hash = None
+        evidence = prediction.get("evidence")
+        if evidence:
+            evidence_hash, blob = _evidence_blob(evidence)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO evidence (hash, data) VALUES (?, ?)",
+                (evidence_hash, blob),
+            )
+
+        status = prediction.get("status")
+        if status is None:
+            status = STATUS_OK if prediction.get("risk_score") is not None else STATUS_ERROR
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO predictions "
+            "(address, uid, risk, confidence, time_to_rugpull, latency, "
+            "queried_at, status, evidence_hash) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                address, int(uid),
+                prediction.get("risk_score"),
+                prediction.get("confidence"),
+                prediction.get("time_to_rugpull"),
+                prediction.get("latency"),
+                int(prediction.get("queried_at") or time.time()),
+                STATUS_CODES.get(status, STATUS_CODES[STATUS_ERROR]),
+                evidence_hash,
+            ),
+        )
+
+    def predictions(self, address: str) -> np.ndarray:
+        """All stored predictions for a token as a PREDICTION_DTYPE array."""
+        rows = self._conn.execute(
+            "SELECT uid, risk, confidence, time_to_rugpull, latency, "
+            "queried_at, status, evidence_hash "
+            "FROM predictions WHERE address = ? ORDER BY uid", (address,)
+        ).fetchall()
+
+        nan = float("nan")
+        return np.array([
+            (uid,
+             nan if risk is None else risk,
+             nan if confidence is None else confidence,
+             nan if time_to_rugpull is None else time_to_rugpull,
+             nan if latency is None else latency,
+             queried_at, status,
+             evidence_hash.hex().encode() if evidence_hash else b"")
+            for (uid, risk, confidence, time_to_rugpull, latency,
+                 queried_at, status, evidence_hash) in rows
+        ], dtype=PREDICTION_DTYPE)
+
+    def evidence(self, evidence_hash) -> Optional[Dict[str, Any]]:
+        """Decode one evidence blob by its hex hash (None if absent)."""
+        if not evidence_hash:
+            return None
+        if isinstance(evidence_hash, bytes):
+            evidence_hash = evidence_hash.decode()
+        row = self._conn.execute(
+            "SELECT data FROM evidence WHERE hash = ?",
+            (bytes.fromhex(evidence_hash),),
+        ).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+
+    def prediction_evidence(self, address: str,
+                            uid: int) -> Optional[Dict[str, Any]]:
+        """Evidence a miner sent for a token, loaded on demand."""
+        row = self._conn.execute(
+            "SELECT evidence_hash FROM predictions WHERE address = ? AND uid = ?",
+            (address, int(uid)),
+        ).fetchone()
+        return self.evidence(row[0].hex()) if row and row[0] else None
+
+    def evidence_count(self) -> int:
+        """Number of distinct evidence blobs stored."""
+        return self._conn.execute("SELECT COUNT(*) FROM evidence").fetchone()[0]
+
+    # ── Transactions & lifecycle ───────────────────────────
+
+    def commit(self):
+        """Flush pending writes in one transaction."""
+        self._conn.commit()
+
+    def import_json(self, path: Path, wait_hours: float) -> int:
+        """
+        Import a legacy pending_verifications.json file.
+
+        Returns:
+            Number of tokens imported.
+        """
+        with open(path, "r") as f:
+            data = json.load(f)
+
+        for address, preds in data.items():
+            sample_pred = next(iter(preds.values()), {})
+            launch_ts = int(sample_pred.get("launch_timestamp", 0))
+            self.add_token(
+                address, launch_ts,
+                due_at=launch_ts + int(wait_hours * 3600),
+            )
+            for uid_str, pred in preds.items():
+                self.add_prediction(address, int(uid_str), pred)
+
+        self.commit()
+        return len(data)
+
+    def close(self):
+        """Commit and close the database."""
+        self._conn.commit()
+        self._conn.close()
@@ -7,16 +7,30 @@ Cross-verifies from 3 independent sources:
     2. RugCheck API — Token security status update
     3. DexScreener — Price drop, volume collapse
 
+The three sources are queried concurrently, and each source has its own
+rate limit so a verification backlog cannot trip upstream throttling.
+Tokens are checked at several checkpoints (e.g. 1h, 6h, 24h after launch):
+a rugpull confirmed at an early checkpoint is final, while a token that
+still looks safe waits for the full window.
+
+Batches of due tokens are fetched in bulk: DexScreener's multi-token
+endpoint and JSON-RPC batches pack many tokens into one request, and the
+results are fanned back out per token.
+
 Validators use this to calculate miner accuracy scores,
 which are then used to set_weights() on-chain for Yuma Consensus.
 """
 
 import os
 import time
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
 import aiohttp
+import numpy as np
+
+from rugintel.ratelimit import RateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +55,10 @@ class GroundTruthVerifier:
     DEXSCREENER_BASE = "https://api.dexscreener.com/latest/dex"
     RUGCHECK_BASE = "https://api.rugcheck.xyz/v1"
 
+    # Tokens packed into one bulk request
+    DEXSCREENER_BATCH_SIZE = 30  # API maximum for /tokens/a,b,...
+    RPC_BATCH_SIZE = 100
+
     def __init__(self):
         self.rpc_url = os.getenv(
             "SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com"
@@ -48,6 +66,30 @@ class GroundTruthVerifier:
         self.ground_truth_wait = int(
             os.getenv("GROUND_TRUTH_WAIT_HOURS", "24")
         )
+
+        # Ages (hours) at which pending tokens are checked; the full
+        # ground-truth window is always the last checkpoint
+        requested = {
+            float(h) for h in
+            os.getenv("VERIFICATION_CHECKPOINTS_HOURS", "1,6,24").split(",")
+            if h.strip()
+        }
+        self.checkpoints: List[float] = sorted(
+            h for h in requested if 0 < h < self.ground_truth_wait
+        ) + [float(self.ground_truth_wait)]
+
+        # Per-token requests (RugCheck has no bulk endpoint) in flight
+        # at the same time during verify_many()
+        self.max_concurrent = int(os.getenv("VERIFY_CONCURRENCY", "16"))
+
+        # Requests per second allowed against each source (for Solana
+        # RPC, calls per second: each call in a batch counts)
+        self.rate_limits = {
+            "solana_rpc": RateLimiter(float(os.getenv("SOLANA_RPC_RPS", "10"))),
+            "rugcheck": RateLimiter(float(os.getenv("RUGCHECK_RPS", "5"))),
+            "dexscreener": RateLimiter(float(os.getenv("DEXSCREENER_RPS", "5"))),
+        }
+
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -57,6 +99,19 @@ class GroundTruthVerifier:
             )
         return self._session
 
+    def next_checkpoint(self, launch_timestamp: int, after: float) -> int:
+        """
+        Unix time of the first checkpoint later than `after`.
+
+        Returns the final (full-window) checkpoint once every earlier
+        one has passed.
+        """
+        for hours in self.checkpoints:
+            due_at = int(launch_timestamp + hours * 3600)
+            if due_at > after:
+                return due_at
+        return int(launch_timestamp + self.checkpoints[-1] * 3600)
+
     async def check_24h_outcome(self, token_address: str,
                                  launch_timestamp: int) -> Optional[Dict[str, Any]]:
         """
@@ -74,10 +129,32 @@ class GroundTruthVerifier:
 
         session = await self._get_session()
 
-        # Cross-verify from 3 sources
-        solana_check = await self._check_solana_rpc(session, token_address)
-        rugcheck_result = await self._check_rugcheck_api(session, token_address)
-        dex_result = await self._check_dexscreener(session, token_address)
+        # Cross-verify from 3 sources concurrently
+        solana_check, rugcheck_result, dex_result = await asyncio.gather(
+            self._check_solana_rpc(session, token_address),
+            self._check_rugcheck_api(session, token_address),
+            self._check_dexscreener(session, token_address),
+        )
+
+        return self._build_outcome(
+            solana_check, rugcheck_result, dex_result, now, elapsed_hours
+        )
+
+    def _build_outcome(self, solana_check: dict, rugcheck_result: dict,
+                       dex_result: dict, now: int,
+                       elapsed_hours: float) -> Dict[str, Any]:
+        """
+        Combine the three source checks into one verification result.
+
+        `final` is True once the full ground-truth window has passed; a
+        non-final result is only conclusive if it confirms a rugpull.
+        """
+        final = elapsed_hours >= self.ground_truth_wait
+
+        # A young token without pairs may simply not be indexed yet — only
+        # the final checkpoint may read "unlisted" as a collapse
+        if not final and dex_result.get("unlisted"):
+            dex_result = {"price_change_24h": 0, "unlisted": True}
 
         # Determine if rugpull occurred
         is_rugpull = self._determine_rugpull(
@@ -98,8 +175,66 @@ class GroundTruthVerifier:
             },
             "verified_at": now,
             "hours_after_launch": round(elapsed_hours, 2),
+            "final": final,
         }
 
+    async def verify_many(
+        self, tokens: Iterable[Tuple[str, int]]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Check ground truth for many tokens with bulk requests.
+
+        Tokens past their first checkpoint are checked; results for tokens
+        younger than the full window have `final` set to False.
+
+        DexScreener and Solana RPC lookups are grouped into maximal batches
+        and fanned back out per token; RugCheck is queried per token with
+        at most `max_concurrent` requests in flight. Per-source rate limits
+        apply to every request.
+
+        Args:
+            tokens: (token_address, launch_timestamp) pairs.
+
+        Returns:
+            token_address → result in the check_24h_outcome() format
+            (None if the token has not reached its first checkpoint).
+        """
+        tokens = list(tokens)
+        now = int(time.time())
+        results: Dict[str, Optional[Dict[str, Any]]] = {
+            address: None for address, _ in tokens
+        }
+
+        due = [
+            (address, launch_ts) for address, launch_ts in tokens
+            if (now - launch_ts) / 3600 >= self.checkpoints[0]
+        ]
+        if not due:
+            return results
+
+        session = await self._get_session()
+        addresses = list(dict.fromkeys(address for address, _ in due))
+        slots = asyncio.Semaphore(max(1, self.max_concurrent))
+
+        async def rugcheck_one(address: str):
+            async with slots:
+                return address, await self._check_rugcheck_api(session, address)
+
+        solana_checks, dex_results, rugcheck_results = await asyncio.gather(
+            self._check_solana_rpc_bulk(session, addresses),
+            self._check_dexscreener_bulk(session, addresses),
+            asyncio.gather(*(rugcheck_one(address) for address in addresses)),
+        )
+        rugcheck_results = dict(rugcheck_results)
+
+        for address, launch_ts in due:
+            results[address] = self._build_outcome(
+                solana_checks[address], rugcheck_results[address],
+                dex_results[address], now, (now - launch_ts) / 3600,
+            )
+
+        return results
+
     def _determine_rugpull(self, solana: dict, rugcheck: dict,
                             dex: dict) -> bool:
         """
@@ -160,6 +295,48 @@ class GroundTruthVerifier:
 
         return round(min(max(base_accuracy, 0.0), 1.0), 4)
 
+    def calculate_accuracy_batch(self, predicted_risks,
+                                 actual_rugpull: bool,
+                                 liquidity_drained: bool = False,
+                                 funds_moved: bool = False) -> np.ndarray:
+        """
+        calculate_accuracy() for every miner's prediction on one token.
+
+        Same scoring, severity bonuses and clipping, evaluated as one
+        NumPy expression over the array of predicted risks.
+        """
+        risks = np.asarray(predicted_risks, dtype=np.float64)
+
+        if actual_rugpull:
+            accuracy = risks.copy()
+            if liquidity_drained:
+                accuracy = np.where(
+                    risks > 0.8, np.minimum(accuracy + 0.05, 1.0), accuracy
+                )
+            if funds_moved:
+                accuracy = np.where(
+                    risks > 0.9, np.minimum(accuracy + 0.03, 1.0), accuracy
+                )
+        else:
+            accuracy = 1.0 - risks
+
+        return np.round(np.clip(accuracy, 0.0, 1.0), 4)
+
+    @staticmethod
+    def accuracy_summary(accuracies: np.ndarray, bins: int = 5) -> Dict[str, Any]:
+        """Aggregate view of one token's accuracy scores for logging."""
+        if accuracies.size == 0:
+            return {"miners": 0}
+
+        counts, _ = np.histogram(accuracies, bins=bins, range=(0.0, 1.0))
+        return {
+            "miners": int(accuracies.size),
+            "mean": round(float(accuracies.mean()), 4),
+            "min": round(float(accuracies.min()), 4),
+            "max": round(float(accuracies.max()), 4),
+            "histogram": counts.tolist(),
+        }
+
     async def get_new_tokens(self, limit: int = 10) -> list:
         """
         Fetch recently launched tokens on Solana for analysis.
@@ -203,6 +380,8 @@ class GroundTruthVerifier:
     async def _check_solana_rpc(self, session, token_address: str) -> dict:
         """Query Solana RPC for LP status and wallet movements."""
         try:
+            await self.rate_limits["solana_rpc"].acquire()
+
             # Check largest token accounts to see if LP was removed
             payload = {
                 "jsonrpc": "2.0",
@@ -218,27 +397,104 @@ class GroundTruthVerifier:
             ) as resp:
                 data = await resp.json()
 
-            accounts = data.get("result", {}).get("value", [])
+            return self._parse_largest_accounts(data)
+
+        except Exception as e:
+            logger.error(f"Solana RPC check failed: {e}")
+            return {"lp_removed": False, "cex_deposit": False, "error": str(e)}
+
+    async def _check_solana_rpc_bulk(self, session,
+                                     addresses: list) -> Dict[str, dict]:
+        """Solana RPC checks for many tokens, RPC_BATCH_SIZE per request."""
+        chunks = [
+            addresses[i:i + self.RPC_BATCH_SIZE]
+            for i in range(0, len(addresses), self.RPC_BATCH_SIZE)
+        ]
+        results: Dict[str, dict] = {}
+        for chunk_results in await asyncio.gather(
+            *(self._rpc_largest_accounts_batch(session, chunk) for chunk in chunks)
+        ):
+            results.update(chunk_results)
+        return results
+
+    async def _rpc_largest_accounts_batch(self, session,
+                                          addresses: list) -> Dict[str, dict]:
+        """One JSON-RPC batch of getTokenLargestAccounts calls."""
+        try:
+            # Providers meter each call in a batch, not the HTTP request
+            await self.rate_limits["solana_rpc"].acquire(len(addresses))
+
+            payload = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "getTokenLargestAccounts",
+                    "params": [address],
+                }
+                for i, address in enumerate(addresses)
+            ]
 
-            if not accounts:
-                return {"lp_removed": True, "cex_deposit": False}
+            async with session.post(
+                self.rpc_url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+            ) as resp:
+                data = await resp.json()
 
-            # If the largest account has been emptied, LP was removed
-            largest = float(accounts[0].get("amount", "0")) if accounts else 0
+            # A rejected batch comes back as a single error object
+            if isinstance(data, dict):
+                data = [data]
 
+            # Batch responses may arrive in any order — match on id
+            by_id = {
+                entry.get("id"): entry for entry in data
+                if isinstance(entry, dict)
+            }
             return {
-                "lp_removed": largest == 0,
-                "cex_deposit": False,  # Would need transaction analysis
-                "largest_account_balance": largest,
+                address: self._parse_largest_accounts(by_id.get(i))
+                for i, address in enumerate(addresses)
             }
 
         except Exception as e:
-            logger.error(f"Solana RPC check failed: {e}")
-            return {"lp_removed": False, "cex_deposit": False, "error": str(e)}
+            logger.error(f"Solana RPC batch check failed: {e}")
+            return {
+                address: {"lp_removed": False, "cex_deposit": False,
+                          "error": str(e)}
+                for address in addresses
+            }
+
+    @staticmethod
+    def _parse_largest_accounts(entry: Optional[dict]) -> dict:
+        """Turn one getTokenLargestAccounts response into an LP check."""
+        if entry is None:
+            return {"lp_removed": False, "cex_deposit": False,
+                    "error": "missing from batch response"}
+
+        if "error" in entry:
+            error = entry["error"]
+            message = error.get("message", error) if isinstance(error, dict) else error
+            return {"lp_removed": False, "cex_deposit": False,
+                    "error": str(message)}
+
+        accounts = (entry.get("result") or {}).get("value", [])
+
+        if not accounts:
+            return {"lp_removed": True, "cex_deposit": False}
+
+        # If the largest account has been emptied, LP was removed
+        largest = float(accounts[0].get("amount", "0"))
+
+        return {
+            "lp_removed": largest == 0,
+            "cex_deposit": False,  # Would need transaction analysis
+            "largest_account_balance": largest,
+        }
 
     async def _check_rugcheck_api(self, session, token_address: str) -> dict:
         """Query RugCheck API for current token status."""
         try:
+            await self.rate_limits["rugcheck"].acquire()
+
             url = f"{self.RUGCHECK_BASE}/tokens/{token_address}/report"
             async with session.get(url) as resp:
                 if resp.status != 200:
@@ -263,6 +519,8 @@ class GroundTruthVerifier:
     async def _check_dexscreener(self, session, token_address: str) -> dict:
         """Query DexScreener for 24h price and volume changes."""
         try:
+            await self.rate_limits["dexscreener"].acquire()
+
             url = f"{self.DEXSCREENER_BASE}/tokens/{token_address}"
             async with session.get(url) as resp:
                 if resp.status != 200:
@@ -270,31 +528,98 @@ class GroundTruthVerifier:
 
                 data = await resp.json()
 
-            pairs = data.get("pairs", [])
-            if not pairs:
-                return {
-                    "price_change_24h": -100,  # Token delisted = likely rug
-                    "volume_collapsed": True,
-                }
+            return self._parse_dex_pairs(data.get("pairs") or [])
 
-            pair = pairs[0]
-            price_change = float(
-                pair.get("priceChange", {}).get("h24", 0) or 0
-            )
-            volume_24h = float(
-                pair.get("volume", {}).get("h24", 0) or 0
-            )
+        except Exception as e:
+            logger.error(f"DexScreener check failed: {e}")
+            return {"price_change_24h": 0, "error": str(e)}
 
-            return {
-                "price_change_24h": price_change,
-                "volume_24h": volume_24h,
-                "volume_collapsed": volume_24h < 100,  # <$100 volume = dead
-                "price_usd": float(pair.get("priceUsd", 0) or 0),
+    async def _check_dexscreener_bulk(self, session,
+                                      addresses: list) -> Dict[str, dict]:
+        """DexScreener checks for many tokens, DEXSCREENER_BATCH_SIZE per request."""
+        chunks = [
+            addresses[i:i + self.DEXSCREENER_BATCH_SIZE]
+            for i in range(0, len(addresses), self.DEXSCREENER_BATCH_SIZE)
+        ]
+        results: Dict[str, dict] = {}
+        for chunk_results in await asyncio.gather(
+            *(self._dexscreener_batch(session, chunk) for chunk in chunks)
+        ):
+            results.update(chunk_results)
+        return results
+
+    async def _dexscreener_batch(self, session,
+                                 addresses: list) -> Dict[str, dict]:
+        """
+        One multi-token DexScreener request (/tokens/a,b,...).
+
+        Tokens missing from the response are re-checked one at a time.
+        """
+        try:
+            await self.rate_limits["dexscreener"].acquire()
+
+            url = f"{self.DEXSCREENER_BASE}/tokens/{','.join(addresses)}"
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    return {address: {"price_change_24h": 0}
+                            for address in addresses}
+
+                data = await resp.json()
+
+            # Pairs for all tokens come back in one list — group by base token
+            pairs_by_token: Dict[str, list] = {}
+            for pair in data.get("pairs") or []:
+                base = (pair.get("baseToken") or {}).get("address", "")
+                pairs_by_token.setdefault(base, []).append(pair)
+
+            results = {
+                address: self._parse_dex_pairs(pairs_by_token[address])
+                for address in addresses if address in pairs_by_token
             }
 
+            # A token absent from a multi-token response may have been cut
+            # from a partial answer, not delisted — only a single-token
+            # lookup is trusted to say it has no pairs left
+            missing = [address for address in addresses if address not in results]
+            if len(addresses) == 1:
+                results.update({address: self._parse_dex_pairs([])
+                                for address in missing})
+            elif missing:
+                rechecks = await asyncio.gather(*(
+                    self._check_dexscreener(session, address) for address in missing
+                ))
+                results.update(zip(missing, rechecks))
+            return results
+
         except Exception as e:
-            logger.error(f"DexScreener check failed: {e}")
-            return {"price_change_24h": 0, "error": str(e)}
+            logger.error(f"DexScreener batch check failed: {e}")
+            return {address: {"price_change_24h": 0, "error": str(e)}
+                    for address in addresses}
+
+    @staticmethod
+    def _parse_dex_pairs(pairs: list) -> dict:
+        """Turn a token's DexScreener pairs into a price/volume check."""
+        if not pairs:
+            return {
+                "price_change_24h": -100,  # Token delisted = likely rug
+                "volume_collapsed": True,
+                "unlisted": True,
+            }
+
+        pair = pairs[0]
+        price_change = float(
+            (pair.get("priceChange") or {}).get("h24", 0) or 0
+        )
+        volume_24h = float(
+            (pair.get("volume") or {}).get("h24", 0) or 0
+        )
+
+        return {
+            "price_change_24h": price_change,
+            "volume_24h": volume_24h,
+            "volume_collapsed": volume_24h < 100,  # <$100 volume = dead
+            "price_usd": float(pair.get("priceUsd", 0) or 0),
+        }
 
     async def close(self):
         """Close HTTP session."""
@@ -0,0 +1,194 @@
+"""
+RugIntel Admission Control Tests
+
+Tests for the miner's concurrency cap, load shedding and result cache.
+All tests run offline — no API keys or network access needed.
+"""
+
+import asyncio
+
+import pytest
+
+from rugintel.admission import AdmissionController, ResultCache
+
+
+# ── Admission Controller ──────────────────────────────────
+
+
+class TestAdmissionController:
+    """Test concurrency cap and bounded wait queue."""
+
+    @pytest.mark.asyncio
+    async def test_admits_up_to_cap(self):
+        """Requests within the concurrency cap are admitted."""
+        admission = AdmissionController(max_concurrent=2, max_queued=0)
+
+        async with admission.admit() as first:
+            async with admission.admit() as second:
+                assert first is True
+                assert second is True
+                assert admission.in_flight == 2
+
+        assert admission.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_queue_full(self):
+        """With every slot busy and no queue room, requests are shed."""
+        admission = AdmissionController(max_concurrent=1, max_queued=0)
+
+        async with admission.admit() as first:
+            async with admission.admit() as second:
+                assert first is True
+                assert second is False
+
+        assert admission.stats()["shed_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queued_request_waits_for_slot(self):
+        """A queued request is admitted once a slot frees up."""
+        admission = AdmissionController(max_concurrent=1, max_queued=1)
+        release = asyncio.Event()
+
+        async def hold_slot():
+            async with admission.admit():
+                await release.wait()
+
+        holder = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0)
+
+        async def queued():
+            async with admission.admit() as admitted:
+                return admitted
+
+        waiter = asyncio.create_task(queued())
+        await asyncio.sleep(0)
+        assert admission.waiting == 1
+
+        release.set()
+        assert await waiter is True
+        await holder
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_sheds(self):
+        """A request that waits longer than queue_timeout is shed."""
+        admission = AdmissionController(
+            max_concurrent=1, max_queued=1, queue_timeout=0.01
+        )
+
+        async with admission.admit():
+            async with admission.admit() as admitted:
+                assert admitted is False
+
+        assert admission.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_after_grant_releases_slot(self):
+        """A waiter cancelled right after being granted a slot frees it."""
+        admission = AdmissionController(max_concurrent=1, max_queued=1)
+
+        async def queued():
+            async with admission.admit() as admitted:
+                return admitted
+
+        async with admission.admit():
+            waiter = asyncio.create_task(queued())
+            await asyncio.sleep(0)
+            assert admission.waiting == 1
+
+        # The slot was handed to the waiter, which has not resumed yet
+        assert admission.in_flight == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert admission.in_flight == 0
+        assert admission.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_high_stake_caller_served_first(self):
+        """Under contention, the heavier caller's request is served first."""
+        admission = AdmissionController(max_concurrent=1, max_queued=4)
+        release = asyncio.Event()
+        order = []
+
+        async def hold_slot():
+            async with admission.admit():
+                await release.wait()
+
+        async def request(caller, weight):
+            async with admission.admit(caller=caller, weight=weight) as ok:
+                if ok:
+                    order.append(caller)
+
+        holder = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0)
+        low = asyncio.create_task(request("low", 1.0))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(request("high", 1000.0))
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(holder, low, high)
+        assert order == ["high", "low"]
+
+    @pytest.mark.asyncio
+    async def test_flooding_caller_is_displaced(self):
+        """When the queue is full, a spammer's latest request gives way."""
+        admission = AdmissionController(max_concurrent=1, max_queued=2)
+        release = asyncio.Event()
+
+        async def hold_slot():
+            async with admission.admit():
+                await release.wait()
+
+        async def request(caller, weight):
+            async with admission.admit(caller=caller, weight=weight) as ok:
+                return ok
+
+        holder = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0)
+        spam = [
+            asyncio.create_task(request("spammer", 1.0)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        top = asyncio.create_task(request("top", 100.0))
+        await asyncio.sleep(0)
+
+        release.set()
+        results = await asyncio.gather(*spam, top)
+        await holder
+
+        assert results == [True, False, True]
+
+
+# ── Result Cache ──────────────────────────────────────────
+
+
+class TestResultCache:
+    """Test TTL/LRU cache used for shed responses."""
+
+    def test_hit_reports_age(self):
+        cache = ResultCache(ttl_seconds=60)
+        cache.put("tokenA", {"risk_score": 0.8})
+
+        cached = cache.get("tokenA")
+        assert cached["risk_score"] == 0.8
+        assert "cache_age_seconds" in cached
+
+    def test_expired_entry_is_dropped(self):
+        cache = ResultCache(ttl_seconds=-1)
+        cache.put("tokenA", {"risk_score": 0.8})
+
+        assert cache.get("tokenA") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = ResultCache(ttl_seconds=60, max_entries=2)
+        cache.put("a", {})
+        cache.put("b", {})
+        cache.get("a")  # refresh a
+        cache.put("c", {})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
@@ -0,0 +1,120 @@
+"""
+RugIntel Snapshot Archive Tests
+
+Tests for the chunked columnar archive and the outcome join.
+All tests run offline — no API keys or network access needed.
+"""
+
+import numpy as np
+
+from rugintel import features
+from rugintel.archive import ColumnarArchive, SnapshotArchive, flatten_dtype
+
+
+def make_records(n, start=0, launch_ts=1000):
+    records = features.empty(n)
+    for i in range(n):
+        records["address"][i] = f"Tok{start + i}".encode()
+    records["launch_timestamp"] = launch_ts
+    records["analyzed_at"] = launch_ts + 60
+    records["risk_score"] = np.linspace(0.1, 0.9, n) if n > 1 else 0.5
+    records["market"]["volume_ratio"] = np.arange(start, start + n)
+    return records
+
+
+class TestColumnarArchive:
+    """Test appends, rotation, retention and reopening."""
+
+    def test_flattened_columns(self):
+        names = [name for name, _ in flatten_dtype(features.FEATURE_DTYPE)]
+        assert "risk_score" in names
+        assert "market.volume_ratio" in names
+
+    def test_append_rotates_full_chunks(self, tmp_path):
+        archive = ColumnarArchive(tmp_path, features.FEATURE_DTYPE, chunk_rows=4)
+        archive.append(make_records(10))
+
+        assert len(archive.chunks()) == 3
+        assert len(archive) == 10
+        volume = archive.read(["market.volume_ratio"])["market.volume_ratio"]
+        np.testing.assert_array_equal(volume, np.arange(10))
+
+        # Sealed chunks are trimmed and memory-mappable column by column
+        first = next(archive.iter_chunks(["risk_score"]))["risk_score"]
+        assert isinstance(first, np.memmap)
+        assert len(first) == 4
+
+    def test_reopen_resumes_active_chunk(self, tmp_path):
+        archive = ColumnarArchive(tmp_path, features.FEATURE_DTYPE, chunk_rows=8)
+        archive.append(make_records(3))
+        archive.close()
+
+        reopened = ColumnarArchive(tmp_path, features.FEATURE_DTYPE, chunk_rows=8)
+        reopened.append(make_records(2, start=3))
+
+        assert len(reopened.chunks()) == 1
+        records = reopened.read_records()
+        assert records["address"].tolist() == [b"Tok0", b"Tok1", b"Tok2", b"Tok3", b"Tok4"]
+
+    def test_row_count_is_persisted_at_intervals(self, tmp_path):
+        archive = ColumnarArchive(tmp_path, features.FEATURE_DTYPE,
+                                  chunk_rows=64, meta_interval_rows=4)
+        for i in range(10):
+            archive.append(make_records(1, start=i))
+        chunk = archive.chunks()[0]
+
+        assert archive._read_meta(chunk)["rows"] == 8
+        assert len(archive) == 10
+        archive.flush()
+        assert archive._read_meta(chunk)["rows"] == 10
+
+    def test_retention_drops_oldest_sealed_chunks(self, tmp_path):
+        archive = ColumnarArchive(tmp_path, features.FEATURE_DTYPE,
+                                  chunk_rows=2, max_chunks=2)
+        archive.append(make_records(9))   # 4 full chunks sealed + 1 active
+        archive.rotate()
+
+        assert len(archive.chunks()) == 2
+        assert archive.read(["address"])["address"].tolist() == [
+            b"Tok6", b"Tok7", b"Tok8",
+        ]
+
+
+class TestSnapshotArchive:
+    """Test outcome labelling and the snapshot/outcome join."""
+
+    def test_unlabelled_and_join(self, tmp_path):
+        archive = SnapshotArchive(tmp_path, chunk_rows=16)
+        archive.record(make_records(3, launch_ts=1000))
+        archive.record(make_records(1, start=3, launch_ts=5000))
+        archive.record(make_records(1, start=0, launch_ts=1000))  # Re-analyzed
+
+        due = archive.unlabelled(older_than=2000)
+        assert sorted(address for address, _ in due) == ["Tok0", "Tok1", "Tok2"]
+
+        archive.record_outcomes(
+            {"Tok0": {"is_rugpull": True, "liquidity_drained": True},
+             "Tok2": {"is_rugpull": False}},
+            {"Tok0": 1000, "Tok2": 1000},
+        )
+        assert [address for address, _ in archive.unlabelled(2000)] == ["Tok1"]
+
+        records, outcomes = archive.joined()
+        assert records["address"].tolist() == [b"Tok0", b"Tok2", b"Tok0"]
+        assert outcomes["is_rugpull"].tolist() == [1, 0, 1]
+
+    def test_label_cursor_skips_scanned_rows(self, tmp_path):
+        archive = SnapshotArchive(tmp_path, chunk_rows=16)
+        archive.record(make_records(2, launch_ts=1000))
+        archive.record(make_records(1, start=2, launch_ts=5000))
+
+        assert [a for a, _ in archive.unlabelled(2000)] == ["Tok0", "Tok1"]
+        archive.record_outcomes({"Tok0": {"is_rugpull": True}}, {"Tok0": 1000})
+        archive.mark_labelled()
+        archive.close()
+
+        # Rows behind the cursor are not scanned again, even across restarts;
+        # the row that was not yet due is
+        reopened = SnapshotArchive(tmp_path, chunk_rows=16)
+        reopened.record(make_records(1, start=3, launch_ts=1000))
+        assert [a for a, _ in reopened.unlabelled(6000)] == ["Tok2", "Tok3"]
@@ -0,0 +1,212 @@
+"""
+RugIntel Backtest Tests
+
+Tests for vectorized re-scoring and configuration metrics.
+All tests run offline — no API keys or network access needed.
+"""
+
+import numpy as np
+import pytest
+
+from rugintel import backtest, features
+from rugintel.archive import OUTCOME_DTYPE
+from rugintel.intelligence import TwelveLayerFusion
+from rugintel.layers.base import LayerResult
+from rugintel.layers.layer3_wallet import WalletLayer
+from rugintel.layers.layer4_market import MarketLayer
+from rugintel.layers.layer7_temporal import TemporalLayer
+from rugintel.verification import GroundTruthVerifier
+
+
+def layer_results_for(rng, layers):
+    """Real layer results for random inputs (thresholds from `layers`)."""
+    wallet, market, temporal = layers
+    top = float(rng.choice([0.0, 0.3, 0.5, rng.uniform(0, 0.8)]))
+    wallet_result = wallet._calculate_risk({
+        "top_holder_pct": top,
+        "top_5_pct": min(top + float(rng.uniform(0, 0.5)), 1.0),
+        "top_10_pct": 1.0,
+        "holder_count": int(rng.integers(0, 120)),
+    })
+    market_result = market._calculate_risk({
+        "volume_5m": float(rng.choice([0, rng.uniform(0, 5e5)])),
+        "volume_1h": float(rng.choice([0, rng.uniform(0, 1e5)])),
+        "liquidity_usd": float(rng.choice([5000, rng.uniform(0, 4e4)])),
+        "txns_buys_5m": int(rng.integers(0, 30)),
+        "txns_sells_5m": int(rng.integers(0, 30)),
+        "price_change_5m": float(rng.uniform(-100, 400)),
+    })
+    # Whole minutes, so hours derived from stored minutes match the layer's
+    age = 60 * int(rng.choice([-1, 0, 5, 12, 30, 60, rng.integers(1, 600)]))
+    temporal_result = temporal._calculate_risk(
+        {
+            "minutes_since_launch": round(age / 60, 1) if age > 0 else -1,
+            "hours_since_launch": round(age / 3600, 2) if age > 0 else -1,
+            "token_age_seconds": age,
+        },
+        {"price_change_5m": float(rng.uniform(-80, 700)),
+         "price_change_1h": float(rng.uniform(0, 300))},
+    )
+
+    results = {
+        name: LayerResult(score=round(float(rng.uniform()), 4), confidence=0.5)
+        for name in TwelveLayerFusion.LAYER_NAMES
+    }
+    for name, result in (("wallet", wallet_result), ("market", market_result),
+                         ("temporal", temporal_result)):
+        result.confidence = 0.5
+        results[name] = result
+    return results
+
+
+def make_history(n, seed=0, layers=None):
+    """n feature records built the way the miner builds them."""
+    rng = np.random.default_rng(seed)
+    layers = layers or (WalletLayer(), MarketLayer(), TemporalLayer())
+    fusion = TwelveLayerFusion()
+    records = []
+    for i in range(n):
+        layer_results = layer_results_for(rng, layers)
+        result = {
+            "risk_score": fusion._fuse_scores(layer_results),
+            "confidence": 0.5,
+            "layers": layer_results,
+        }
+        records.append(features.to_record(f"Tok{i}", 1000, result, analyzed_at=1060))
+    return features.stack(records)
+
+
+def make_outcomes(records, rugged):
+    outcomes = np.zeros(len(records), dtype=OUTCOME_DTYPE)
+    outcomes["address"] = records["address"]
+    outcomes["is_rugpull"] = rugged
+    outcomes["liquidity_drained"] = rugged
+    return outcomes
+
+
+class TestRescoring:
+    """Test that array rules reproduce the layers and the fusion."""
+
+    def test_live_configuration_reproduces_archived_scores(self):
+        records = make_history(200)
+
+        risks = backtest.risk_scores(records, {})
+
+        assert risks.shape == (1, 200)
+        # np.round and round() may split a tie differently: one unit at most
+        np.testing.assert_allclose(risks[0], records["risk_score"], atol=1e-4 + 1e-9)
+
+    def test_thresholds_match_layer_rules(self):
+        overrides = {
+            "wallet.TOP_HOLDER_CRITICAL_PCT": 0.3,
+            "wallet.MIN_HOLDER_COUNT": 80,
+            "market.VOLUME_SPIKE_CRITICAL": 30,
+            "market.LOW_LIQUIDITY_USD": 15000,
+            "temporal.HIGH_RISK_WINDOW": 20,
+            "temporal.LOW_RISK_WINDOW": 120,
+        }
+        layers = (WalletLayer(), MarketLayer(), TemporalLayer())
+        for name, value in overrides.items():
+            layer, constant = name.split(".")
+            instance = layers[["wallet", "market", "temporal"].index(layer)]
+            setattr(instance, constant, value)
+        expected = make_history(200, layers=layers)
+        records = make_history(200)   # Same inputs, live thresholds
+
+        configs = backtest.expand(overrides)
+        for layer in ("wallet", "market", "temporal"):
+            table, index = backtest.layer_score_table(records, layer, configs)
+            np.testing.assert_allclose(table[index[0]], expected[layer]["score"])
+
+    def test_missing_features_keep_archived_score(self):
+        records = make_history(3)
+        records["wallet"]["top_holder_pct"][1] = np.nan
+        records["wallet"]["score"][1] = 0.5
+
+        configs = backtest.expand({"wallet.TOP_HOLDER_CRITICAL_PCT": [0.0]})
+        table, index = backtest.layer_score_table(records, "wallet", configs)
+
+        assert table[index[0]][1] == 0.5
+        assert table[index[0]][0] >= 0.9
+
+    def test_layer_tables_are_shared_across_configurations(self):
+        records = make_history(10)
+        configs = backtest.grid({"weights.social": [0.0, 0.5, 1.0],
+                                 "wallet.TOP_HOLDER_CRITICAL_PCT": [0.4, 0.6]})
+
+        table, index = backtest.layer_score_table(records, "wallet", configs)
+
+        assert len(configs["weights.social"]) == 7       # live + 3 × 2
+        assert table.shape == (3, 10)                    # 0.4, 0.5 (live), 0.6
+        assert len(set(index.tolist())) == 3
+
+    def test_unknown_parameter_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown"):
+            backtest.expand({"wallet.NOT_A_THRESHOLD": 1.0})
+
+
+class TestMetrics:
+    """Test accuracy and calibration metrics per configuration."""
+
+    def test_accuracy_matches_validator_scoring(self):
+        records = make_history(50)
+        rugged = records["risk_score"] > 0.5
+        outcomes = make_outcomes(records, rugged)
+
+        results = backtest.evaluate(records, outcomes, {})
+
+        verifier = GroundTruthVerifier()
+        expected = np.mean([
+            verifier.calculate_accuracy(float(risk), bool(rug), bool(rug))
+            for risk, rug in zip(records["risk_score"], rugged)
+        ])
+        assert results["accuracy"][0] == pytest.approx(expected, abs=1e-4)
+        assert results["brier"][0] == pytest.approx(
+            np.mean((records["risk_score"] - rugged) ** 2), abs=1e-4
+        )
+
+    def test_calibration_error(self):
+        risks = np.array([[0.05, 0.05, 0.95, 0.95],
+                          [0.55, 0.55, 0.55, 0.55]])
+        labels = np.array([0.0, 0.0, 1.0, 1.0])
+
+        ece = backtest.calibration_error(risks, labels, bins=10)
+
+        np.testing.assert_allclose(ece, [0.05, 0.05])
+
+    def test_blocks_match_single_pass(self, monkeypatch):
+        records = make_history(40)
+        outcomes = make_outcomes(records, records["temporal"]["score"] > 0.5)
+        configs = backtest.grid({"weights.temporal": np.linspace(0, 0.5, 11)})
+
+        whole = backtest.evaluate(records, outcomes, configs)
+        monkeypatch.setattr(backtest, "BLOCK_ELEMENTS", 100)
+        blocked = backtest.evaluate(records, outcomes, configs)
+
+        for metric in backtest.METRICS:
+            np.testing.assert_allclose(blocked[metric], whole[metric])
+
+
+class TestCommandLine:
+    """Test the python -m rugintel.backtest entry point."""
+
+    def test_backtest_from_files(self, tmp_path, capsys):
+        records = make_history(30)
+        features.save(tmp_path / "features.npy", records)
+        np.save(tmp_path / "outcomes.npy",
+                make_outcomes(records, records["risk_score"] > 0.5))
+
+        status = backtest.main([
+            "--features", str(tmp_path / "features.npy"),
+            "--outcomes", str(tmp_path / "outcomes.npy"),
+            "--grid", "wallet.TOP_HOLDER_CRITICAL_PCT=0.3:0.7:5",
+            "--grid", "weights.market=0.05,0.1",
+            "--output", str(tmp_path / "results.npy"),
+        ])
+
+        assert status == 0
+        assert "30 labelled records" in capsys.readouterr().out
+        results = np.load(tmp_path / "results.npy")
+        assert len(results) == 11
+        assert results["wallet.TOP_HOLDER_CRITICAL_PCT"][0] == \
+            WalletLayer.TOP_HOLDER_CRITICAL_PCT
@@ -0,0 +1,288 @@
+"""
+RugIntel Discovery Tests
+
+Tests for the seen-set and streaming DexScreener discovery.
+Upstream responses are canned — no network access needed.
+"""
+
+import time
+
+import pytest
+
+from rugintel.discovery import (
+    DexScreenerDiscovery, RaydiumPoolDiscovery, SeenSet, merge_streams,
+)
+
+AMM = RaydiumPoolDiscovery.RAYDIUM_AMM_V4
+WSOL = RaydiumPoolDiscovery.WSOL_MINT
+
+
+def make_pair(address, age_seconds):
+    return {
+        "pairCreatedAt": int((time.time() - age_seconds) * 1000),
+        "baseToken": {"address": address, "name": address.title(),
+                      "symbol": address.upper()},
+    }
+
+
+def make_init_tx(signature, mint, block_time, inner=False, coin=WSOL):
+    """jsonParsed getTransaction result for a Raydium initialize2."""
+    accounts = [f"acct{i}" for i in range(21)]
+    accounts[4] = f"pool-{mint}"
+    accounts[8], accounts[9] = coin, mint
+    ix = {"programId": AMM, "accounts": accounts, "data": "x"}
+    message_ixs = [] if inner else [ix]
+    inner_ixs = [{"index": 0, "instructions": [ix]}] if inner else []
+    return {
+        "blockTime": block_time,
+        "transaction": {"signatures": [signature],
+                        "message": {"instructions": message_ixs}},
+        "meta": {"err": None, "innerInstructions": inner_ixs,
+                 "logMessages": ["Program log: initialize2: InitializeInstruction2"]},
+    }
+
+
+def make_swap_tx(signature):
+    return {
+        "blockTime": 1,
+        "transaction": {"signatures": [signature], "message": {"instructions": [
+            {"programId": AMM, "accounts": [f"a{i}" for i in range(18)]},
+        ]}},
+        "meta": {"err": None, "logMessages": ["Program log: ray_log: swap"]},
+    }
+
+
+class MockRPC:
+    """In-memory Solana node serving the AMM's signature history."""
+
+    def __init__(self):
+        self.history = []     # newest first
+        self.txs = {}
+        self.calls = []
+
+    def add(self, signature, tx, err=None):
+        self.history.insert(0, {"signature": signature, "err": err})
+        self.txs[signature] = tx
+
+    async def rpc(self, method, params):
+        self.calls.append(method)
+        assert method == "getSignaturesForAddress"
+        options = params[1]
+        entries = self.history
+        if "before" in options:
+            index = [e["signature"] for e in entries].index(options["before"])
+            entries = entries[index + 1:]
+        if "until" in options:
+            signatures = [e["signature"] for e in entries]
+            if options["until"] in signatures:
+                entries = entries[:signatures.index(options["until"])]
+        return entries[:options["limit"]]
+
+    async def rpc_batch(self, calls):
+        self.calls.append("batch")
+        return [self.txs.get(params[0]) for _, params in calls]
+
+
+def make_raydium(rpc, **kwargs):
+    discovery = RaydiumPoolDiscovery(rpc_url="http://mock", **kwargs)
+    discovery._rpc = rpc.rpc
+    discovery._rpc_batch = rpc.rpc_batch
+    return discovery
+
+
+class TestSeenSet:
+    """Test dedup and bounded rotation."""
+
+    def test_add_reports_new_keys(self):
+        seen = SeenSet()
+
+        assert seen.add("a") is True
+        assert seen.add("a") is False
+        assert "a" in seen
+
+    def test_memory_is_bounded(self):
+        seen = SeenSet(capacity=10)
+        for i in range(100):
+            seen.add(f"token{i}")
+
+        assert len(seen) <= 10
+        assert "token99" in seen
+        assert "token0" not in seen
+
+
+class TestDexScreenerDiscovery:
+    """Test polling, filtering and exactly-once emission."""
+
+    @pytest.mark.asyncio
+    async def test_emits_each_launch_once(self):
+        discovery = DexScreenerDiscovery(poll_interval=0)
+        pages = [
+            [make_pair("a", 60), make_pair("b", 120), make_pair("old", 7200)],
+            [make_pair("b", 130), make_pair("c", 10)],
+        ]
+
+        async def fetch_pairs():
+            return pages.pop(0) if pages else []
+
+        discovery._fetch_pairs = fetch_pairs
+
+        first = await discovery.poll_once()
+        second = await discovery.poll_once()
+
+        assert [t["address"] for t in first] == ["a", "b"]
+        assert [t["address"] for t in second] == ["c"]
+        assert first[0]["symbol"] == "A"
+        assert first[0]["source"] == "dexscreener"
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_all_new_pairs(self):
+        discovery = DexScreenerDiscovery(poll_interval=0)
+        page = [make_pair(f"token{i}", 30) for i in range(120)]
+
+        async def fetch_pairs():
+            return page
+
+        discovery._fetch_pairs = fetch_pairs
+
+        stream = discovery.stream()
+        tokens = [await stream.__anext__() for _ in range(120)]
+        await stream.aclose()
+
+        assert len({t["address"] for t in tokens}) == 120
+
+    @pytest.mark.asyncio
+    async def test_stream_survives_upstream_errors(self):
+        discovery = DexScreenerDiscovery(poll_interval=0)
+        calls = []
+
+        async def fetch_pairs():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("upstream down")
+            return [make_pair("a", 5)]
+
+        discovery._fetch_pairs = fetch_pairs
+
+        stream = discovery.stream()
+        token = await stream.__anext__()
+        await stream.aclose()
+
+        assert token["address"] == "a"
+        assert len(calls) == 2
+
+
+class TestRaydiumPoolDiscovery:
+    """Test decoding, paging and checkpointing against a mock RPC."""
+
+    def test_decodes_pool_init(self):
+        token = RaydiumPoolDiscovery.decode_pool_init(
+            make_init_tx("sig1", "MintA", 1700000000)
+        )
+
+        assert token["address"] == "MintA"
+        assert token["timestamp"] == 1700000000
+        assert token["pool"] == "pool-MintA"
+        assert token["source"] == "raydium"
+
+    def test_decodes_cpi_and_non_sol_pair(self):
+        token = RaydiumPoolDiscovery.decode_pool_init(
+            make_init_tx("sig1", "MintB", 1, inner=True, coin="MintC")
+        )
+
+        # Neither side is SOL: the coin-side mint is the launched token
+        assert token["address"] == "MintC"
+
+    def test_ignores_other_transactions(self):
+        failed = make_init_tx("sig1", "MintA", 1)
+        failed["meta"]["err"] = {"InstructionError": [0, "Custom"]}
+
+        assert RaydiumPoolDiscovery.decode_pool_init(make_swap_tx("s")) is None
+        assert RaydiumPoolDiscovery.decode_pool_init(failed) is None
+        assert RaydiumPoolDiscovery.decode_pool_init(None) is None
+
+    @pytest.mark.asyncio
+    async def test_pages_back_to_checkpoint(self, tmp_path):
+        rpc = MockRPC()
+        rpc.add("sig0", make_init_tx("sig0", "Old", 10))
+        checkpoint = tmp_path / "raydium.json"
+        discovery = make_raydium(rpc, checkpoint_path=checkpoint, page_size=2)
+
+        first = await discovery.poll_once()
+        assert [t["address"] for t in first] == ["Old"]
+
+        for i in range(1, 6):
+            tx = make_init_tx(f"sig{i}", f"Mint{i}", 10 + i) if i % 2 else make_swap_tx(f"sig{i}")
+            rpc.add(f"sig{i}", tx)
+        rpc.add("sigF", make_init_tx("sigF", "Failed", 99), err={"x": 1})
+
+        second = await discovery.poll_once()
+
+        assert [t["address"] for t in second] == ["Mint1", "Mint3", "Mint5"]
+        assert discovery.last_signature == "sigF"
+        assert await discovery.poll_once() == []
+
+        # A restart resumes from the checkpoint instead of re-reading history
+        rpc.add("sig9", make_init_tx("sig9", "Mint9", 20))
+        restarted = make_raydium(rpc, checkpoint_path=checkpoint, page_size=2)
+        assert [t["address"] for t in await restarted.poll_once()] == ["Mint9"]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_not_advanced_on_failure(self):
+        rpc = MockRPC()
+        rpc.add("sig1", make_init_tx("sig1", "MintA", 1))
+        discovery = make_raydium(rpc)
+
+        async def broken_batch(calls):
+            raise RuntimeError("rpc down")
+
+        discovery._rpc_batch = broken_batch
+        with pytest.raises(RuntimeError):
+            await discovery.poll_once()
+        assert discovery.last_signature is None
+
+        discovery._rpc_batch = rpc.rpc_batch
+        assert [t["address"] for t in await discovery.poll_once()] == ["MintA"]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_stops_before_unfetched_transaction(self):
+        rpc = MockRPC()
+        for i in range(1, 5):
+            rpc.add(f"sig{i}", make_init_tx(f"sig{i}", f"Mint{i}", i))
+        discovery = make_raydium(rpc, batch_size=2)
+        missing = rpc.txs.pop("sig3")   # Errored / rate limited in the batch
+
+        first = await discovery.poll_once()
+
+        assert [t["address"] for t in first] == ["Mint1", "Mint2"]
+        assert discovery.last_signature == "sig2"
+
+        rpc.txs["sig3"] = missing
+        second = await discovery.poll_once()
+
+        assert [t["address"] for t in second] == ["Mint3", "Mint4"]
+        assert discovery.last_signature == "sig4"
+
+    def test_polls_pool_creation_account(self):
+        discovery = RaydiumPoolDiscovery(rpc_url="http://mock")
+
+        # Only initialize2 touches the fee account — no swaps to page through
+        assert discovery.address == RaydiumPoolDiscovery.RAYDIUM_POOL_FEE
+
+    @pytest.mark.asyncio
+    async def test_shared_seen_set_across_sources(self):
+        rpc = MockRPC()
+        rpc.add("sig1", make_init_tx("sig1", "MintA", int(time.time())))
+        seen = SeenSet()
+        raydium = make_raydium(rpc, seen=seen, poll_interval=0)
+        dexscreener = DexScreenerDiscovery(poll_interval=0, seen=seen)
+
+        async def fetch_pairs():
+            return [make_pair("MintA", 30), make_pair("MintB", 30)]
+
+        dexscreener._fetch_pairs = fetch_pairs
+
+        stream = merge_streams(raydium.stream(), dexscreener.stream())
+        tokens = [await stream.__anext__() for _ in range(2)]
+        await stream.aclose()
+
+        assert sorted(t["address"] for t in tokens) == ["MintA", "MintB"]
@@ -0,0 +1,81 @@
+"""
+RugIntel Feature Schema Tests
+
+Tests for fixed-layout per-token feature records.
+All tests run offline — no API keys or network access needed.
+"""
+
+import numpy as np
+import pytest
+
+from rugintel import features
+from rugintel.intelligence import TwelveLayerFusion
+from rugintel.layers.base import LayerResult
+from rugintel.layers.layer4_market import MarketLayer
+
+
+def make_result(fusion, volume_ratio=150.0):
+    """An analyze()-shaped result built from a real layer result."""
+    market = MarketLayer()._calculate_risk({
+        "volume_5m": volume_ratio * 1000,
+        "volume_1h": 12000,
+        "liquidity_usd": 2000,
+        "txns_buys_5m": 40,
+        "txns_sells_5m": 2,
+        "price_change_5m": 50,
+    })
+    layer_results = {
+        name: LayerResult(score=0.5, confidence=0.5)
+        for name in fusion.LAYER_NAMES
+    }
+    layer_results["market"] = market
+    layer_results["wallet"] = LayerResult(score=0.5, confidence=0.0,
+                                          error="RPC down")
+    return {
+        "risk_score": 0.8123,
+        "confidence": 0.55,
+        "layers": layer_results,
+    }
+
+
+class TestFeatureRecords:
+    """Test record assembly, stacking and memmapped persistence."""
+
+    def test_layers_follow_fusion_order(self):
+        assert list(features.LAYER_CLASSES) == TwelveLayerFusion.LAYER_NAMES
+
+    def test_record_from_analysis_result(self):
+        fusion = TwelveLayerFusion()
+        record = fusion.feature_record("Tok", 1700000000, make_result(fusion))
+
+        assert record.shape == ()
+        assert record["schema_version"] == features.FEATURE_SCHEMA_VERSION
+        assert record["address"] == b"Tok"
+        assert record["risk_score"] == 0.8123          # float64, exact
+        assert record["market"]["volume_ratio"] == pytest.approx(150.0)
+        assert record["market"]["txns_5m_sells"] == 2
+        assert record["wallet"]["failed"] == 1
+        assert np.isnan(record["wallet"]["top_holder_pct"])
+
+    def test_stack_save_and_memmap(self, tmp_path):
+        fusion = TwelveLayerFusion()
+        records = features.stack(
+            fusion.feature_record(f"Tok{i}", i, make_result(fusion, 100.0 + i))
+            for i in range(3)
+        )
+        path = tmp_path / "features.npy"
+        features.save(path, records)
+
+        loaded = features.load(path)
+        assert isinstance(loaded, np.memmap)
+        assert loaded.shape == (3,)
+        np.testing.assert_allclose(loaded["market"]["volume_ratio"],
+                                   [100.0, 101.0, 102.0])
+
+    def test_schema_mismatch_is_rejected(self, tmp_path):
+        path = tmp_path / "old.npy"
+        np.save(path, np.zeros(2, dtype=[("schema_version", np.uint16),
+                                         ("risk_score", np.float64)]))
+
+        with pytest.raises(ValueError, match="version 0"):
+            features.load(path)
@@ -6,11 +6,14 @@ All tests run offline — no API keys or network access needed.
 """
 
 import asyncio
+import json
+import time
 from unittest.mock import AsyncMock, patch, MagicMock
 
 import pytest
 
 from rugintel.layers.base import LayerResult
+from rugintel.layers.reasons import ReasonCode
 from rugintel.intelligence import TwelveLayerFusion
 from rugintel.verification import GroundTruthVerifier
 
@@ -126,7 +129,7 @@ class TestTwelveLayerFusion:
         fusion = TwelveLayerFusion()
 
         results = {
-            name: LayerResult(score=0.5, confidence=0.5, evidence={"test": True})
+            name: LayerResult(score=0.5, confidence=0.5, details={"test": True})
             for name in fusion.LAYER_NAMES
         }
 
@@ -137,6 +140,89 @@ class TestTwelveLayerFusion:
             assert "score" in evidence[name]
             assert "weight" in evidence[name]
 
+    def test_evidence_levels(self):
+        """none → None; compact → fixed numeric keys; full → unchanged."""
+        fusion = TwelveLayerFusion()
+
+        results = {
+            name: LayerResult(score=0.5, confidence=0.5)
+            for name in fusion.LAYER_NAMES
+        }
+        results["market"] = fusion.layers["market"]._result(
+            0.9, 0.65, [None, None, 150.0, 1200, None, 40, 2],
+        )
+        results["market"].reasons.add(ReasonCode.MARKET_VOLUME_SPIKE, ratio=150.0)
+        results["contract"] = fusion.layers["contract"]._result(
+            0.8, 0.65, [None, True, None, None, None],
+            note="RugCheck has 22% false negative rate",
+        )
+
+        full = fusion._compile_evidence(results)
+        compact = fusion._compile_evidence(results, level="compact")
+
+        assert fusion._compile_evidence(results, level="none") is None
+        assert full["market"]["evidence"]["reasons"]
+        assert compact["market"]["volume_ratio"] == 150.0
+        assert compact["market"]["txns_5m_sells"] == 2.0
+        assert compact["market"]["price_change_5m"] is None
+        assert compact["contract"]["mint_authority"] == 1.0
+        assert compact["shed"] == 0.0 and compact["degraded"] == 0.0
+        assert all(
+            not isinstance(value, str)
+            for name in fusion.LAYER_NAMES for value in compact[name].values()
+        )
+        assert len(json.dumps(compact)) < len(json.dumps(full))
+
+    def test_compact_evidence_keeps_shed_flags(self):
+        """A shed answer stays recognizable after compaction."""
+        fusion = TwelveLayerFusion()
+        results = {
+            name: LayerResult(score=0.5, confidence=0.2)
+            for name in fusion.LAYER_NAMES
+        }
+        shed = {"layers": results, "shed": True, "degraded_mode": "fast"}
+
+        compact = fusion.evidence_at_level(shed, "compact")
+
+        assert compact["shed"] == 1.0
+        assert compact["degraded"] == 2.0
+        assert compact["market"]["score"] == 0.5
+        assert fusion.evidence_at_level(shed, "full")["shed"] is True
+
+    @pytest.mark.asyncio
+    async def test_analyze_fast_is_offline_and_low_confidence(self):
+        """Degraded analysis uses cheap layers only and stays low-confidence."""
+        fusion = TwelveLayerFusion()
+
+        result = await fusion.analyze_fast(
+            "FakeToken", launch_timestamp=int(time.time()) - 120
+        )
+
+        assert set(result["layers"]) == set(fusion.LAYER_NAMES)
+        assert result["layers"]["liquidity"].confidence == 0.0
+        assert result["layers"]["temporal"].score >= 0.9
+        assert result["confidence"] < 0.5
+        await fusion.close()
+
+    @pytest.mark.asyncio
+    async def test_analyze_reports_each_layer_as_it_finishes(self):
+        """on_layer is awaited once per layer with its result."""
+        fusion = TwelveLayerFusion()
+        for layer in fusion.layers.values():
+            layer.safe_analyze = AsyncMock(
+                return_value=LayerResult(score=0.6, confidence=0.5)
+            )
+        seen = {}
+
+        async def on_layer(name, result):
+            seen[name] = result.score
+
+        result = await fusion.analyze("FakeToken", on_layer=on_layer)
+
+        assert seen == {name: 0.6 for name in fusion.LAYER_NAMES}
+        assert result["risk_score"] == 0.6
+        await fusion.close()
+
 
 # ── Ground Truth Verifier Tests ────────────────────────────
 
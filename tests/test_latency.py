@@ -0,0 +1,116 @@
+"""
+RugIntel Miner Latency Tests
+
+Tests for response classification and per-uid latency summaries.
+All tests run offline — no API keys or network access needed.
+"""
+
+from rugintel.latency import (
+    MinerLatencyTracker, classify_status,
+    STATUS_OK, STATUS_TIMEOUT, STATUS_ERROR,
+)
+
+
+class TestClassifyStatus:
+    """Test dendrite status code classification."""
+
+    def test_ok(self):
+        assert classify_status(200) == STATUS_OK
+        assert classify_status("200") == STATUS_OK
+
+    def test_timeout(self):
+        assert classify_status(408) == STATUS_TIMEOUT
+
+    def test_error(self):
+        assert classify_status(503) == STATUS_ERROR
+        assert classify_status(None) == STATUS_ERROR
+
+
+class TestMinerLatencyTracker:
+    """Test per-uid latency statistics."""
+
+    def test_summary_counts(self):
+        tracker = MinerLatencyTracker()
+        tracker.record(3, 1.0, STATUS_OK)
+        tracker.record(3, 3.0, STATUS_OK)
+        tracker.record(3, 30.0, STATUS_TIMEOUT)
+        tracker.record(3, 0.1, STATUS_ERROR)
+
+        summary = tracker.summary(3)
+        assert summary["queries"] == 4
+        assert summary["ok"] == 2
+        assert summary["timeouts"] == 1
+        assert summary["errors"] == 1
+        assert summary["timeout_rate"] == 0.25
+        assert summary["latency_p50"] == 3.0    # Timeout sampled, error not
+
+    def test_failures_do_not_skew_latency(self):
+        tracker = MinerLatencyTracker()
+        tracker.record(1, 2.0, STATUS_OK)
+        tracker.record(1, 30.0, STATUS_TIMEOUT)
+
+        assert tracker.summary(1)["latency_ema"] == 2.0
+
+    def test_unknown_uid(self):
+        tracker = MinerLatencyTracker()
+
+        assert tracker.summary(42) == {"queries": 0}
+        assert tracker.summaries() == {}
+
+    def test_timeout_defaults_to_max_without_history(self):
+        tracker = MinerLatencyTracker(min_timeout=5.0, max_timeout=30.0)
+
+        assert tracker.timeout_for(7) == 30.0
+
+    def test_timeout_tracks_miner_latency(self):
+        tracker = MinerLatencyTracker(min_timeout=5.0, max_timeout=30.0)
+        for _ in range(10):
+            tracker.record(1, 8.0, STATUS_OK)
+            tracker.record(2, 1.0, STATUS_OK)
+
+        assert tracker.timeout_for(1) == 12.0   # 8s × 1.5 margin
+        assert tracker.timeout_for(2) == 5.0    # clamped to minimum
+
+    def test_timeouts_back_off_upward(self):
+        tracker = MinerLatencyTracker(min_timeout=5.0, max_timeout=30.0)
+        for _ in range(10):
+            tracker.record(4, 1.0, STATUS_OK)
+        assert tracker.timeout_for(4) == 5.0
+
+        tracker.record(4, 5.0, STATUS_TIMEOUT, timeout=5.0)
+        assert tracker.timeout_for(4) == 10.0
+        tracker.record(4, 10.0, STATUS_TIMEOUT, timeout=10.0)
+        assert tracker.timeout_for(4) == 27.6   # p90 4.6s × 1.5 × 2²
+        tracker.record(4, 27.6, STATUS_TIMEOUT, timeout=27.6)
+        assert tracker.timeout_for(4) == 30.0   # Capped at the maximum
+
+        tracker.record(4, 2.0, STATUS_OK)
+        assert tracker.timeout_for(4) < 30.0    # Streak over
+
+    def test_errors_do_not_change_timeout(self):
+        tracker = MinerLatencyTracker(min_timeout=5.0, max_timeout=30.0)
+        for _ in range(10):
+            tracker.record(4, 8.0, STATUS_OK)
+        for _ in range(5):
+            tracker.record(4, 0.1, STATUS_ERROR)
+
+        assert tracker.timeout_for(4) == 12.0
+
+    def test_slow_period_recovers(self):
+        """A miner that slows from 1s to 8s answers again within a few queries."""
+        tracker = MinerLatencyTracker(min_timeout=5.0, max_timeout=30.0)
+        for _ in range(10):
+            tracker.record(4, 1.0, STATUS_OK)
+
+        answered = []
+        for _ in range(20):
+            timeout = tracker.timeout_for(4)
+            if timeout >= 8.0:
+                tracker.record(4, 8.0, STATUS_OK, timeout=timeout)
+            else:
+                tracker.record(4, timeout, STATUS_TIMEOUT, timeout=timeout)
+            answered.append(timeout >= 8.0)
+
+        assert all(answered[-10:])
+        assert tracker.timeout_for(4) >= 8.0
+        assert tracker.summary(4)["timeouts"] < 5
@@ -9,6 +9,7 @@ import asyncio
 import json
 from unittest.mock import AsyncMock, patch, MagicMock
 
+import numpy as np
 import pytest
 import pytest_asyncio
 
@@ -67,12 +68,12 @@ class TestSocialLayer:
             for i in range(15)
         }
 
-        signals = layer._detect_pump_signals(tweets, users)
+        result = layer._detect_pump_signals(tweets, users)
 
-        assert signals["score"] > 0.5  # Should detect pump signals
-        assert signals["new_accounts"] >= 10
-        assert signals["shill_keywords"] > 0
-        assert signals["low_follower_bots"] > 0
+        assert result.score > 0.5  # Should detect pump signals
+        assert result.feature("new_accounts") >= 10
+        assert result.feature("shill_keywords") > 0
+        assert result.feature("low_follower_bots") > 0
 
 
 # ── Layer 2: Liquidity ─────────────────────────────────────
@@ -88,10 +89,10 @@ class TestLiquidityLayer:
         lp_info = {"pool_found": False}
         lock_status = {"locked": False}
 
-        score, evidence = layer._calculate_risk(lp_info, lock_status)
+        result = layer._calculate_risk(lp_info, lock_status)
 
-        assert score == 0.8
-        assert "No liquidity pool found" in evidence["reasons"]
+        assert result.score == 0.8
+        assert "No liquidity pool found" in result.reasons
 
     def test_risk_calculation_unlocked(self):
         """Unlocked LP should score 0.9."""
@@ -100,10 +101,10 @@ class TestLiquidityLayer:
         lp_info = {"pool_found": True}
         lock_status = {"locked": False}
 
-        score, evidence = layer._calculate_risk(lp_info, lock_status)
+        result = layer._calculate_risk(lp_info, lock_status)
 
-        assert score == 0.9
-        assert "NOT locked" in evidence["reasons"][0]
+        assert result.score == 0.9
+        assert "NOT locked" in result.reasons[0]
 
     def test_risk_calculation_short_lock(self):
         """LP locked < 72h should score 0.7."""
@@ -112,9 +113,9 @@ class TestLiquidityLayer:
         lp_info = {"pool_found": True}
         lock_status = {"locked": True, "lock_duration_hours": 48}
 
-        score, evidence = layer._calculate_risk(lp_info, lock_status)
+        result = layer._calculate_risk(lp_info, lock_status)
 
-        assert score == 0.7
+        assert result.score == 0.7
 
 
 # ── Layer 3: Wallet ────────────────────────────────────────
@@ -134,10 +135,10 @@ class TestWalletLayer:
             "holder_count": 30,
         }
 
-        score, evidence = layer._calculate_risk(concentration)
+        result = layer._calculate_risk(concentration)
 
-        assert score >= 0.9
-        assert "CRITICAL" in evidence["reasons"][0]
+        assert result.score >= 0.9
+        assert "CRITICAL" in result.reasons[0]
 
     def test_healthy_distribution(self):
         """Well-distributed token should score low."""
@@ -150,10 +151,10 @@ class TestWalletLayer:
             "holder_count": 500,
         }
 
-        score, evidence = layer._calculate_risk(concentration)
+        result = layer._calculate_risk(concentration)
 
-        assert score <= 0.15
-        assert "Healthy" in evidence["reasons"][0]
+        assert result.score <= 0.15
+        assert "Healthy" in result.reasons[0]
 
 
 # ── Layer 4: Market ────────────────────────────────────────
@@ -175,10 +176,10 @@ class TestMarketLayer:
             "price_change_5m": 50,
         }
 
-        score, evidence = layer._calculate_risk(data)
+        result = layer._calculate_risk(data)
 
-        assert score >= 0.9
-        assert "94% pump&dump" in evidence["reasons"][0]
+        assert result.score >= 0.9
+        assert "94% pump&dump" in result.reasons[0]
 
     def test_low_liquidity(self):
         """< $5K liquidity should flag high risk."""
@@ -193,10 +194,10 @@ class TestMarketLayer:
             "price_change_5m": 10,
         }
 
-        score, evidence = layer._calculate_risk(data)
+        result = layer._calculate_risk(data)
 
-        assert score >= 0.7
-        assert "low liquidity" in evidence["reasons"][0].lower()
+        assert result.score >= 0.7
+        assert "low liquidity" in result.reasons[0].lower()
 
 
 # ── Layer 5: Contract ──────────────────────────────────────
@@ -218,11 +219,11 @@ class TestContractLayer:
             "score": 15,
         }
 
-        score, evidence = layer._parse_report(report)
+        result = layer._parse_report(report)
 
-        assert score >= 0.8
-        assert evidence["mint_authority"] is True
-        assert evidence["freeze_authority"] is True
+        assert result.score >= 0.8
+        assert result.feature("mint_authority") == 1.0
+        assert result.feature("freeze_authority") == 1.0
 
     def test_safe_token(self):
         """Clean token should score low."""
@@ -233,9 +234,9 @@ class TestContractLayer:
             "score": 90,
         }
 
-        score, evidence = layer._parse_report(report)
+        result = layer._parse_report(report)
 
-        assert score <= 0.2
+        assert result.score <= 0.2
 
 
 # ── Layer 6: Visual ────────────────────────────────────────
@@ -293,10 +294,10 @@ class TestTemporalLayer:
         }
         market_data = {"price_change_5m": 0, "price_change_1h": 0}
 
-        score, evidence = layer._calculate_risk(time_metrics, market_data)
+        result = layer._calculate_risk(time_metrics, market_data)
 
-        assert score >= 0.9
-        assert "EXTREME" in evidence["reasons"][0]
+        assert result.score >= 0.9
+        assert "EXTREME" in result.reasons[0]
 
     def test_low_risk_old_token(self):
         """Token > 1 hour old should score low."""
@@ -309,9 +310,9 @@ class TestTemporalLayer:
         }
         market_data = {"price_change_5m": 0, "price_change_1h": 0}
 
-        score, evidence = layer._calculate_risk(time_metrics, market_data)
+        result = layer._calculate_risk(time_metrics, market_data)
 
-        assert score < 0.3
+        assert result.score < 0.3
 
 
 # ── Base Layer ─────────────────────────────────────────────
@@ -335,3 +336,55 @@ class TestBaseLayer:
         assert result.confidence == 0.0
         assert result.error is not None
         assert "exploded" in result.error
+
+
+# ── Reason Codes ───────────────────────────────────────────
+
+
+class TestReasonCodes:
+    """Test lazily rendered reason codes and the slotted result type."""
+
+    def test_layer_records_codes_and_renders_on_demand(self):
+        """Reasons keep codes; text renders only when read or serialized."""
+        from rugintel.layers.reasons import ReasonCode, render_evidence
+
+        layer = WalletLayer()
+        result = layer._calculate_risk({
+            "top_holder_pct": 0.55,
+            "top_5_pct": 0.85,
+            "holder_count": 30,
+        })
+
+        reasons = result.reasons
+        assert reasons.codes[0] == ReasonCode.WALLET_TOP_HOLDER_CRITICAL
+        assert ReasonCode.WALLET_FEW_HOLDERS in reasons
+        assert reasons[0] == "CRITICAL: Top wallet holds 55% of supply (>50%)"
+
+        rendered = render_evidence(result.evidence)
+        assert rendered["reasons"][-1] == "Only 30 holders (< 50)"
+        json.dumps(rendered)  # Plain JSON once rendered
+
+    def test_layer_result_is_slotted(self):
+        """LayerResult carries no per-instance __dict__."""
+        result = LayerResult(score=0.5, confidence=0.5, details={"test": True})
+
+        assert not hasattr(result, "__dict__")
+        assert len(result.reasons) == 0
+        assert result.evidence == {"test": True}
+
+    def test_features_are_typed_and_evidence_is_built_on_demand(self):
+        """FEATURES live in a float array; evidence nests them by path."""
+        result = MarketLayer()._calculate_risk({
+            "volume_5m": 100, "volume_1h": 1200, "liquidity_usd": 2000,
+            "txns_buys_5m": 5, "txns_sells_5m": 3, "price_change_5m": 10,
+        })
+
+        assert result.features.dtype == np.float64
+        assert result.features.shape == (len(MarketLayer.FEATURES),)
+        assert result.feature("txns_5m.sells") == 3.0
+
+        evidence = result.evidence
+        assert evidence["txns_5m"] == {"buys": 5.0, "sells": 3.0}
+        assert evidence["liquidity_usd"] == 2000.0
+        assert evidence["score"] == result.score
+        assert evidence is not result.evidence       # Built per access
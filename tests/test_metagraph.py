@@ -0,0 +1,77 @@
+"""
+RugIntel Metagraph Sync Tests
+
+Tests for snapshot indexes and background sync using a fake subtensor.
+All tests run offline — no API keys or network access needed.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from rugintel.metagraph import MetagraphSnapshot, MetagraphSyncer
+
+
+def make_metagraph(n=4, serving=(0, 2), stakes=None):
+    """Build a minimal metagraph stand-in with n uids."""
+    return SimpleNamespace(
+        uids=np.arange(n),
+        hotkeys=[f"hotkey_{i}" for i in range(n)],
+        axons=[SimpleNamespace(is_serving=i in serving) for i in range(n)],
+        S=np.asarray(stakes if stakes is not None else [10.0 * i for i in range(n)]),
+    )
+
+
+class FakeSubtensor:
+    """Returns a new metagraph of growing size on every call."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def metagraph(self, netuid):
+        self.calls += 1
+        return make_metagraph(n=3 + self.calls)
+
+
+class TestMetagraphSnapshot:
+    """Test derived indexes built from a metagraph."""
+
+    def test_hotkey_index(self):
+        snapshot = MetagraphSnapshot.from_metagraph(make_metagraph())
+
+        assert snapshot.n == 4
+        assert snapshot.hotkey_to_uid["hotkey_3"] == 3
+        assert "unknown" not in snapshot.hotkey_to_uid
+
+    def test_stake_lookup(self):
+        snapshot = MetagraphSnapshot.from_metagraph(make_metagraph())
+
+        assert snapshot.stake_of("hotkey_2") == 20.0
+        assert snapshot.stake_of("unknown") is None
+
+    def test_serving_axons(self):
+        snapshot = MetagraphSnapshot.from_metagraph(make_metagraph())
+
+        assert list(snapshot.serving_uids) == [0, 2]
+        assert [uid for uid, _ in snapshot.serving_axons()] == [0, 2]
+
+    def test_empty_snapshot(self):
+        snapshot = MetagraphSnapshot()
+
+        assert snapshot.n == 0
+        assert snapshot.stake_of("hotkey_0") is None
+
+
+class TestMetagraphSyncer:
+    """Test snapshot publishing."""
+
+    def test_sync_once_swaps_snapshot(self):
+        syncer = MetagraphSyncer(FakeSubtensor(), netuid=1)
+
+        first = syncer.sync_once()
+        second = syncer.sync_once()
+
+        assert first.n == 4
+        assert second.n == 5
+        assert syncer.snapshot is second
+        assert second.sync_seconds >= 0.0
@@ -0,0 +1,68 @@
+"""
+RugIntel Protocol Tests
+
+Tests for the streaming synapse's wire format and provisional answers.
+All tests run offline — no API keys or network access needed.
+"""
+
+import pytest
+
+from rugintel.protocol import RugIntelStreamingSynapse
+
+
+class FakeContent:
+    """aiohttp StreamReader stand-in yielding pre-split chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def iter_any(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class FakeResponse:
+    def __init__(self, chunks):
+        self.content = FakeContent(chunks)
+
+
+class TestStreamingSynapse:
+    """Test stream decoding and provisional fusion."""
+
+    @pytest.mark.asyncio
+    async def test_decodes_messages_split_across_chunks(self):
+        encode = RugIntelStreamingSynapse.encode_message
+        wire = (
+            encode({"layer": "temporal", "score": 0.9, "confidence": 0.8, "weight": 0.2})
+            + encode({"layer": "visual", "score": 0.1, "confidence": 0.5, "weight": 0.03})
+            + encode({"final": True, "risk_score": 0.7, "confidence": 0.6,
+                      "time_to_rugpull": 1.5})
+        )
+        synapse = RugIntelStreamingSynapse(token_address="Tok")
+
+        messages = [
+            message async for message in synapse.process_streaming_response(
+                FakeResponse([wire[:10], wire[10:57], wire[57:]])
+            )
+        ]
+
+        assert len(messages) == 3
+        assert set(synapse.layers) == {"temporal", "visual"}
+        assert synapse.is_complete
+        assert synapse.risk_score == 0.7
+        assert synapse.time_to_rugpull == 1.5
+
+    def test_provisional_from_partial_layers(self):
+        synapse = RugIntelStreamingSynapse(token_address="Tok")
+        assert synapse.provisional() is None
+
+        synapse.apply_message({"layer": "temporal", "score": 0.9,
+                               "confidence": 0.8, "weight": 0.2})
+        synapse.apply_message({"layer": "liquidity", "score": 0.5,
+                               "confidence": 0.4, "weight": 0.2})
+
+        provisional = synapse.provisional()
+        assert not synapse.is_complete
+        assert provisional["risk_score"] == pytest.approx(0.7)
+        # Missing layers contribute no confidence
+        assert provisional["confidence"] == pytest.approx(0.24)
@@ -0,0 +1,55 @@
+"""
+RugIntel Rate Limiter Tests
+
+Tests for the per-upstream async token bucket.
+All tests run offline — no API keys or network access needed.
+"""
+
+import time
+
+import pytest
+
+from rugintel.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    """Test burst allowance and steady-state pacing."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_immediate(self):
+        limiter = RateLimiter(rate=5, burst=5)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_paces_after_burst(self):
+        limiter = RateLimiter(rate=50, burst=1)
+
+        start = time.monotonic()
+        for _ in range(6):
+            await limiter.acquire()
+        # 1 from the bucket, then 5 more at 50/s ≈ 0.1s
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_batch_pays_per_call(self):
+        limiter = RateLimiter(rate=100, burst=5)
+
+        start = time.monotonic()
+        await limiter.acquire(20)   # Over the burst — sent once the bucket is full
+        assert time.monotonic() - start < 0.05
+        await limiter.acquire()
+        # The remaining 15 calls plus this one at 100/s ≈ 0.16s
+        assert time.monotonic() - start >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_disables_limit(self):
+        limiter = RateLimiter(rate=0)
+
+        start = time.monotonic()
+        for _ in range(100):
+            await limiter.acquire()
+        assert time.monotonic() - start < 0.05
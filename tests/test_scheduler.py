@@ -0,0 +1,83 @@
+"""
+RugIntel Due Queue Tests
+
+Tests for due-time ordering and wake-ups in the verification scheduler.
+All tests run offline — no API keys or network access needed.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from rugintel.scheduler import DueQueue
+
+
+class TestDueQueue:
+    """Test due-time ordering, rescheduling and waiting."""
+
+    def test_pops_only_due_tokens_in_order(self):
+        queue = DueQueue()
+        queue.push("late", 300, payload=3)
+        queue.push("early", 100, payload=1)
+        queue.push("middle", 200, payload=2)
+
+        assert queue.next_due() == 100
+        assert queue.pop_due(now=250) == [("early", 1), ("middle", 2)]
+        assert len(queue) == 1
+        assert "late" in queue
+        assert queue.pop_due(now=250) == []
+
+    def test_pop_limit(self):
+        queue = DueQueue()
+        for i in range(5):
+            queue.push(f"t{i}", i)
+
+        assert [t for t, _ in queue.pop_due(now=10, limit=2)] == ["t0", "t1"]
+        assert len(queue) == 3
+
+    def test_reschedule_replaces_previous_entry(self):
+        queue = DueQueue()
+        queue.push("tokenA", 100, payload="old")
+        queue.push("tokenA", 500, payload="new")
+
+        assert len(queue) == 1
+        assert queue.pop_due(now=200) == []
+        assert queue.next_due() == 500
+        assert queue.pop_due(now=600) == [("tokenA", "new")]
+
+    def test_discard(self):
+        queue = DueQueue()
+        queue.push("tokenA", 100)
+        queue.discard("tokenA")
+
+        assert queue.next_due() is None
+        assert queue.pop_due(now=200) == []
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_when_due(self):
+        queue = DueQueue()
+        queue.push("tokenA", time.time() + 0.05)
+
+        await asyncio.wait_for(queue.wait_until_due(), timeout=1.0)
+        assert [t for t, _ in queue.pop_due()] == ["tokenA"]
+
+    @pytest.mark.asyncio
+    async def test_earlier_push_wakes_sleeper(self):
+        queue = DueQueue()
+        queue.push("late", time.time() + 60)
+
+        waiter = asyncio.create_task(queue.wait_until_due())
+        await asyncio.sleep(0.01)
+        queue.push("soon", time.time() + 0.05)
+
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert [t for t, _ in queue.pop_due()] == ["soon"]
+
+    @pytest.mark.asyncio
+    async def test_max_wait_caps_sleep(self):
+        queue = DueQueue()
+
+        start = time.time()
+        await asyncio.wait_for(queue.wait_until_due(max_wait=0.05), timeout=1.0)
+        assert time.time() - start < 0.5
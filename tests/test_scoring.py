@@ -0,0 +1,101 @@
+"""
+RugIntel Score History Tests
+
+Tests for the memmapped per-uid accuracy ring buffer and EMA.
+All tests run offline — no API keys or network access needed.
+"""
+
+import numpy as np
+
+from rugintel.scoring import ScoreHistory
+
+
+class TestScoreHistory:
+    """Test recording, weights, persistence and uid turnover."""
+
+    def test_ema_and_window_mean(self, tmp_path):
+        history = ScoreHistory(tmp_path / "scores.npy", n_uids=4,
+                               window=3, ema_alpha=0.5)
+        history.record([1, 2], [0.8, 0.4])
+        history.record([1], [0.4])
+
+        weights = history.weights()
+        assert weights.shape == (4,)
+        assert np.isclose(weights[1], 0.6)      # 0.8 → 0.8 + 0.5·(0.4−0.8)
+        assert np.isclose(weights[2], 0.4)
+        assert weights[0] == 0.0                 # unscored
+
+        means = history.window_means()
+        assert np.isclose(means[1], 0.6)
+        assert np.isnan(means[0])
+
+    def test_ring_buffer_is_bounded(self, tmp_path):
+        history = ScoreHistory(tmp_path / "scores.npy", n_uids=2, window=3)
+        for score in [0.1, 0.2, 0.3, 0.9, 0.9]:
+            history.record([0], [score])
+
+        assert history.counts()[0] == 3
+        assert np.isclose(history.window_means()[0], (0.3 + 0.9 + 0.9) / 3)
+
+    def test_duplicate_uids_apply_in_order(self, tmp_path):
+        history = ScoreHistory(tmp_path / "scores.npy", n_uids=2,
+                               window=5, ema_alpha=0.5)
+        history.record([0, 0, 1], [1.0, 0.0, 0.5])
+
+        assert history.counts()[0] == 2
+        assert np.isclose(history.weights()[0], 0.5)
+
+    def test_persists_across_reopen(self, tmp_path):
+        path = tmp_path / "scores.npy"
+        history = ScoreHistory(path, n_uids=4, window=3)
+        history.record([3], [0.7])
+        history.close()
+
+        reopened = ScoreHistory(path, n_uids=4, window=3)
+        assert np.isclose(reopened.weights()[3], 0.7)
+        assert reopened.counts()[3] == 1
+
+    def test_grows_for_new_uids(self, tmp_path):
+        history = ScoreHistory(tmp_path / "scores.npy", n_uids=2, window=3)
+        history.record([0], [0.9])
+        history.record([10], [0.5])
+
+        assert len(history) == 11
+        assert np.isclose(history.weights()[0], 0.9)
+        assert np.isclose(history.weights()[10], 0.5)
+
+    def test_reregistered_uid_is_reset(self, tmp_path):
+        path = tmp_path / "scores.npy"
+        history = ScoreHistory(path, n_uids=2, window=3)
+        history.sync_hotkeys(["hk0", "hk1"])
+        history.record([0, 1], [0.9, 0.8])
+        history.close()
+
+        reopened = ScoreHistory(path, n_uids=2, window=3)
+        reopened.sync_hotkeys(["hk0", "new_miner", "hk2"])
+
+        weights = reopened.weights()
+        assert len(reopened) == 3
+        assert np.isclose(weights[0], 0.9)
+        assert weights[1] == 0.0
+        assert reopened.counts()[1] == 0
+
+    def test_window_change_starts_fresh(self, tmp_path):
+        path = tmp_path / "scores.npy"
+        history = ScoreHistory(path, n_uids=2, window=3)
+        history.record([0], [0.9])
+        history.close()
+
+        resized = ScoreHistory(path, n_uids=2, window=5)
+        assert resized.weights()[0] == 0.0
+
+    def test_silent_miner_decays(self, tmp_path):
+        history = ScoreHistory(tmp_path / "scores.npy", n_uids=2, window=3,
+                               half_life=3600)
+        history.record([0, 1], [0.8, 0.8], now=1000)
+        history.record([1], [0.8], now=1000 + 7200)   # uid 0 went silent
+
+        weights = history.weights(now=1000 + 7200)
+        assert np.isclose(weights[0], 0.2)            # Two half-lives
+        assert np.isclose(weights[1], 0.8)
+        assert history.weights(now=1000 + 72000)[0] < 1e-6
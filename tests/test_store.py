@@ -0,0 +1,134 @@
+"""
+RugIntel Pending Store Tests
+
+Tests for the SQLite-backed pending verification store.
+All tests run offline — no API keys or network access needed.
+"""
+
+import json
+
+import numpy as np
+
+from rugintel.store import PendingStore
+
+
+def make_prediction(risk=0.8, launch_ts=1000):
+    return {
+        "risk_score": risk,
+        "confidence": 0.6,
+        "evidence": {"liquidity": {"score": 0.9}},
+        "time_to_rugpull": 0.5,
+        "launch_timestamp": launch_ts,
+        "queried_at": launch_ts + 60,
+    }
+
+
+class TestPendingStore:
+    """Test incremental writes and due-time lookups."""
+
+    def test_round_trip(self, tmp_path):
+        store = PendingStore(tmp_path / "pending.sqlite3")
+        store.add_token("tokenA", launch_timestamp=1000, due_at=2000)
+        store.add_prediction("tokenA", 3, make_prediction(risk=0.7))
+        store.add_prediction("tokenA", 5, make_prediction(risk=0.2))
+        store.commit()
+
+        predictions = store.predictions("tokenA")
+        assert predictions["uid"].tolist() == [3, 5]
+        assert predictions["risk"].tolist() == [0.7, 0.2]
+        assert "tokenA" in store
+        assert len(store) == 1
+        store.close()
+
+    def test_persists_across_reopen(self, tmp_path):
+        path = tmp_path / "pending.sqlite3"
+        store = PendingStore(path)
+        store.add_token("tokenA", launch_timestamp=1000, due_at=2000)
+        store.add_prediction("tokenA", 1, make_prediction())
+        store.close()
+
+        reopened = PendingStore(path)
+        assert reopened.schedule() == [("tokenA", 1000, 2000)]
+        assert reopened.predictions("tokenA")["uid"].tolist() == [1]
+        reopened.close()
+
+    def test_schedule_is_ordered_by_due_time(self, tmp_path):
+        store = PendingStore(tmp_path / "pending.sqlite3")
+        store.add_token("late", launch_timestamp=0, due_at=500)
+        store.add_token("early", launch_timestamp=0, due_at=100)
+        store.commit()
+
+        assert store.schedule() == [("early", 0, 100), ("late", 0, 500)]
+        store.close()
+
+    def test_reschedule(self, tmp_path):
+        store = PendingStore(tmp_path / "pending.sqlite3")
+        store.add_token("tokenA", launch_timestamp=0, due_at=100)
+        store.reschedule("tokenA", 900)
+        store.commit()
+
+        assert store.schedule() == [("tokenA", 0, 900)]
+        store.close()
+
+    def test_remove(self, tmp_path):
+        store = PendingStore(tmp_path / "pending.sqlite3")
+        store.add_token("tokenA", launch_timestamp=0, due_at=100)
+        store.add_prediction("tokenA", 1, make_prediction())
+        store.remove(["tokenA"])
+        store.commit()
+
+        assert "tokenA" not in store
+        assert store.predictions("tokenA").size == 0
+        assert store.evidence_count() == 0
+        store.close()
+
+    def test_import_legacy_json(self, tmp_path):
+        legacy = tmp_path / "pending_verifications.json"
+        legacy.write_text(json.dumps({
+            "tokenA": {"1": make_prediction(launch_ts=1000)},
+        }))
+
+        store = PendingStore(tmp_path / "pending.sqlite3")
+        assert store.import_json(legacy, wait_hours=24) == 1
+        assert store.schedule() == [("tokenA", 1000, 1000 + 24 * 3600)]
+        store.close()
+
+
+class TestCompactPredictions:
+    """Test fixed-width records and deduplicated evidence."""
+
+    def test_missing_answer_is_nan(self, tmp_path):
+        store = PendingStore(tmp_path / "pending.sqlite3")
+        store.add_token("tokenA", launch_timestamp=0, due_at=100)
+        store.add_prediction("tokenA", 1, {"risk_score": None, "status": "timeout",
+                                           "queried_at": 60})
+
+        record = store.predictions("tokenA")[0]
+        assert np.isnan(record["risk"])
+        assert record["evidence_hash"] == b""
+        store.close()
+
+    def test_identical_evidence_is_stored_once(self, tmp_path):
+        store = PendingStore(tmp_path / "pending.sqlite3")
+        store.add_token("tokenA", launch_timestamp=0, due_at=100)
+        for uid in range(50):
+            store.add_prediction("tokenA", uid, make_prediction())
+        store.add_prediction("tokenA", 99, {
+            **make_prediction(), "evidence": {"liquidity": {"score": 0.1}},
+        })
+        store.commit()
+
+        assert store.evidence_count() == 2
+        assert len(set(store.predictions("tokenA")["evidence_hash"])) == 2
+        store.close()
+
+    def test_evidence_loads_lazily(self, tmp_path):
+        store = PendingStore(tmp_path / "pending.sqlite3")
+        store.add_token("tokenA", launch_timestamp=0, due_at=100)
+        store.add_prediction("tokenA", 3, make_prediction())
+
+        record = store.predictions("tokenA")[0]
+        assert store.evidence(record["evidence_hash"]) == {"liquidity": {"score": 0.9}}
+        assert store.prediction_evidence("tokenA", 3) == {"liquidity": {"score": 0.9}}
+        assert store.prediction_evidence("tokenA", 4) is None
+        store.close()
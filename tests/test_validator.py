@@ -0,0 +1,298 @@
+"""
+RugIntel Validator Pipeline Tests
+
+Tests for the validator's stage queues and query path, with the network
+(subtensor, dendrite, discovery upstreams) replaced by in-memory fakes.
+All tests run offline — no API keys or network access needed.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from rugintel.latency import MinerLatencyTracker
+from rugintel.protocol import RugIntelBatchSynapse, RugIntelSynapse
+from rugintel.scheduler import DueQueue
+from rugintel.scoring import ScoreHistory
+from rugintel.store import PendingStore
+from rugintel.verification import GroundTruthVerifier
+from tests.test_verification import FakeSession, make_verifier
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "neurons"))
+
+from validator import RugIntelValidator  # noqa: E402
+
+
+class FakeSource:
+    """Discovery source yielding a fixed list of tokens."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.emitted = 0
+
+    async def stream(self):
+        for i in range(self.count):
+            self.emitted += 1
+            yield {"address": f"Tok{i}", "symbol": f"T{i}", "timestamp": 1000}
+
+    async def close(self):
+        pass
+
+
+def make_validator(**config) -> RugIntelValidator:
+    """A validator with only the attributes the tested stages touch."""
+    validator = RugIntelValidator.__new__(RugIntelValidator)
+    validator.config = SimpleNamespace(**config)
+    validator.pending = set()
+    validator.queued_tokens = set()
+    return validator
+
+
+# ── Pipeline Stages ───────────────────────────────────────
+
+
+class TestStageQueues:
+    """Test that bounded stage queues push back on upstream stages."""
+
+    @pytest.mark.asyncio
+    async def test_discovery_blocks_when_token_queue_full(self):
+        validator = make_validator()
+        source = FakeSource(50)
+        validator.discovery_sources = [source]
+        validator.token_queue = asyncio.Queue(maxsize=2)
+
+        task = asyncio.create_task(validator.discover())
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert validator.token_queue.full()
+        stalled_at = source.emitted
+        assert stalled_at < 10                  # Queue + a token in hand
+
+        for _ in range(20):
+            await asyncio.sleep(0)
+        assert source.emitted == stalled_at     # Still waiting on put()
+
+        validator.token_queue.get_nowait()
+        for _ in range(20):
+            await asyncio.sleep(0)
+        assert source.emitted == stalled_at + 1
+        assert validator.token_queue.full()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+# ── Dendrite Concurrency ──────────────────────────────────
+
+
+class FakeDendrite:
+    """Dendrite that holds every call until released, tracking overlap."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.timeouts = []
+        self.release = asyncio.Event()
+
+    async def call(self, target_axon, synapse, timeout):
+        self.calls += 1
+        self.timeouts.append(timeout)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.release.wait()
+        finally:
+            self.in_flight -= 1
+        if isinstance(synapse, RugIntelSynapse):
+            synapse.risk_score = 0.5
+        return synapse
+
+
+class TestDendriteSlots:
+    """Test the global cap on outstanding dendrite requests."""
+
+    @pytest.mark.asyncio
+    async def test_semaphore_caps_outstanding_requests(self):
+        validator = make_validator()
+        validator.dendrite = FakeDendrite()
+        validator.dendrite_slots = asyncio.Semaphore(3)
+        validator.latency = MinerLatencyTracker()
+        synapse = RugIntelSynapse(token_address="Tok", launch_timestamp=1000)
+
+        queries = [
+            asyncio.create_task(validator._query_axon(uid, None, synapse))
+            for uid in range(10)
+        ]
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert validator.dendrite.calls == 3
+        assert validator.dendrite.in_flight == 3
+
+        validator.dendrite.release.set()
+        results = await asyncio.gather(*queries)
+
+        assert validator.dendrite.calls == 10
+        assert validator.dendrite.max_in_flight == 3
+        assert sorted(uid for uid, _, _ in results) == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_batch_timeout_scales_with_size(self):
+        validator = make_validator()
+        validator.dendrite = FakeDendrite()
+        validator.dendrite.release.set()
+        validator.dendrite_slots = asyncio.Semaphore(3)
+        validator.latency = MinerLatencyTracker(min_timeout=2.0, max_timeout=30.0)
+        batch = RugIntelBatchSynapse(
+            token_addresses=[f"Tok{i}" for i in range(9)],
+            launch_timestamps=[1000] * 9,
+        )
+
+        await validator._query_axon(0, None, batch)
+        await validator._query_axon(0, None, RugIntelSynapse(
+            token_address="Tok", launch_timestamp=1000,
+        ))
+
+        # Nine tokens at four analyses a time: three rounds
+        assert validator.dendrite.timeouts == [90.0, 30.0]
+
+
+# ── Verification ──────────────────────────────────────────
+
+
+class TestVerifyPending:
+    """Test scoring of finalized tokens."""
+
+    @pytest.mark.asyncio
+    async def test_failed_query_scores_zero(self, tmp_path, monkeypatch):
+        validator = make_validator()
+        validator.pending = PendingStore(tmp_path / "pending.sqlite3")
+        validator.due_queue = DueQueue()
+        validator.score_queue = asyncio.Queue()
+        validator.verifier = GroundTruthVerifier()
+
+        validator.pending.add_token("Tok", 1000, 1000)
+        validator.pending.add_prediction("Tok", 1, {"risk_score": 0.9, "status": "ok"})
+        validator.pending.add_prediction("Tok", 2, {"risk_score": None, "status": "timeout"})
+        validator.due_queue.push("Tok", 1000, 1000)
+
+        async def verify_many(due):
+            return {"Tok": {"final": True, "is_rugpull": True,
+                            "liquidity_drained": False,
+                            "funds_moved_to_exchange": False}}
+        monkeypatch.setattr(validator.verifier, "verify_many", verify_many)
+
+        await validator.verify_pending()
+
+        uids, accuracies = validator.score_queue.get_nowait()
+        scores = dict(zip(uids.tolist(), accuracies.tolist()))
+        assert scores == {1: pytest.approx(0.9), 2: 0.0}
+        assert "Tok" not in validator.pending
+
+    @pytest.mark.asyncio
+    async def test_unlisted_young_token_is_rescheduled(self, tmp_path):
+        validator = make_validator()
+        validator.pending = PendingStore(tmp_path / "pending.sqlite3")
+        validator.due_queue = DueQueue()
+        validator.score_queue = asyncio.Queue()
+        validator.verifier = make_verifier(FakeSession(unlisted={"Tok"}))
+        validator.verifier.checkpoints = [1.0, 6.0, 24.0]
+
+        launched = int(time.time()) - 3600
+        validator.pending.add_token("Tok", launched, launched + 3600)
+        validator.pending.add_prediction("Tok", 1, {"risk_score": 0.9, "status": "ok"})
+        validator.due_queue.push("Tok", launched + 3600, launched)
+
+        await validator.verify_pending()
+
+        assert "Tok" in validator.pending
+        assert "Tok" in validator.due_queue
+        assert validator.score_queue.empty()
+
+
+    @pytest.mark.asyncio
+    async def test_failed_checks_are_retried(self, tmp_path, monkeypatch):
+        validator = make_validator()
+        validator.pending = PendingStore(tmp_path / "pending.sqlite3")
+        validator.due_queue = DueQueue()
+        validator.score_queue = asyncio.Queue()
+        validator.verifier = GroundTruthVerifier()
+
+        for token in ("Good", "Bad"):
+            validator.pending.add_token(token, 1000, 1000)
+            validator.pending.add_prediction(token, 1, {"risk_score": 0.9, "status": "ok"})
+            validator.due_queue.push(token, 1000, 1000)
+
+        async def broken(due):
+            raise RuntimeError("upstream down")
+        monkeypatch.setattr(validator.verifier, "verify_many", broken)
+        await validator.verify_pending()
+
+        assert "Good" in validator.due_queue and "Bad" in validator.due_queue
+
+        async def partial(due):
+            return {"Good": {"final": True, "is_rugpull": True,
+                             "liquidity_drained": False,
+                             "funds_moved_to_exchange": False},
+                    "Bad": {"final": True}}  # Malformed outcome
+        monkeypatch.setattr(validator.verifier, "verify_many", partial)
+        validator.due_queue.push("Good", 1000, 1000)
+        validator.due_queue.push("Bad", 1000, 1000)
+        await validator.verify_pending()
+
+        assert "Good" not in validator.pending
+        assert "Bad" in validator.pending and "Bad" in validator.due_queue
+        assert validator.score_queue.qsize() == 1
+
+# ── Weights ───────────────────────────────────────────────
+
+
+class FakeSubtensor:
+    """Records the weights passed to set_weights."""
+
+    def __init__(self):
+        self.calls = []
+
+    def set_weights(self, netuid, wallet, uids, weights):
+        self.calls.append(dict(zip(uids, weights)))
+
+
+class TestSetWeights:
+    """Test the weight stage."""
+
+    @pytest.mark.asyncio
+    async def test_weights_decay_without_new_scores(self, tmp_path, monkeypatch):
+        hour = 3600.0
+        clock = SimpleNamespace(now=1_000_000.0)
+        monkeypatch.setattr("rugintel.scoring.time",
+                            SimpleNamespace(time=lambda: clock.now))
+
+        validator = make_validator(netuid=1)
+        validator.sampler = None
+        validator.wallet = None
+        validator.subtensor = FakeSubtensor()
+        validator.syncer = SimpleNamespace(
+            snapshot=SimpleNamespace(hotkeys=["hk0", "hk1"])
+        )
+        validator.scores = ScoreHistory(tmp_path / "scores.npy", n_uids=2,
+                                        half_life=hour)
+        validator.score_queue = asyncio.Queue()
+        monkeypatch.setattr(validator, "_save_latency", lambda: None)
+
+        validator.score_queue.put_nowait((np.array([0, 1]), np.array([0.8, 0.8])))
+        await validator.set_weights()
+
+        clock.now += hour
+        await validator.set_weights()
+
+        first, second = validator.subtensor.calls
+        assert second[1] == pytest.approx(first[1] / 2)
@@ -0,0 +1,340 @@
+"""
+RugIntel Ground Truth Verifier Tests
+
+Tests for rugpull determination, parallel checks and bulk fetching.
+Upstream APIs are served by an in-memory fake session — no network access.
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from rugintel.verification import GroundTruthVerifier
+
+
+class FakeResponse:
+    def __init__(self, status, data):
+        self.status = status
+        self._data = data
+
+    async def json(self):
+        return self._data
+
+
+class FakeSession:
+    """
+    Stand-in for aiohttp.ClientSession serving canned upstream data.
+
+    `rugged` tokens have an emptied LP and no DexScreener pairs; `unlisted`
+    tokens have no pairs but a healthy LP; tokens in
+    `unknown_to_rpc` get a JSON-RPC error; tokens in `cut_from_batch` are
+    left out of multi-token DexScreener answers (but found on their own);
+    every other token is healthy.
+    """
+
+    closed = False
+
+    def __init__(self, rugged=(), unknown_to_rpc=(), cut_from_batch=(),
+                 unlisted=(), delay=0.0):
+        self.rugged = set(rugged)
+        self.unlisted = set(unlisted)
+        self.unknown_to_rpc = set(unknown_to_rpc)
+        self.cut_from_batch = set(cut_from_batch)
+        self.delay = delay
+        self.gets = []
+        self.posts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _serve(self, status, data):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return FakeResponse(status, data)
+
+    def _rpc_result(self, call):
+        address = call["params"][0]
+        if address in self.unknown_to_rpc:
+            return {"jsonrpc": "2.0", "id": call["id"],
+                    "error": {"code": -32602, "message": "Invalid param"}}
+        amount = "0" if address in self.rugged else "1000"
+        return {"jsonrpc": "2.0", "id": call["id"],
+                "result": {"value": [{"amount": amount}]}}
+
+    def _dex_pair(self, address):
+        return {
+            "baseToken": {"address": address},
+            "priceChange": {"h24": -5},
+            "volume": {"h24": 5000},
+            "priceUsd": "0.01",
+        }
+
+    def post(self, url, json=None, headers=None):
+        self.posts.append(json)
+        if isinstance(json, list):
+            # Answer batches in reverse order to exercise id matching
+            data = [self._rpc_result(call) for call in reversed(json)]
+        else:
+            data = self._rpc_result(json)
+        return _Awaitable(self._serve(200, data))
+
+    def get(self, url):
+        self.gets.append(url)
+        if "/report" in url:
+            return _Awaitable(self._serve(200, {"risks": [], "score": 10}))
+
+        addresses = url.rsplit("/tokens/", 1)[1].split(",")
+        omitted = self.rugged | self.unlisted | (self.cut_from_batch if len(addresses) > 1 else set())
+        pairs = [self._dex_pair(a) for a in addresses if a not in omitted]
+        return _Awaitable(self._serve(200, {"pairs": pairs}))
+
+    async def close(self):
+        self.closed = True
+
+
+class _Awaitable:
+    """Async context manager wrapping a coroutine that yields a response."""
+
+    def __init__(self, coro):
+        self._coro = coro
+
+    async def __aenter__(self):
+        return await self._coro
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def make_verifier(session):
+    verifier = GroundTruthVerifier()
+    for limiter in verifier.rate_limits.values():
+        limiter.rate = 0  # Disable pacing in tests
+    verifier._session = session
+    return verifier
+
+
+LAUNCHED = int(time.time()) - 25 * 3600
+
+
+class TestDetermineRugpull:
+    """Test cross-source rugpull confirmation."""
+
+    def test_price_collapse(self):
+        verifier = GroundTruthVerifier()
+        assert verifier._determine_rugpull({}, {}, {"price_change_24h": -95})
+
+    def test_lp_removed(self):
+        verifier = GroundTruthVerifier()
+        assert verifier._determine_rugpull({"lp_removed": True}, {}, {})
+
+    def test_clean(self):
+        verifier = GroundTruthVerifier()
+        assert not verifier._determine_rugpull(
+            {"lp_removed": False}, {"status": "clean"}, {"price_change_24h": -20}
+        )
+
+
+class TestSingleTokenCheck:
+    """Test check_24h_outcome against the three sources."""
+
+    @pytest.mark.asyncio
+    async def test_sources_queried_concurrently(self):
+        session = FakeSession(rugged={"rug"}, delay=0.1)
+        verifier = make_verifier(session)
+
+        start = time.monotonic()
+        result = await verifier.check_24h_outcome("rug", LAUNCHED)
+
+        assert time.monotonic() - start < 0.25
+        assert session.max_in_flight == 3
+        assert result["is_rugpull"] is True
+        assert result["liquidity_drained"] is True
+        assert result["price_drop_percent"] == -100
+
+    @pytest.mark.asyncio
+    async def test_not_due_returns_none(self):
+        verifier = make_verifier(FakeSession())
+
+        assert await verifier.check_24h_outcome("safe", int(time.time())) is None
+
+    @pytest.mark.asyncio
+    async def test_rpc_error_is_not_an_lp_drain(self):
+        verifier = make_verifier(FakeSession(unknown_to_rpc={"odd"}))
+
+        result = await verifier.check_24h_outcome("odd", LAUNCHED)
+
+        assert result["liquidity_drained"] is False
+        assert "error" in result["verification_sources"]["solana_rpc"]
+
+
+class TestBulkVerification:
+    """Test batched DexScreener / JSON-RPC fetching and fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_requests_are_batched(self):
+        session = FakeSession()
+        verifier = make_verifier(session)
+        tokens = [(f"token{i}", LAUNCHED) for i in range(45)]
+
+        results = await verifier.verify_many(tokens)
+
+        assert len(results) == 45
+        dex_gets = [url for url in session.gets if "/report" not in url]
+        assert len(dex_gets) == 2                     # 30 + 15 addresses
+        assert len(session.posts) == 1                # one JSON-RPC batch
+        assert len(session.posts[0]) == 45
+
+    @pytest.mark.asyncio
+    async def test_results_fan_out_per_token(self):
+        session = FakeSession(rugged={"rug"}, unknown_to_rpc={"odd"})
+        verifier = make_verifier(session)
+        tokens = [("safe", LAUNCHED), ("rug", LAUNCHED), ("odd", LAUNCHED)]
+
+        results = await verifier.verify_many(tokens)
+
+        assert results["safe"]["is_rugpull"] is False
+        assert results["safe"]["price_drop_percent"] == -5
+        assert results["rug"]["is_rugpull"] is True
+        assert results["rug"]["volume_collapsed"] is True
+        assert results["odd"]["liquidity_drained"] is False
+        assert "error" in results["odd"]["verification_sources"]["solana_rpc"]
+
+    @pytest.mark.asyncio
+    async def test_tokens_not_yet_due_are_skipped(self):
+        session = FakeSession()
+        verifier = make_verifier(session)
+
+        results = await verifier.verify_many([("fresh", int(time.time()))])
+
+        assert results == {"fresh": None}
+        assert session.gets == [] and session.posts == []
+
+    @pytest.mark.asyncio
+    async def test_partial_dexscreener_response_is_rechecked(self):
+        session = FakeSession(rugged={"rug"}, cut_from_batch={"cut"})
+        verifier = make_verifier(session)
+        tokens = [("safe", LAUNCHED), ("cut", LAUNCHED), ("rug", LAUNCHED)]
+
+        results = await verifier.verify_many(tokens)
+
+        assert results["cut"]["is_rugpull"] is False
+        assert results["cut"]["price_drop_percent"] == -5
+        assert results["rug"]["is_rugpull"] is True
+        assert results["safe"]["is_rugpull"] is False
+        dex_gets = [url for url in session.gets if "/report" not in url]
+        assert sorted(url.rsplit("/", 1)[1] for url in dex_gets[1:]) == ["cut", "rug"]
+
+    @pytest.mark.asyncio
+    async def test_missing_batch_entry_is_an_error(self):
+        verifier = GroundTruthVerifier()
+
+        check = verifier._parse_largest_accounts(None)
+
+        assert check["lp_removed"] is False
+        assert "error" in check
+
+
+class TestCheckpoints:
+    """Test checkpoint scheduling and early (non-final) results."""
+
+    def test_checkpoints_end_at_full_window(self, monkeypatch):
+        monkeypatch.setenv("VERIFICATION_CHECKPOINTS_HOURS", "6,1,48")
+        verifier = GroundTruthVerifier()
+
+        assert verifier.checkpoints == [1.0, 6.0, 24.0]
+
+    def test_next_checkpoint(self):
+        verifier = GroundTruthVerifier()
+        verifier.checkpoints = [1.0, 6.0, 24.0]
+
+        assert verifier.next_checkpoint(0, after=0) == 3600
+        assert verifier.next_checkpoint(0, after=3600) == 6 * 3600
+        assert verifier.next_checkpoint(0, after=30 * 3600) == 24 * 3600
+
+    @pytest.mark.asyncio
+    async def test_early_results_are_not_final(self):
+        verifier = make_verifier(FakeSession(rugged={"rug"}))
+        verifier.checkpoints = [1.0, 6.0, 24.0]
+        launched = int(time.time()) - 2 * 3600
+
+        results = await verifier.verify_many(
+            [("rug", launched), ("safe", launched)]
+        )
+
+        assert results["rug"]["is_rugpull"] is True
+        assert results["rug"]["final"] is False
+        assert results["safe"]["is_rugpull"] is False
+        assert results["safe"]["final"] is False
+
+    @pytest.mark.asyncio
+    async def test_unlisted_young_token_is_not_a_rug(self):
+        verifier = make_verifier(FakeSession(unlisted={"new"}))
+        verifier.checkpoints = [1.0, 6.0, 24.0]
+
+        early = await verifier.verify_many([("new", int(time.time()) - 3600)])
+        late = await verifier.verify_many([("new", LAUNCHED)])
+
+        assert early["new"]["is_rugpull"] is False
+        assert early["new"]["final"] is False
+        assert early["new"]["price_drop_percent"] == 0
+        assert late["new"]["is_rugpull"] is True
+
+    @pytest.mark.asyncio
+    async def test_full_window_results_are_final(self):
+        verifier = make_verifier(FakeSession())
+
+        results = await verifier.verify_many([("safe", LAUNCHED)])
+
+        assert results["safe"]["final"] is True
+
+
+class TestAccuracyBatch:
+    """Test the vectorized scorer against the per-miner rules."""
+
+    CASES = [
+        (True, False, False),
+        (True, True, False),
+        (True, True, True),
+        (False, True, True),
+        (False, False, False),
+    ]
+
+    def test_matches_scalar_scoring(self):
+        verifier = GroundTruthVerifier()
+        risks = np.linspace(0.0, 1.0, 41)
+
+        for rug, drained, moved in self.CASES:
+            batch = verifier.calculate_accuracy_batch(
+                risks, actual_rugpull=rug,
+                liquidity_drained=drained, funds_moved=moved,
+            )
+            expected = [
+                verifier.calculate_accuracy(
+                    float(r), actual_rugpull=rug,
+                    liquidity_drained=drained, funds_moved=moved,
+                )
+                for r in risks
+            ]
+            assert np.allclose(batch, expected)
+
+    def test_bonuses_are_capped(self):
+        verifier = GroundTruthVerifier()
+
+        batch = verifier.calculate_accuracy_batch(
+            [0.95, 0.85, 0.5], actual_rugpull=True,
+            liquidity_drained=True, funds_moved=True,
+        )
+
+        assert batch.tolist() == [1.0, 0.9, 0.5]
+
+    def test_summary_histogram(self):
+        summary = GroundTruthVerifier.accuracy_summary(
+            np.array([0.05, 0.1, 0.5, 0.95])
+        )
+
+        assert summary["miners"] == 4
+        assert summary["histogram"] == [2, 0, 1, 0, 1]
+        assert GroundTruthVerifier.accuracy_summary(np.array([])) == {"miners": 0}